@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+'''Throughput benchmarks for texttables.
+
+Run the whole suite from the repository root::
+
+    PYTHONPATH=. python3 -m benchmarks
+
+See :mod:`benchmarks.run` for the options.
+'''
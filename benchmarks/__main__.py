@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+
+import sys
+
+from benchmarks.run import main
+
+sys.exit(main())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+'''Measure :class:`texttables.fixed.reader` throughput as tables get wider.
+If parsing is linear in the line width, the time per cell stays flat as the
+column count grows.
+
+Run from the repository root::
+
+    PYTHONPATH=. python3 benchmarks/bench_fixed_reader.py
+'''
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+
+import timeit
+from six import StringIO
+
+from texttables import Dialect
+from texttables.fixed import reader, writer
+
+class grid(Dialect):
+    header_delimiter = '='
+    row_delimiter = '-'
+    top_border = '#'
+    bottom_border = '_'
+    left_border = '|'
+    cell_delimiter = '|'
+    right_border = '|'
+    corner_border = '+'
+
+def table(rows, columns, dialect):
+    output = StringIO()
+    widths = [8] * columns
+    with writer(output, widths, dialect=dialect) as w:
+        w.writeheader(['col {}'.format(i) for i in range(columns)])
+        for i in range(rows):
+            w.writerow(['{}.{}'.format(i, j) for j in range(columns)])
+    return widths, output.getvalue().splitlines()
+
+def run(lines, widths, dialect):
+    for row in reader(lines, widths, dialect=dialect):
+        pass
+
+def main():
+    cells = 400000
+    for columns in (10, 50, 100, 200):
+        rows = cells // columns
+        widths, lines = table(rows, columns, grid)
+        elapsed = min(timeit.repeat(lambda: run(lines, widths, grid), number=1, repeat=3))
+        print('{:4} columns {:10.0f} rows/s {:8.1f} ns/cell'.format(
+            columns, rows / elapsed, elapsed / (rows * columns) * 1e9))
+
+if __name__ == '__main__':
+    main()
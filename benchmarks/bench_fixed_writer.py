@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+'''Measure :class:`texttables.fixed.writer` throughput in rows per second.
+
+Run from the repository root::
+
+    PYTHONPATH=. python3 benchmarks/bench_fixed_writer.py
+'''
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+
+import timeit
+from six import StringIO
+
+from texttables import Dialect
+from texttables.fixed import writer
+
+class grid(Dialect):
+    header_delimiter = '='
+    row_delimiter = '-'
+    top_border = '#'
+    bottom_border = '_'
+    left_border = '|'
+    cell_delimiter = '|'
+    right_border = '|'
+    corner_border = '+'
+
+def run(rows, widths, dialect=None):
+    output = StringIO()
+    with writer(output, widths, dialect=dialect) as w:
+        w.writeheader(['header {}'.format(i) for i in range(len(widths))])
+        for row in rows:
+            w.writerow(row)
+
+def runrows(rows, widths, dialect=None):
+    output = StringIO()
+    with writer(output, widths, dialect=dialect) as w:
+        w.writeheader(['header {}'.format(i) for i in range(len(widths))])
+        w.writerows(rows)
+
+def main():
+    count = 100000
+    for name, widths, dialect in (
+            ('plain', [10, '>10', '^10', 12, 8], None),
+            ('grid', [10, '>10', '^10', 12, 8], grid),
+            ):
+        rows = [('data {}'.format(i), i, 'x', 1.5, '') for i in range(count)]
+        for method, function in (('writerow', run), ('writerows', runrows)):
+            elapsed = min(timeit.repeat(lambda: function(rows, widths, dialect), number=1, repeat=3))
+            print('{:8} {:10} {:12.0f} rows/s'.format(name, method, count / elapsed))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+'''Run every operation of :mod:`benchmarks.suite` over every table of
+:mod:`benchmarks.tables`, reporting rows per second, megabytes of table text
+per second, and the peak memory allocated by a single run, and optionally
+compare the results against a baseline to flag regressions.
+
+Run from the repository root::
+
+    PYTHONPATH=. python3 -m benchmarks
+
+Only run the operations and tables whose names contain some text, such as
+``fixed.reader`` or ``/unicode``::
+
+    PYTHONPATH=. python3 -m benchmarks --match fixed.reader --match /unicode
+
+Timings are only comparable on the machine they were taken on, so no
+baseline is kept in the repository.  Record one locally before a change, and
+compare against it after::
+
+    PYTHONPATH=. python3 -m benchmarks --save baseline.json
+    PYTHONPATH=. python3 -m benchmarks --baseline baseline.json
+
+Any operation that is slower than the baseline by more than the threshold,
+or allocates more memory by more than the memory threshold, is flagged, and
+the runner exits with status 1.  Each timing is the median of several
+samples, each of which runs the operation for at least :data:`MINTIME`
+seconds, but timings on a busy or shared machine may still vary by more than
+the threshold, so check a flagged regression by running it again.
+'''
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+
+import argparse
+import io
+import json
+import platform
+import sys
+import timeit
+from six import text_type
+
+try:
+    import tracemalloc
+except ImportError:
+    # Python 2 can't measure peak memory
+    tracemalloc = None
+
+from benchmarks.suite import OPERATIONS
+from benchmarks.tables import DIALECTS, SHAPES, generate
+
+#: The least time a single timed sample runs an operation for, in seconds
+MINTIME = 0.2
+
+#: Peak memory growth ignored regardless of the threshold, in bytes
+MEMORYSLACK = 64 * 1024
+
+def measure(run, count, repeat):
+    '''Measure a single operation.  Returns a dictionary of the results.
+
+    :param run: The callable to measure, returning the text it read or wrote
+    :param count: The number of rows of the table
+    :param repeat: The number of timed samples, the median of which is kept
+    '''
+    timer = timeit.default_timer
+    start = timer()
+    size = len(run().encode('utf-8'))
+    # Short operations are run several times per sample, so that each sample
+    # is long enough not to be swamped by the resolution of the timer
+    number = max(1, int(MINTIME / max(timer() - start, 1e-9)))
+    samples = sorted(timeit.repeat(run, number=number, repeat=repeat))
+    middle = len(samples) // 2
+    if len(samples) % 2:
+        elapsed = samples[middle] / number
+    else:
+        elapsed = (samples[middle - 1] + samples[middle]) / 2 / number
+
+    peak = None
+    if tracemalloc is not None:
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'rows_per_s': count / elapsed,
+        'mb_per_s': size / elapsed / 1e6,
+        'peak_bytes': peak,
+        }
+
+def compare(result, baseline, threshold, memorythreshold):
+    '''Compare a result against its baseline.  Returns a ``(change,
+    regressions)`` pair, the relative change in rows per second and a list of
+    what regressed.'''
+    change = result['rows_per_s'] / baseline['rows_per_s'] - 1
+    regressions = list()
+    if change < -threshold:
+        regressions.append('speed')
+    peak = result['peak_bytes']
+    basepeak = baseline.get('peak_bytes')
+    if peak is not None and basepeak is not None:
+        if peak > basepeak * (1 + memorythreshold) and peak - basepeak > MEMORYSLACK:
+            regressions.append('memory')
+    return change, regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='benchmarks', description='Benchmark texttables readers and writers.')
+    parser.add_argument('--scale', type=float, default=1.0,
+        help='A factor for the number of rows of every table (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=7,
+        help='The number of timed samples of each operation, the median of which is kept (default: %(default)s)')
+    parser.add_argument('--match', action='append', default=[],
+        help='Only run operations and tables whose names contain this.  May be given more than once, to only run those that contain all of them')
+    parser.add_argument('--baseline', metavar='FILE',
+        help='A baseline saved with --save to compare against.  Nothing is compared without one')
+    parser.add_argument('--save', metavar='FILE',
+        help='Save the results to this file as a new baseline')
+    parser.add_argument('--threshold', type=float, default=0.5,
+        help='The relative slowdown flagged as a regression, which should be above the run to run noise of the machine (default: %(default)s)')
+    parser.add_argument('--memory-threshold', type=float, default=0.2,
+        help='The relative growth in peak memory flagged as a regression, which varies far less than timings (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    baseline = dict()
+    if args.baseline:
+        with io.open(args.baseline, encoding='utf-8') as file:
+            stored = json.load(file)
+        if stored['scale'] != args.scale:
+            parser.error('The baseline was recorded with --scale {}'.format(stored['scale']))
+        baseline = stored['results']
+
+    results = dict()
+    regressed = list()
+    print('{:36} {:>12} {:>9} {:>11} {:>8}'.format('benchmark', 'rows/s', 'MB/s', 'peak KiB', 'change'))
+    for shape, _, _, _ in SHAPES:
+        for dialectname, _ in DIALECTS:
+            operations = [('{}/{}/{}'.format(operation, shape, dialectname), prepare)
+                for operation, prepare in OPERATIONS]
+            operations = [(name, prepare) for name, prepare in operations
+                if all(match in name for match in args.match)]
+            # Tables that nothing is run over aren't generated at all
+            if not operations:
+                continue
+            table = generate(shape, dialectname, args.scale)
+
+            for name, prepare in operations:
+                result = measure(prepare(table), len(table.rows), args.repeat)
+                results[name] = result
+
+                peak = '-' if result['peak_bytes'] is None else '{:.0f}'.format(result['peak_bytes'] / 1024)
+                change = ''
+                if name in baseline:
+                    relative, regressions = compare(result, baseline[name], args.threshold, args.memory_threshold)
+                    change = '{:+.1%}'.format(relative)
+                    if regressions:
+                        regressed.append((name, regressions))
+                        change += ' ' + ','.join(regressions)
+                print('{:36} {:12.0f} {:9.2f} {:>11} {:>8}'.format(name, result['rows_per_s'], result['mb_per_s'], peak, change))
+                sys.stdout.flush()
+
+    if args.save:
+        with io.open(args.save, 'w', encoding='utf-8') as file:
+            file.write(text_type(json.dumps({
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'scale': args.scale,
+                'results': results,
+                }, indent=2, sort_keys=True)) + '\n')
+
+    if regressed:
+        print()
+        print('{} regressions:'.format(len(regressed)))
+        for name, regressions in regressed:
+            print('    {} ({})'.format(name, ', '.join(regressions)))
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
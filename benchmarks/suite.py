@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+'''The benchmarked operations.  Each takes a :class:`benchmarks.tables.Table`
+and returns a callable that runs the operation once over the whole table,
+returning the text it read or wrote, which the runner measures.  Anything
+that isn't part of the operation, such as building dictionary rows, is done
+before the callable is returned.'''
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+
+from six import StringIO
+
+from texttables import fixed, dynamic
+
+def fixedreader(table):
+    def run():
+        for row in fixed.reader(table.lines, table.widths, table.dialect):
+            pass
+        return table.text
+    return run
+
+def fixeddictreader(table):
+    def run():
+        for row in fixed.DictReader(table.lines, table.widths, table.dialect):
+            pass
+        return table.text
+    return run
+
+def fixedwriter(table):
+    def run():
+        output = StringIO()
+        with fixed.writer(output, table.widths, table.dialect) as w:
+            w.writeheader(table.fieldnames)
+            w.writerows(table.rows)
+        return output.getvalue()
+    return run
+
+def fixeddictwriter(table):
+    rows = table.dictrows
+    def run():
+        output = StringIO()
+        with fixed.DictWriter(output, table.fieldnames, table.widths, table.dialect) as w:
+            w.writeheader()
+            w.writerows(rows)
+        return output.getvalue()
+    return run
+
+def dynamicwriter(table):
+    def run():
+        output = StringIO()
+        with dynamic.writer(output, dialect=table.dialect) as w:
+            w.writeheader(table.fieldnames)
+            w.writerows(table.rows)
+        return output.getvalue()
+    return run
+
+def dynamicdictwriter(table):
+    rows = table.dictrows
+    def run():
+        output = StringIO()
+        with dynamic.DictWriter(output, table.fieldnames, dialect=table.dialect) as w:
+            w.writeheader()
+            w.writerows(rows)
+        return output.getvalue()
+    return run
+
+#: Every benchmarked operation, by name
+OPERATIONS = (
+    ('fixed.reader', fixedreader),
+    ('fixed.DictReader', fixeddictreader),
+    ('fixed.writer', fixedwriter),
+    ('fixed.DictWriter', fixeddictwriter),
+    ('dynamic.writer', dynamicwriter),
+    ('dynamic.DictWriter', dynamicdictwriter),
+    )
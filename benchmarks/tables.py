@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+'''Synthetic tables for the benchmarks.  Every table is generated from a fixed
+seed, so the same shape and dialect always give the same table.'''
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+
+import random
+from collections import namedtuple
+from six import StringIO
+
+from texttables import Dialect
+from texttables.fixed import writer
+
+class plain(Dialect):
+    pass
+
+class grid(Dialect):
+    header_delimiter = '='
+    row_delimiter = '-'
+    top_border = '#'
+    bottom_border = '_'
+    left_border = '|'
+    cell_delimiter = '|'
+    right_border = '|'
+    corner_border = '+'
+
+class delimited(Dialect):
+    header_delimiter = '='
+    row_delimiter = '-'
+
+class box(Dialect):
+    header_delimiter = '═'
+    row_delimiter = '─'
+    top_border = '━'
+    bottom_border = '━'
+    left_border = '│'
+    cell_delimiter = '│'
+    right_border = '│'
+    corner_border = '┼'
+
+#: The dialects to generate tables in, by name
+DIALECTS = (
+    ('plain', plain),
+    ('grid', grid),
+    ('rows', delimited),
+    ('unicode', box),
+    )
+
+#: The shapes of the generated tables, as ``(name, rows, columns, width)``
+SHAPES = (
+    ('short', 1000, 5, 8),
+    ('long', 50000, 5, 8),
+    ('wide', 5000, 50, 8),
+    ('cells', 10000, 5, 40),
+    )
+
+_ASCII = 'abcdefghijklmnopqrstuvwxyz0123456789'
+_UNICODE = 'äöüßéèñøåçłžαβγδεжзийклあいうえお'
+
+class Table(namedtuple('Table', ('name', 'shape', 'dialectname', 'dialect', 'widths', 'fieldnames', 'rows', 'text', 'lines'))):
+    '''A generated table.  :attr:`rows` holds the rows as tuples of strings,
+    :attr:`text` the whole table written out by :class:`texttables.fixed.writer`
+    with its header, and :attr:`lines` the lines of the text, so that reading
+    it doesn't also measure splitting it.'''
+
+    __slots__ = ()
+
+    @property
+    def dictrows(self):
+        '''The rows as dictionaries keyed by :attr:`fieldnames`.'''
+        fieldnames = self.fieldnames
+        return [dict(zip(fieldnames, row)) for row in self.rows]
+
+def generate(shape, dialectname, scale=1.0, seed=0):
+    '''Generate a table.
+
+    :param shape: The name of one of :data:`SHAPES`
+    :param dialectname: The name of one of :data:`DIALECTS`
+    :param scale: A factor for the number of rows of the shape
+    :param seed: The seed of the random cell contents
+    '''
+    dialect = dict(DIALECTS)[dialectname]
+    for name, count, columns, width in SHAPES:
+        if name == shape:
+            break
+    else:
+        raise ValueError('No such shape: {}'.format(shape))
+    count = max(1, int(count * scale))
+
+    alphabet = _UNICODE if dialectname == 'unicode' else _ASCII
+    generator = random.Random(seed)
+    choice = generator.choice
+    randint = generator.randint
+
+    widths = tuple([width] * columns)
+    fieldnames = tuple('col{}'.format(column) for column in range(columns))
+    rows = [
+        tuple(''.join(choice(alphabet) for _ in range(randint(1, width))) for _ in range(columns))
+        for _ in range(count)]
+
+    output = StringIO()
+    with writer(output, widths, dialect) as w:
+        w.writeheader(fieldnames)
+        w.writerows(rows)
+
+    text = output.getvalue()
+    return Table('{}/{}'.format(shape, dialectname), shape, dialectname, dialect, widths, fieldnames, rows, text, text.splitlines())
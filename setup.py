@@ -7,10 +7,22 @@
 
 from __future__ import division, absolute_import, print_function, unicode_literals
 
+import sys
 from setuptools import setup
 
 from texttables import __author__, __description__, __email__, __license__, __modulename__, __version__, __website__
 
+packages = [
+    'texttables',
+    'texttables.fixed',
+    'texttables.dynamic',
+    ]
+
+# The asyncio readers and writers are written with async def, which only
+# compiles on Python 3.5 and later, so wheels are built for each major version
+if sys.version_info >= (3, 5):
+    packages.append('texttables.aio')
+
 setup(
     name=__modulename__,
     version=__version__,
@@ -19,14 +31,13 @@ setup(
     author_email=__email__,
     url=__website__,
     license=__license__,
-    packages=[
-        'texttables',
-        'texttables.fixed',
-        'texttables.dynamic',
-        ],
+    packages=packages,
     install_requires=[
-        'six',
+        'six>=1.13',
         ],
+    extras_require={
+        'numpy': ['numpy'],
+        },
     classifiers=[
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+import sys
+import unittest
+from six import StringIO
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from texttables import aio
+from texttables import fixed, dynamic
+from texttables import Dialect
+from texttables import ValidationError
+
+class dialect(Dialect):
+    top_border = '-'
+    bottom_border = '-'
+    left_border = '|'
+    right_border = '|'
+    row_delimiter = '-'
+    header_delimiter = '='
+    corner_border = '+'
+    cell_delimiter = '|'
+
+data = (
+    '+----------+----------+----------+\n'
+    '|header 1  |header 2  |header 3  |\n'
+    '+==========+==========+==========+\n'
+    '|data 1    |data 2    |data 3    |\n'
+    '+----------+----------+----------+\n'
+    '|data 4    |data 5    |data 6    |\n'
+    '+----------+----------+----------+\n'
+    )
+
+class Lines(object):
+    '''An async iterable of lines'''
+    def __init__(self, lines):
+        self._lines = iter(lines)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        future = asyncio.get_event_loop().create_future()
+        try:
+            future.set_result(next(self._lines))
+        except StopIteration:
+            future.set_exception(StopAsyncIteration())
+        return future
+
+class Cell(str):
+    '''A cell counting how many times it is formatted'''
+    formatted = [0]
+
+    def __str__(self):
+        self.formatted[0] += 1
+        return str.__str__(self)
+
+class Stream(object):
+    '''A stream that records what is written and how often it is drained'''
+    def __init__(self):
+        self.written = list()
+        self.drains = 0
+
+    def write(self, data):
+        self.written.append(data)
+
+    def drain(self):
+        self.drains += 1
+        future = asyncio.get_event_loop().create_future()
+        future.set_result(None)
+        return future
+
+@unittest.skipIf(sys.version_info < (3, 5), 'texttables.aio requires Python 3.5 or later')
+class AioTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def streamreader(self, data, chunksize=None):
+        stream = asyncio.StreamReader()
+        encoded = data.encode('utf-8')
+        for start in range(0, len(encoded), chunksize or len(encoded) or 1):
+            stream.feed_data(encoded[start:start + (chunksize or len(encoded))])
+        stream.feed_eof()
+        return stream
+
+    def collect(self, iterable):
+        rows = list()
+        while True:
+            try:
+                rows.append(self.loop.run_until_complete(iterable.__anext__()))
+            except StopAsyncIteration:
+                return rows
+
+    def test_reader(self):
+        expected = list(fixed.reader(data.splitlines(), [10, 10, 10], dialect))
+        for chunksize in (None, 1, 7):
+            r = aio.fixed.reader(self.streamreader(data), [10, 10, 10], dialect, chunksize=chunksize or 65536)
+            self.assertEqual(self.collect(r), expected)
+            self.assertEqual(r.fieldnames, ('header 1', 'header 2', 'header 3'))
+
+        r = aio.fixed.reader(Lines(data.encode('utf-8').splitlines(True)), [10, 10, 10], dialect)
+        self.assertEqual(self.loop.run_until_complete(r.readfieldnames()), ('header 1', 'header 2', 'header 3'))
+        self.assertEqual(self.collect(r), expected)
+
+        r = aio.fixed.reader(Lines(data.splitlines()), [10, 10, 10], dialect, columns=['header 2'], converters={'header 3': int}, onerror='none')
+        self.assertEqual(self.collect(r), [('data 2',), ('data 5',)])
+
+    def test_reader_empty(self):
+        r = aio.fixed.reader(self.streamreader(''), [10, 10, 10], dialect)
+        self.assertEqual(self.collect(r), [])
+
+    def test_reader_strict(self):
+        for bad in (
+                data.replace('|data 4', '#data 4'),
+                data.replace('data 2    |', 'data 2    #'),
+                data.replace('+==========+', '+----------+', 1),
+                ):
+            with self.assertRaises(ValidationError):
+                list(fixed.reader(bad.splitlines(), [10, 10, 10], dialect))
+            r = aio.fixed.reader(self.streamreader(bad), [10, 10, 10], dialect)
+            with self.assertRaises(ValidationError):
+                self.collect(r)
+
+    def test_dictreader(self):
+        expected = list(fixed.DictReader(data.splitlines(), [10, 10, 10], dialect))
+        for rowtype in ('dict', 'row', 'lazy'):
+            r = aio.fixed.DictReader(self.streamreader(data), [10, 10, 10], dialect, rowtype=rowtype)
+            self.assertEqual(self.collect(r), expected)
+
+    def test_dynamic_reader(self):
+        r = aio.dynamic.reader(self.streamreader(data, 5), dialect)
+        self.assertEqual(self.collect(r), list(dynamic.reader(data.splitlines(), dialect)))
+        self.assertEqual(r.widths, (10, 10, 10))
+
+        r = aio.dynamic.reader(self.streamreader('a b\nc d\n'), dialect)
+        with self.assertRaises(ValidationError):
+            self.collect(r)
+
+    def test_writer(self):
+        rows = [('data {}'.format(i), 'x' * (i % 12), i) for i in range(200)]
+        output = StringIO()
+        with fixed.writer(output, [10, '>10', 10], dialect) as w:
+            w.writeheader(('header 1', 'header 2', 'header 3'))
+            w.writerows(rows)
+
+        stream = Stream()
+        w = aio.fixed.writer(stream, [10, '>10', 10], dialect, batchsize=1000)
+        self.loop.run_until_complete(w.__aenter__())
+        self.loop.run_until_complete(w.writeheader(('header 1', 'header 2', 'header 3')))
+        self.loop.run_until_complete(w.writerow(rows[0]))
+        self.loop.run_until_complete(w.writerows(Lines(rows[1:100]), chunksize=7))
+        self.loop.run_until_complete(w.writerows(rows[100:], chunksize=7))
+        self.loop.run_until_complete(w.__aexit__(None, None, None))
+        self.assertEqual(b''.join(stream.written).decode('utf-8'), output.getvalue())
+        self.assertTrue(all(len(data) <= 1000 for data in stream.written))
+        self.assertEqual(stream.drains, len(stream.written))
+        self.assertGreater(stream.drains, 10)
+
+    def test_dictwriter(self):
+        rows = [{'a': i, 'b': -i} for i in range(20)]
+        output = StringIO()
+        with fixed.DictWriter(output, ['a', 'b'], [5, 5], dialect) as w:
+            w.writeheader()
+            w.writerows(rows)
+
+        stream = Stream()
+        w = aio.fixed.DictWriter(stream, ['a', 'b'], [5, 5], dialect, encoding=None)
+        self.loop.run_until_complete(w.__aenter__())
+        self.loop.run_until_complete(w.writeheader())
+        self.loop.run_until_complete(w.writerows(rows))
+        self.loop.run_until_complete(w.__aexit__(None, None, None))
+        self.assertEqual(''.join(stream.written), output.getvalue())
+
+    def test_dynamic_writer(self):
+        rows = [('data {}'.format(i), 'x' * (i % 12)) for i in range(50)]
+        output = StringIO()
+        with dynamic.writer(output, dialect=dialect) as w:
+            w.writeheader(('header 1', 'header 2'))
+            w.writerows(rows)
+
+        stream = Stream()
+        w = aio.dynamic.writer(stream, dialect=dialect, batchsize=100)
+        self.loop.run_until_complete(w.writeheader(('header 1', 'header 2')))
+        self.loop.run_until_complete(w.writerows(Lines(rows)))
+        self.loop.run_until_complete(w.finish())
+        self.assertEqual(b''.join(stream.written).decode('utf-8'), output.getvalue())
+        self.assertEqual(stream.drains, len(stream.written))
+
+    def test_dynamic_writer_chunks(self):
+        formatted = Cell.formatted = [0]
+        rows = [(Cell('data {}'.format(i)),) for i in range(5000)]
+        written = list()
+        class Counting(Stream):
+            def write(self, data):
+                written.append(formatted[0])
+                Stream.write(self, data)
+
+        stream = Counting()
+        w = aio.dynamic.writer(stream, dialect=dialect, batchsize=1000, buffersize=2000)
+        self.loop.run_until_complete(w.writerows(rows))
+        self.loop.run_until_complete(w.finish())
+        # The table is written out as it is formatted, not all at the end
+        self.assertLess(written[0], len(rows))
+        self.assertTrue(all(len(data) <= 1000 for data in stream.written))
+
+        output = StringIO()
+        with dynamic.writer(output, dialect=dialect) as sync:
+            sync.writerows(rows)
+        self.assertEqual(b''.join(stream.written).decode('utf-8'), output.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
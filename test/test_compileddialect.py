@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+import pickle
+import unittest
+from six import StringIO
+
+from texttables import Dialect, CompiledDialect
+from texttables.fixed import reader, writer
+
+class dialect(Dialect):
+    header_delimiter = '='
+    left_border = '|'
+    right_border = '|'
+    cell_delimiter = '|'
+
+class CompiledDialectTest(unittest.TestCase):
+    def test_attributes(self):
+        compiled = CompiledDialect.compile(dialect, strip=False)
+        self.assertEqual(compiled.header_delimiter, '=')
+        self.assertEqual(compiled.left_border, '|')
+        self.assertEqual(compiled.corner_border, '+')
+        self.assertFalse(compiled.strip)
+        self.assertEqual(CompiledDialect.compile().cell_delimiter, ' ')
+
+    def test_cached(self):
+        self.assertIs(CompiledDialect.compile(dialect), CompiledDialect.compile(dialect()))
+        self.assertIs(CompiledDialect.compile(dialect, strict=True), CompiledDialect.compile(dialect))
+        self.assertIsNot(CompiledDialect.compile(dialect), CompiledDialect.compile(dialect, strict=False))
+        compiled = CompiledDialect.compile(dialect)
+        self.assertIs(CompiledDialect.compile(compiled), compiled)
+
+    def test_immutable(self):
+        compiled = CompiledDialect.compile(dialect)
+        with self.assertRaises(AttributeError):
+            compiled.strict = False
+        with self.assertRaises(AttributeError):
+            compiled.other = False
+        with self.assertRaises(AttributeError):
+            del compiled.strict
+
+    def test_hash(self):
+        first = CompiledDialect.compile(dialect)
+        second = pickle.loads(pickle.dumps(first))
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, CompiledDialect.compile())
+        self.assertEqual(len({first, second, CompiledDialect.compile()}), 2)
+
+    def test_todialect(self):
+        copy = CompiledDialect.compile(dialect).todialect()
+        self.assertIsInstance(copy, Dialect)
+        self.assertEqual(copy.left_border, '|')
+        copy.left_border = '#'
+        self.assertEqual(CompiledDialect.compile(dialect).left_border, '|')
+
+    def test_reader_writer(self):
+        output = StringIO()
+        w = writer(output, [3, 3], dialect, cell_delimiter='!')
+        self.assertIs(w.compiled, CompiledDialect.compile(dialect, cell_delimiter='!'))
+        # The dialect can't be changed in place, as that wouldn't affect
+        # writing
+        self.assertIsInstance(w.dialect, Dialect)
+        self.assertEqual(w.dialect.cell_delimiter, '!')
+        with self.assertRaises(AttributeError):
+            w.dialect.cell_delimiter = '?'
+        with self.assertRaises(AttributeError):
+            del w.dialect.strip
+        w.writeheader(('a', 'b'))
+        w.writerow(('c', 'd'))
+        self.assertEqual(output.getvalue(), '|a  !b  |\n+===+===+\n|c  !d  |\n')
+
+        r = reader(output.getvalue().splitlines(), [3, 3], w.compiled)
+        self.assertIs(r.compiled, w.compiled)
+        with self.assertRaises(AttributeError):
+            r.dialect.strip = False
+        # A new dialect is assigned instead
+        changed = r.compiled.todialect()
+        changed.strip = False
+        r.dialect = changed
+        self.assertEqual(r.dialect.strip, False)
+        self.assertEqual(list(r), [('c  ', 'd  ')])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+import unittest
+
+from texttables.dynamic import DictReader as reader
+from texttables import Dialect
+
+class DynamicDictReaderTest(unittest.TestCase):
+    def test_full_borders(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            row_delimiter = '-'
+            top_border = '#'
+            bottom_border = '_'
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+            corner_border = '+'
+
+        data = (
+            '+########+##########+########+\n'
+            '|header 1|  header 2|header 3|\n'
+            '+========+==========+========+\n'
+            '|data 1  |    data 2| data 3 |\n'
+            '+--------+----------+--------+\n'
+            '|data 4  |    data 5| data 6 |\n'
+            '+________+__________+________+\n'
+            )
+        r = reader(data.splitlines(), dialect=dialect)
+        self.assertEqual(r.fieldnames, ('header 1', 'header 2', 'header 3'))
+        self.assertEqual([row for row in r], [
+            {'header 1': 'data 1', 'header 2': 'data 2', 'header 3': 'data 3'},
+            {'header 1': 'data 4', 'header 2': 'data 5', 'header 3': 'data 6'},
+            ])
+
+    def test_fieldnames(self):
+        class dialect(Dialect):
+            top_border = '='
+            bottom_border = '='
+            corner_border = ' '
+
+        data = (
+            '====== ====== ======\n'
+            'data 1 data 2 data 3\n'
+            'data 4 data 5 data 6\n'
+            '====== ====== ======\n'
+            )
+        r = reader(data.splitlines(), dialect=dialect, fieldnames=('a', 'b', 'c'))
+        self.assertEqual([row for row in r], [
+            {'a': 'data 1', 'b': 'data 2', 'c': 'data 3'},
+            {'a': 'data 4', 'b': 'data 5', 'c': 'data 6'},
+            ])
+
+if __name__ == '__main__':
+    unittest.main()
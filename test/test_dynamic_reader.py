@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+import unittest
+
+from texttables.dynamic import reader
+from texttables import Dialect
+from texttables import ValidationError
+
+class DynamicReaderTest(unittest.TestCase):
+    def run_asserts(self, reader):
+        self.assertEqual(reader.fieldnames, ('header 1', 'header 2', 'header 3'))
+        rows = [row for row in reader]
+        self.assertEqual(rows, [
+            ('data 1', 'data 2', 'data 3'),
+            ('data 4', 'data 5', 'data 6')])
+
+    def test_basic_table_header_delim(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            corner_border = ' '
+        data = (
+            'header 1 header 2 header 3\n'
+            '======== ======== ========\n'
+            'data 1   data 2   data 3  \n'
+            'data 4   data 5   data 6  \n'
+            )
+        r = reader(data.splitlines(), dialect=dialect)
+        self.assertEqual(r.widths, (8, 8, 8))
+        self.run_asserts(r)
+
+    def test_full_borders(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            row_delimiter = '-'
+            top_border = '#'
+            bottom_border = '_'
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+            corner_border = '+'
+
+        data = (
+            '+########+##########+########+\n'
+            '|header 1|  header 2|header 3|\n'
+            '+========+==========+========+\n'
+            '|data 1  |    data 2| data 3 |\n'
+            '+--------+----------+--------+\n'
+            '|data 4  |    data 5| data 6 |\n'
+            '+________+__________+________+\n'
+            )
+        r = reader(data.splitlines(), dialect=dialect)
+        self.assertEqual(r.widths, (8, 10, 8))
+        self.run_asserts(r)
+
+    def test_row_delim(self):
+        class dialect(Dialect):
+            row_delimiter = '-'
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+            corner_border = '+'
+
+        data = (
+            '|header 1|header 2|header 3|\n'
+            '|data 1  |data 2  |data 3  |\n'
+            '+--------+--------+--------+\n'
+            '|data 4  |data 5  |data 6  |\n'
+            )
+        self.run_asserts(reader(data.splitlines(), dialect=dialect))
+
+    def test_no_delimiters(self):
+        data = (
+            'header 1 header 2 header 3\n'
+            'data 1   data 2   data 3  \n'
+            'data 4   data 5   data 6  \n'
+            )
+        with self.assertRaises(ValidationError):
+            reader(data.splitlines())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+import unittest
+from six import StringIO
+
+from texttables.dynamic import StreamWriter as writer
+from texttables import Dialect
+from texttables import ValidationError
+
+class dialect(Dialect):
+    header_delimiter = '='
+    row_delimiter = '-'
+    top_border = '#'
+    bottom_border = '_'
+    left_border = '|'
+    cell_delimiter = '|'
+    right_border = '|'
+    corner_border = '+'
+
+class DynamicStreamWriterTest(unittest.TestCase):
+    def run_asserts(self, writer, data, output):
+        with writer as w:
+            w.writeheader(('header 1', 'header 2', 'header 3'))
+            w.writerow(('data 1', 'data 2', 'data 3'))
+            w.writerow(('data 4', 'data 5', 'data 6'))
+            w.writerow(('data 7', 'long data 8', 'data 9'))
+
+        self.assertEqual(data, output.getvalue())
+
+    def test_sample(self):
+        output = StringIO()
+        data = (
+            '+########+###########+########+\n'
+            '|header 1|   header 2|header 3|\n'
+            '+========+===========+========+\n'
+            '|data 1  |     data 2|data 3  |\n'
+            '+--------+-----------+--------+\n'
+            '|data 4  |     data 5|data 6  |\n'
+            '+--------+-----------+--------+\n'
+            '|data 7  |long data 8|data 9  |\n'
+            '+________+___________+________+\n'
+            )
+        self.run_asserts(writer(output, ['', '>'], dialect=dialect), data, output)
+
+    def test_streaming(self):
+        output = StringIO()
+        w = writer(output, dialect=dialect, sample=1)
+        w.writeheader(('header 1', 'header 2', 'header 3'))
+        self.assertEqual(output.getvalue(), '')
+        w.writerow(('data 1', 'data 2', 'data 3'))
+        self.assertEqual(output.getvalue(), (
+            '+########+########+########+\n'
+            '|header 1|header 2|header 3|\n'
+            '+========+========+========+\n'
+            '|data 1  |data 2  |data 3  |\n'
+            ))
+
+    def test_truncate(self):
+        output = StringIO()
+        data = (
+            '+########+########+########+\n'
+            '|header 1|header 2|header 3|\n'
+            '+========+========+========+\n'
+            '|data 1  |data 2  |data 3  |\n'
+            '+--------+--------+--------+\n'
+            '|data 4  |data 5  |data 6  |\n'
+            '+--------+--------+--------+\n'
+            '|data 7  |long dat|data 9  |\n'
+            '+________+________+________+\n'
+            )
+        self.run_asserts(writer(output, dialect=dialect, sample=2), data, output)
+
+    def test_wrap(self):
+        output = StringIO()
+        data = (
+            '+########+######+########+\n'
+            '|header 1|header|header 3|\n'
+            '+========+======+========+\n'
+            '|data 1  |data 2|data 3  |\n'
+            '+--------+------+--------+\n'
+            '|data 4  |data 5|data 6  |\n'
+            '+--------+------+--------+\n'
+            '|data 7  |long d|data 9  |\n'
+            '|        |ata 8 |        |\n'
+            '+________+______+________+\n'
+            )
+        self.run_asserts(writer(output, dialect=dialect, maxwidths=[None, 6], overflow='wrap'), data, output)
+
+    def test_wrap_extra_columns(self):
+        output = StringIO()
+        w = writer(output, dialect=dialect, sample=1, overflow='wrap')
+        w.writeheader(('header 1', 'header 2'))
+        w.writerow(('data 1', 'data 2'))
+        with self.assertRaises(ValidationError):
+            w.writerow(('data 3', 'data 4', 'data 5'))
+
+    def test_widen(self):
+        output = StringIO()
+        data = (
+            '+########+########+########+\n'
+            '|header 1|header 2|header 3|\n'
+            '+========+========+========+\n'
+            '|data 1  |data 2  |data 3  |\n'
+            '+--------+--------+--------+\n'
+            '|data 4  |data 5  |data 6  |\n'
+            '+________+________+________+\n'
+            '+########+##########+########+\n'
+            '|header 1|header 2  |header 3|\n'
+            '+========+==========+========+\n'
+            '|data 7  |long data |data 9  |\n'
+            '+________+__________+________+\n'
+            )
+        self.run_asserts(writer(output, dialect=dialect, sample=2, maxwidths=10, overflow='widen'), data, output)
+
+if __name__ == '__main__':
+    unittest.main()
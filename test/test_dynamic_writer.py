@@ -7,6 +7,7 @@ import unittest
 from six import StringIO
 
 from texttables.dynamic import writer
+from texttables.fixed import _columns
 from texttables import Dialect
 
 class DynamicWriterTest(unittest.TestCase):
@@ -146,5 +147,124 @@ class DynamicWriterTest(unittest.TestCase):
             )
         self.assertEqual(data, output.getvalue())
 
+    def test_buffersize(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            row_delimiter = '-'
+            corner_border = ' '
+        output = StringIO()
+
+        with writer(output, ['', '>', '^'], dialect=dialect, buffersize=2) as w:
+            w.writeheader(('header 1', 'header 2', 'header 3'))
+            w.writerows([
+                ('data 1', 'data 2', 'data 3'),
+                ('data 4', 'data 5', 'data 6'),
+                ('data 7', 'wide data 8', 'data 9')])
+            self.assertEqual(w.rows, [('data 7', 'wide data 8', 'data 9')])
+
+        data = (
+            'header 1    header 2 header 3\n'
+            '======== =========== ========\n'
+            'data 1        data 2  data 3 \n'
+            '-------- ----------- --------\n'
+            'data 4        data 5  data 6 \n'
+            '-------- ----------- --------\n'
+            'data 7   wide data 8  data 9 \n'
+            )
+        self.assertEqual(data, output.getvalue())
+
+    def test_widths(self):
+        output = StringIO()
+
+        with writer(output) as w:
+            self.assertEqual(w.widths, ())
+            w.writerow(('data 1', 'data 2'))
+            self.assertEqual(w.widths, (6, 6))
+            w.writeheader(('header 1', 'h2'))
+            self.assertEqual(w.widths, (8, 6))
+            w.writerows([('data 3', 'wide data 4')])
+            self.assertEqual(w.widths, (8, 11))
+
+        data = (
+            'header 1 h2         \n'
+            'data 1   data 2     \n'
+            'data 3   wide data 4\n'
+            )
+        self.assertEqual(data, output.getvalue())
+
+    def test_rows_append(self):
+        for buffersize in (None, 2):
+            output = StringIO()
+            w = writer(output, buffersize=buffersize)
+            w.writeheader(('a', 'b'))
+            w.rows.append(('hello', 'world'))
+            w.writerow(('x', 'y'))
+            w.rows.append(('c', 'wider cell'))
+            self.assertEqual(w.widths, (5, 10))
+            w.rows.append(('longest', 'd'))
+            w.finish()
+
+            data = (
+                'a       b         \n'
+                'hello   world     \n'
+                'x       y         \n'
+                'c       wider cell\n'
+                'longest d         \n'
+                )
+            self.assertEqual(data, output.getvalue())
+
+    def test_writecolumns(self):
+        data = (
+            'header 1 h2         \n'
+            'data 1   data 2     \n'
+            'data 3   wide data 4\n'
+            '5        6          \n'
+            'data 7   data 8     \n'
+            )
+        module = _columns.numpy
+        for numpy in (module, None):
+            _columns.numpy = numpy
+            try:
+                output = StringIO()
+                with writer(output, buffersize=1) as w:
+                    w.writeheader(('header 1', 'h2'))
+                    w.writerow(('data 1', 'data 2'))
+                    w.writecolumns([['data 3', '5'], ['wide data 4', '6']])
+                    self.assertEqual(w.widths, (8, 11))
+                    w.writerow(('data 7', 'data 8'))
+            finally:
+                _columns.numpy = module
+            self.assertEqual(data, output.getvalue())
+
+    @unittest.skipIf(_columns.numpy is None, 'NumPy is not installed')
+    def test_writecolumns_buffersize(self):
+        numpy = _columns.numpy
+        output = StringIO()
+        with writer(output, buffersize=2) as w:
+            w.writeheader(('n', 'square'))
+            w.writerow(('first', 'row'))
+            w.writecolumns([numpy.arange(4), numpy.arange(4) ** 2])
+            # Only the rows past the last spill are held, and no columns
+            self.assertEqual(w.rows, [('3', '9')])
+            self.assertEqual(w.widths, (5, 6))
+
+        data = (
+            'n     square\n'
+            'first row   \n'
+            '0     0     \n'
+            '1     1     \n'
+            '2     4     \n'
+            '3     9     \n'
+            )
+        self.assertEqual(data, output.getvalue())
+
+    def test_no_header(self):
+        output = StringIO()
+
+        with writer(output) as w:
+            w.writerow(('data 1', 'data 2'))
+
+        self.assertEqual('data 1 data 2\n', output.getvalue())
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import unicode_literals
+import unittest
+from six import BytesIO
+
+from texttables.fixed import bytesreader as reader
+from texttables import Dialect
+from texttables import ValidationError
+
+class dialect(Dialect):
+    top_border = '═'
+    bottom_border = '═'
+    left_border = '│'
+    right_border = '│'
+    cell_delimiter = '│'
+    corner_border = '╬'
+    header_delimiter = '='
+    row_delimiter = '-'
+
+data = (
+    '╬══════════╬══════════╬══════════╬\n'
+    '│header 1  │header 2  │header 3  │\n'
+    '╬==========╬==========╬==========╬\n'
+    '│data 1    │       1.5│    1     │\n'
+    '╬----------╬----------╬----------╬\n'
+    '│data 4    │      -2.5│    no    │\n'
+    '╬══════════╬══════════╬══════════╬\n'
+    ).encode('utf-8')
+
+class FixedBytesReaderTest(unittest.TestCase):
+    def test_table(self):
+        for trusted in (False, True):
+            r = reader(BytesIO(data), [10, 10, 10], dialect, trusted=trusted, encoding='utf-8')
+            self.assertEqual(r.fieldnames, (b'header 1', b'header 2', b'header 3'))
+            self.assertEqual(list(r), [
+                (b'data 1', b'1.5', b'1'),
+                (b'data 4', b'-2.5', b'no'),
+                ])
+
+    def test_unstripped(self):
+        r = reader(data.splitlines(), [10, 10, 10], dialect, strip=False, encoding='utf-8')
+        self.assertEqual(next(r), (b'data 1    ', b'       1.5', b'    1     '))
+
+    def test_bytes_dialect(self):
+        table = (
+            b'a  |b  \n'
+            b'---+---\n'
+            b'c  |d  \n'
+            )
+        r = reader(BytesIO(table), [3, 3], cell_delimiter=b'|', header_delimiter=b'-', corner_border=b'+')
+        self.assertEqual(r.compiled.cell_delimiter, '|')
+        self.assertEqual(list(r), [(b'c', b'd')])
+
+    def test_strict(self):
+        for bad in (
+                data.replace('│data 4'.encode('utf-8'), b'|data 4'),
+                data.replace('2.5│'.encode('utf-8'), b'2.5|'),
+                data.replace('data 1    │'.encode('utf-8'), b'data 1    |'),
+                data.replace('╬----------╬'.encode('utf-8'), '╬----------═'.encode('utf-8')),
+                data.replace(b'1.5', b'1.50'),
+                data[:-len('╬══════════╬══════════╬══════════╬\n'.encode('utf-8'))],
+                ):
+            with self.assertRaises(ValidationError):
+                list(reader(BytesIO(bad), [10, 10, 10], dialect, encoding='utf-8'))
+
+    def test_converters(self):
+        r = reader(BytesIO(data), [10, 10, 10], dialect, encoding='utf-8',
+                converters={b'header 2': float, b'header 3': bool},
+                where={b'header 1': 'data 4'})
+        self.assertEqual(list(r), [(b'data 4', -2.5, False)])
+
+        r = reader(BytesIO(data), [10, 10, 10], dialect, encoding='utf-8',
+                converters=[int], onerror='keep')
+        self.assertEqual([row[0] for row in r], [b'data 1', b'data 4'])
+
+    def test_text_names(self):
+        # Field names given as text are encoded, just like where values
+        r = reader(BytesIO(data), [10, 10, 10], dialect, encoding='utf-8',
+                columns=['header 3', 'header 1'], converters={'header 2': float},
+                where={'header 1': 'data 4'})
+        self.assertEqual(r.fieldnames, (b'header 3', b'header 1'))
+        self.assertEqual(list(r), [(b'no', b'data 4')])
+
+        lines = BytesIO(data).readlines()
+        r = reader(BytesIO(b''.join(lines[:1] + lines[3:])), [10, 10, 10], dialect, encoding='utf-8',
+                fieldnames=['one', 'two', 'three'], columns=['two'], where={'one': 'data 1'})
+        self.assertEqual(r.fieldnames, (b'two',))
+        self.assertEqual(list(r), [(b'1.5',)])
+
+if __name__ == '__main__':
+    unittest.main()
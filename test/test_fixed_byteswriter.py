@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import unicode_literals
+import unittest
+from six import BytesIO, StringIO
+
+from texttables.fixed import writer, byteswriter
+from texttables import Dialect
+
+class dialect(Dialect):
+    top_border = '═'
+    bottom_border = '═'
+    left_border = '│'
+    right_border = '│'
+    cell_delimiter = '│'
+    corner_border = '╬'
+    header_delimiter = '='
+    row_delimiter = '-'
+
+class FixedBytesWriterTest(unittest.TestCase):
+    def write(self, cls, output, widths, rows, **kwargs):
+        with cls(output, widths, **kwargs) as w:
+            w.writeheader(rows[0])
+            w.writerow(rows[1])
+            w.writerows(rows[2:])
+        return output.getvalue()
+
+    def test_same_as_text(self):
+        widths = ['<5', '>6', '^5', 4]
+        rows = [
+            ('a', 'b', 'c', 'd'),
+            ('one', 'two', 'six', 'long cell'),
+            ('x', '', 'ab', 'y'),
+            ('%s', '%%', '{}', '1'),
+            ]
+        for params in (dict(), dict(dialect=dialect), dict(dialect=dialect, strict=False, top_border=None)):
+            text = self.write(writer, StringIO(), widths, rows, **params)
+            encoded = [tuple(cell.encode('ascii') for cell in row) for row in rows]
+            data = self.write(byteswriter, BytesIO(), widths, encoded, encoding='utf-8', **params)
+            self.assertEqual(data, text.encode('utf-8'))
+
+            noncentered = ['<5', '>6', '5', 4]
+            text = self.write(writer, StringIO(), noncentered, rows, **params)
+            data = self.write(byteswriter, BytesIO(), noncentered, encoded, encoding='utf-8', **params)
+            self.assertEqual(data, text.encode('utf-8'))
+
+    def test_cells(self):
+        output = BytesIO()
+        with byteswriter(output, [5, '>5', 3]) as w:
+            w.writerow((b'a', 12, 'é'))
+            w.writerow((b'b', 2.5))
+        self.assertEqual(output.getvalue(), b'a        12 \xe9  \nb       2.5\n')
+
+    def test_bytes_dialect(self):
+        output = BytesIO()
+        with byteswriter(output, [3, 3], cell_delimiter=b'|', top_border=b'-', corner_border=b'+') as w:
+            self.assertEqual(w.compiled.cell_delimiter, '|')
+            w.writerow((b'a', b'b'))
+        self.assertEqual(output.getvalue(), b'---+---\na  |b  \n')
+
+    def test_alignment(self):
+        output = BytesIO()
+        with self.assertRaises(ValueError):
+            with byteswriter(output, ['=5']) as w:
+                w.writerow((b'a',))
+
+    def test_workers(self):
+        rows = [(b'row', i, 'é') for i in range(20)]
+        outputs = list()
+        for workers in (None, 2):
+            output = BytesIO()
+            with byteswriter(output, [5, 5, 5], dialect, encoding='utf-8') as w:
+                w.writeheader((b'a', b'b', b'c'))
+                w.writerows(rows, chunksize=3, workers=workers)
+            outputs.append(output.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+
+if __name__ == '__main__':
+    unittest.main()
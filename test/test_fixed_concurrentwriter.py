@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+import threading
+import unittest
+from six import StringIO
+
+from texttables.fixed import ConcurrentWriter as writer
+from texttables.fixed import reader
+from texttables.fixed._concurrent import _ROWS
+from texttables import Dialect
+
+class dialect(Dialect):
+    top_border = '-'
+    bottom_border = '='
+    left_border = '|'
+    right_border = '|'
+    row_delimiter = '-'
+    header_delimiter = '='
+    corner_border = '+'
+    cell_delimiter = '|'
+
+class FixedConcurrentWriterTest(unittest.TestCase):
+    def test_basic_table(self):
+        data = (
+            '+----------+----------+\n'
+            '|header 1  |header 2  |\n'
+            '+==========+==========+\n'
+            '|data 1    |data 2    |\n'
+            '+----------+----------+\n'
+            '|data 3    |data 4    |\n'
+            '+----------+----------+\n'
+            '|data 5    |data 6    |\n'
+            '+==========+==========+\n'
+            )
+        for queuesize in (0, 1, 2):
+            output = StringIO()
+            with writer(output, [10, 10], dialect, queuesize=queuesize) as w:
+                w.writeheader(('header 1', 'header 2'))
+                w.writerow(('data 1', 'data 2'))
+                w.writerows([('data 3', 'data 4'), ('data 5', 'data 6')])
+            self.assertEqual(output.getvalue(), data)
+
+    def test_threads(self):
+        output = StringIO()
+        threads = 8
+        count = 500
+
+        def produce(thread):
+            for i in range(0, count, 10):
+                w.writerow((thread, i))
+                w.writerows((thread, j) for j in range(i + 1, i + 10))
+
+        with writer(output, [10, 10], dialect, batchsize=16) as w:
+            w.writeheader(('thread', 'row'))
+            workers = [threading.Thread(target=produce, args=(thread,)) for thread in range(threads)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            w.flush()
+
+        # Strictly reading it back checks every line and delimiter
+        r = reader(output.getvalue().splitlines(), [10, 10], dialect)
+        rows = list(r)
+        self.assertEqual(r.fieldnames, ('thread', 'row'))
+        self.assertEqual(len(rows), threads * count)
+        for thread in range(threads):
+            # Each thread's rows are written in the order it wrote them
+            self.assertEqual([int(row[1]) for row in rows if row[0] == str(thread)], list(range(count)))
+
+    def test_closed(self):
+        w = writer(StringIO(), [10, 10], dialect)
+        w.close()
+        w.close()
+        with self.assertRaises(ValueError):
+            w.writerow(('a', 'b'))
+
+    def test_flush_closed(self):
+        w = writer(StringIO(), [10, 10], dialect)
+        w.close()
+        errors = list()
+        def flush():
+            try:
+                w.flush()
+            except ValueError as error:
+                errors.append(error)
+        flusher = threading.Thread(target=flush)
+        flusher.daemon = True
+        flusher.start()
+        flusher.join(5)
+        # Flushing a closed writer raises rather than waiting forever
+        self.assertFalse(flusher.is_alive())
+        self.assertEqual(len(errors), 1)
+
+    def test_close_race(self):
+        output = StringIO()
+        w = writer(output, [10, 10])
+        queue = w._queue
+        closer = threading.Thread(target=w.close)
+
+        def racing(kind, lines):
+            # Close from another thread just as the row has been let through,
+            # and give it every chance to finish first
+            if kind == _ROWS:
+                closer.start()
+                closer.join(0.5)
+            queue(kind, lines)
+        w._queue = racing
+
+        try:
+            w.writerow(('a', 'b'))
+        except ValueError:
+            written = []
+        else:
+            written = [('a', 'b')]
+        closer.join()
+        # The row is either refused or written, never silently lost
+        self.assertEqual(list(reader(output.getvalue().splitlines(), [10, 10], fieldnames=('x', 'y'))), written)
+
+    def test_write_error(self):
+        class Broken(object):
+            def write(self, text):
+                raise IOError('broken')
+        w = writer(Broken(), [10, 10], dialect)
+        w.writerow(('a', 'b'))
+        with self.assertRaises(IOError):
+            w.flush()
+        with self.assertRaises(IOError):
+            w.writerow(('a', 'b'))
+        with self.assertRaises(IOError):
+            w.close()
+
+if __name__ == '__main__':
+    unittest.main()
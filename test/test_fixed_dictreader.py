@@ -3,8 +3,11 @@
 # Copyright © 2016 Taylor C. Richberger <taywee@gmx.com>
 # This code is released under the license described in the LICENSE file
 
+import json
 import unittest
 from six import StringIO
+from six.moves import cPickle as pickle
+from six.moves.collections_abc import Mapping
 
 from texttables.fixed import DictReader as reader
 from texttables import Dialect
@@ -377,5 +380,109 @@ class FixedDictReaderTest(unittest.TestCase):
             )
         self.run_asserts(reader(data.splitlines(), [10, 10, 10], fieldnames=('header 1', 'header 2', 'header 3'), dialect=dialect))
 
+    def test_columns(self):
+        data = (
+            'header 1   header 2   header 3  \n'
+            'data 1     data 2     data 3    \n'
+            'data 4     data 5     data 6    \n'
+            )
+        r = reader(data.splitlines(), [10, 10, 10], columns=['header 3', 'header 1'])
+        self.assertEqual(r.fieldnames, ('header 3', 'header 1'))
+        self.assertEqual([row for row in r], [
+            {'header 1': 'data 1', 'header 3': 'data 3'},
+            {'header 1': 'data 4', 'header 3': 'data 6'},
+            ])
+
+    def test_where(self):
+        data = (
+            'header 1   header 2   header 3  \n'
+            'data 1     data 2     data 3    \n'
+            'data 4     data 5     data 6    \n'
+            )
+        r = reader(data.splitlines(), [10, 10, 10], where={'header 2': 'data 5'})
+        self.assertEqual([row for row in r], [
+            {'header 1': 'data 4', 'header 2': 'data 5', 'header 3': 'data 6'},
+            ])
+
+    def test_converters(self):
+        data = (
+            'name  count\n'
+            'one       1\n'
+            'two      -2\n'
+            )
+        r = reader(data.splitlines(), [5, 5], converters={'count': int})
+        self.assertEqual(list(r), [
+            {'name': 'one', 'count': 1},
+            {'name': 'two', 'count': -2}])
+
+    def test_rowtype(self):
+        class dialect(Dialect):
+            top_border = '-'
+            bottom_border = '-'
+            left_border = '|'
+            right_border = '|'
+            row_delimiter = '-'
+            header_delimiter = '='
+            corner_border = '+'
+            cell_delimiter = '|'
+        data = (
+            '+----------+----------+----------+\n'
+            '|header 1  |header 2  |header 3  |\n'
+            '+==========+==========+==========+\n'
+            '|data 1    |data 2    |data 3    |\n'
+            '+----------+----------+----------+\n'
+            '|data 4    |data 5    |data 6    |\n'
+            '+----------+----------+----------+\n'
+            )
+        for rowtype in ('row', 'lazy'):
+            for trusted in (False, True):
+                self.run_asserts(reader(data.splitlines(), [10, 10, 10], dialect=dialect, trusted=trusted, rowtype=rowtype))
+
+            row = next(reader(data.splitlines(), [10, 10, 10], dialect=dialect, rowtype=rowtype))
+            self.assertIsInstance(row, Mapping)
+            self.assertEqual(row['header 2'], 'data 2')
+            self.assertEqual(row[2], 'data 3')
+            self.assertEqual(row.get('header 4', 'none'), 'none')
+            self.assertEqual(tuple(row.keys()), ('header 1', 'header 2', 'header 3'))
+            self.assertEqual(list(row), ['header 1', 'header 2', 'header 3'])
+            self.assertEqual(tuple(row.values()), ('data 1', 'data 2', 'data 3'))
+            self.assertEqual(len(row), 3)
+            self.assertIn('header 1', row)
+            self.assertEqual(dict(row), {'header 1': 'data 1', 'header 2': 'data 2', 'header 3': 'data 3'})
+            self.assertEqual(pickle.loads(pickle.dumps(row)), row)
+            with self.assertRaises(KeyError):
+                row['header 4']
+
+            # Rows are mappings through and through, never tuples of their
+            # field names
+            self.assertNotIsInstance(row, tuple)
+            self.assertEqual(tuple(row), ('header 1', 'header 2', 'header 3'))
+            first, second, third = row.values()
+            self.assertEqual((first, second, third), ('data 1', 'data 2', 'data 3'))
+            self.assertEqual(row.items(), [('header 1', 'data 1'), ('header 2', 'data 2'), ('header 3', 'data 3')])
+            self.assertEqual(json.loads(json.dumps(dict(row))), dict(row))
+
+        data = (
+            'name  total\n'
+            'one       1\n'
+            'two      -x\n'
+            )
+        for rowtype in ('row', 'lazy'):
+            rows = list(reader(data.splitlines(), [5, 5], converters={'total': int}, onerror='keep', rowtype=rowtype))
+            self.assertEqual(rows[0].name, 'one')
+            self.assertEqual(rows[0].total, 1)
+            self.assertEqual(rows[1].total, '-x')
+            with self.assertRaises(AttributeError):
+                rows[0].size
+
+        row = next(reader(data.splitlines(), [5, 5], converters={'total': int}, rowtype='lazy'))
+        self.assertEqual(row['total'], 1)
+        row = list(reader(data.splitlines(), [5, 5], converters={'total': int}, rowtype='lazy'))[1]
+        with self.assertRaises(ValueError):
+            row['total']
+
+        with self.assertRaises(ValueError):
+            reader(data.splitlines(), [5, 5], rowtype='tuple')
+
 if __name__ == '__main__':
     unittest.main()
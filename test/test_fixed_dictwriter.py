@@ -146,5 +146,16 @@ class FixedDictWriterTest(unittest.TestCase):
             )
         self.assertEqual(data, output.getvalue())
 
+    def test_workers(self):
+        rows = [{'foo': i, 'bar': -i, 'baz': 'row {}'.format(i)} for i in range(20)]
+        outputs = list()
+        for workers in (None, 2):
+            output = StringIO()
+            with DictWriter(output, ['foo', 'bar', 'baz'], [10, 10, 10], row_delimiter='-', corner_border=' ') as w:
+                w.writeheader()
+                w.writerows(rows, chunksize=3, workers=workers)
+            outputs.append(output.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+
 if __name__ == '__main__':
     unittest.main()
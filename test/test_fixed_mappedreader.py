@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import unicode_literals
+
+import mmap
+import os
+import tempfile
+import unittest
+
+from texttables.fixed import MappedReader as reader
+from texttables.fixed import _mapped
+from texttables import Dialect
+from texttables import ValidationError
+
+class FixedMappedReaderTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def table(self, data):
+        with open(self.path, 'wb') as file:
+            file.write(data.encode('utf-8'))
+        return self.path
+
+    def run_asserts(self, reader):
+        with reader:
+            self.assertEqual(reader.fieldnames, ('header 1', 'header 2', 'header 3'))
+            rows = [row for row in reader]
+            self.assertEqual(rows, [
+                ('data 1', 'data 2', 'data 3'),
+                ('data 4', 'data 5', 'data 6')])
+
+    def test_basic_table(self):
+        data = (
+            'header 1   header 2   header 3  \n'
+            'data 1     data 2     data 3    \n'
+            'data 4     data 5     data 6    \n'
+            )
+        self.run_asserts(reader(self.table(data), [10, 10, 10]))
+
+    def test_file_descriptor(self):
+        data = (
+            'header 1   header 2   header 3  \r\n'
+            'data 1     data 2     data 3    \r\n'
+            'data 4     data 5     data 6    '
+            )
+        fd = os.open(self.table(data), os.O_RDONLY)
+        try:
+            self.run_asserts(reader(fd, [10, 10, 10]))
+        finally:
+            os.close(fd)
+
+    def test_full_borders(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            row_delimiter = '-'
+            top_border = '#'
+            bottom_border = '_'
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+            corner_border = '+'
+
+        data = (
+            '+##########+##########+##########+\n'
+            '|header 1  |  header 2| header 3 |\n'
+            '+==========+==========+==========+\n'
+            '|data 1    |    data 2|  data 3  |\n'
+            '+----------+----------+----------+\n'
+            '|data 4    |    data 5|  data 6  |\n'
+            '+__________+__________+__________+\n'
+            )
+        self.run_asserts(reader(self.table(data), [10, 10, 10], dialect=dialect))
+
+    def test_unicode(self):
+        class dialect(Dialect):
+            header_delimiter = '═'
+            left_border = '│'
+            cell_delimiter = '│'
+            right_border = '│'
+            corner_border = '┼'
+
+        data = (
+            '│header 1  │  header 2│ header 3 │\n'
+            '┼══════════┼══════════┼══════════┼\n'
+            '│data 1    │    data 2│  data 3  │\n'
+            '│dátá 4    │    data 5│  data 6  │\n'
+            )
+        with reader(self.table(data), [10, 10, 10], dialect=dialect) as r:
+            self.assertEqual(r.fieldnames, ('header 1', 'header 2', 'header 3'))
+            self.assertEqual([row for row in r], [
+                ('data 1', 'data 2', 'data 3'),
+                ('dátá 4', 'data 5', 'data 6')])
+
+    @unittest.skipUnless(hasattr(mmap.mmap, 'madvise') and hasattr(mmap, 'MADV_DONTNEED') and os.path.exists('/proc/self/statm'),
+        'releasing pages needs madvise, and measuring them needs /proc')
+    def test_bounded_memory(self):
+        def resident():
+            with open('/proc/self/statm') as statm:
+                return int(statm.read().split()[1]) * mmap.PAGESIZE
+
+        row = ''.join('{:<20}'.format('cell {}'.format(i)) for i in range(10)) + '\n'
+        with open(self.path, 'wb') as file:
+            file.write(row.encode('utf-8'))
+            chunk = (row * 10000).encode('utf-8')
+            for _ in range(16):
+                file.write(chunk)
+        size = os.path.getsize(self.path)
+
+        releasesize = _mapped.RELEASESIZE
+        _mapped.RELEASESIZE = 1024 * 1024
+        try:
+            start = resident()
+            peak = start
+            with reader(self.path, [20] * 10, columns=[0], cell_delimiter='') as r:
+                for count, row in enumerate(r):
+                    if not count % 1000:
+                        peak = max(peak, resident())
+        finally:
+            _mapped.RELEASESIZE = releasesize
+        self.assertEqual(count + 1, 160000)
+        # The mapping's pages are released as it's read, rather than all of
+        # the file ending up resident
+        self.assertLess(peak - start, size // 4)
+
+    def test_empty(self):
+        with reader(self.table(''), [10, 10, 10], fieldnames=('a', 'b', 'c')) as r:
+            self.assertEqual([row for row in r], [])
+
+    def test_strict_cell(self):
+        class dialect(Dialect):
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+
+        data = (
+            '|header 1  |  header 2| header 3 |\n'
+            '|data 1         data 2|  data 3  |\n'
+            )
+        with reader(self.table(data), [10, 10, 10], dialect=dialect) as r:
+            with self.assertRaises(ValidationError):
+                rows = [row for row in r]
+
+    def test_strict_bottom(self):
+        class dialect(Dialect):
+            bottom_border = '_'
+            corner_border = ' '
+
+        data = (
+            'header 1   header 2   header 3  \n'
+            'data 1     data 2     data 3    \n'
+            )
+        with reader(self.table(data), [10, 10, 10], dialect=dialect) as r:
+            with self.assertRaises(ValidationError):
+                rows = [row for row in r]
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+import os
+import tempfile
+import unittest
+
+from texttables.fixed import parallel_read
+from texttables.fixed import _parallel
+from texttables import Dialect
+from texttables import ValidationError
+
+class dialect(Dialect):
+    header_delimiter = '='
+    row_delimiter = '-'
+    top_border = '#'
+    bottom_border = '_'
+    left_border = '|'
+    cell_delimiter = '|'
+    right_border = '|'
+    corner_border = '+'
+
+class FixedParallelReadTest(unittest.TestCase):
+    rows = [
+        ('data 1', 'data 2', 'data 3'),
+        ('data 4', 'data 5', 'data 6'),
+        ('data 7', 'data 8', 'data 9')]
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def table(self, data):
+        with open(self.path, 'wb') as file:
+            file.write(data)
+        return self.path
+
+    def test_basic_table(self):
+        data = (
+            b'header 1   header 2   header 3  \n'
+            b'data 1     data 2     data 3    \n'
+            b'data 4     data 5     data 6    \n'
+            b'data 7     data 8     data 9    \n'
+            )
+        rows = list(parallel_read(self.table(data), [10, 10, 10], workers=2, chunksize=2))
+        self.assertEqual(rows, self.rows)
+
+    def test_full_borders(self):
+        data = (
+            b'+##########+##########+##########+\n'
+            b'|header 1  |  header 2| header 3 |\n'
+            b'+==========+==========+==========+\n'
+            b'|data 1    |    data 2|  data 3  |\n'
+            b'+----------+----------+----------+\n'
+            b'|data 4    |    data 5|  data 6  |\n'
+            b'+----------+----------+----------+\n'
+            b'|data 7    |    data 8|  data 9  |\n'
+            b'+__________+__________+__________+\n'
+            )
+        path = self.table(data)
+        rows = list(parallel_read(path, [10, 10, 10], dialect, workers=2, chunksize=1))
+        self.assertEqual(rows, self.rows)
+        rows = list(parallel_read(path, [10, 10, 10], dialect, workers=2, chunksize=2, ordered=False))
+        self.assertEqual(sorted(rows), self.rows)
+
+    def test_strict_row(self):
+        data = (
+            b'+##########+##########+##########+\n'
+            b'|header 1  |  header 2| header 3 |\n'
+            b'+==========+==========+==========+\n'
+            b'|data 1    |    data 2|  data 3  |\n'
+            b'+----------+----------+----------+\n'
+            b'|data 4    |    data 5|  data 6  |\n'
+            b'+----------+----------*----------+\n'
+            b'|data 7    |    data 8|  data 9  |\n'
+            b'+__________+__________+__________+\n'
+            )
+        with self.assertRaises(ValidationError):
+            list(parallel_read(self.table(data), [10, 10, 10], dialect, workers=2, chunksize=2))
+
+    def test_bounded(self):
+        submitted = list()
+        realpool = _parallel.multiprocessing.Pool
+
+        def pool(workers):
+            pool = realpool(workers)
+            apply_async = pool.apply_async
+            def counting(*args):
+                submitted.append(args)
+                return apply_async(*args)
+            pool.apply_async = counting
+            return pool
+
+        data = b'header    \n' + b''.join('{:<10}\n'.format(i).encode('ascii') for i in range(100))
+        _parallel.multiprocessing.Pool = pool
+        try:
+            rows = parallel_read(self.table(data), [10], workers=2, chunksize=1)
+            self.assertEqual(next(rows), ('0',))
+            # Only a window of chunks is submitted ahead of the consumer
+            self.assertLessEqual(len(submitted), 4)
+            self.assertEqual(list(rows), [(str(i),) for i in range(1, 100)])
+            self.assertEqual(len(submitted), 100)
+        finally:
+            _parallel.multiprocessing.Pool = realpool
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+import unittest
+from io import BytesIO
+
+from texttables.fixed import RandomAccessReader as reader
+from texttables import Dialect
+from texttables import ValidationError
+
+class FixedRandomAccessReaderTest(unittest.TestCase):
+    def run_asserts(self, reader):
+        self.assertEqual(reader.fieldnames, ('header 1', 'header 2', 'header 3'))
+        self.assertEqual(len(reader), 3)
+        self.assertEqual(reader[1], ('data 4', 'data 5', 'data 6'))
+        self.assertEqual(reader[-1], ('data 7', 'data 8', 'data 9'))
+        self.assertEqual(reader[0], ('data 1', 'data 2', 'data 3'))
+        self.assertEqual(reader[::2], [
+            ('data 1', 'data 2', 'data 3'),
+            ('data 7', 'data 8', 'data 9')])
+        self.assertEqual(list(reader), [
+            ('data 1', 'data 2', 'data 3'),
+            ('data 4', 'data 5', 'data 6'),
+            ('data 7', 'data 8', 'data 9')])
+        with self.assertRaises(IndexError):
+            reader[3]
+
+    def test_basic_table(self):
+        data = (
+            b'header 1   header 2   header 3  \n'
+            b'data 1     data 2     data 3    \n'
+            b'data 4     data 5     data 6    \n'
+            b'data 7     data 8     data 9    \n'
+            )
+        self.run_asserts(reader(BytesIO(data), [10, 10, 10]))
+
+    def test_no_final_terminator(self):
+        data = (
+            b'header 1   header 2   header 3  \r\n'
+            b'data 1     data 2     data 3    \r\n'
+            b'data 4     data 5     data 6    \r\n'
+            b'data 7     data 8     data 9    '
+            )
+        self.run_asserts(reader(BytesIO(data), [10, 10, 10]))
+
+    def test_full_borders(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            row_delimiter = '-'
+            top_border = '#'
+            bottom_border = '_'
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+            corner_border = '+'
+
+        data = (
+            b'+##########+##########+##########+\n'
+            b'|header 1  |  header 2| header 3 |\n'
+            b'+==========+==========+==========+\n'
+            b'|data 1    |    data 2|  data 3  |\n'
+            b'+----------+----------+----------+\n'
+            b'|data 4    |    data 5|  data 6  |\n'
+            b'+----------+----------+----------+\n'
+            b'|data 7    |    data 8|  data 9  |\n'
+            b'+__________+__________+__________+\n'
+            )
+        self.run_asserts(reader(BytesIO(data), [10, 10, 10], dialect=dialect))
+
+    def test_empty(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            bottom_border = '='
+            corner_border = ' '
+
+        data = (
+            b'header 1   header 2   header 3  \n'
+            b'========== ========== ==========\n'
+            b'========== ========== ==========\n'
+            )
+        r = reader(BytesIO(data), [10, 10, 10], dialect=dialect)
+        self.assertEqual(r.fieldnames, ('header 1', 'header 2', 'header 3'))
+        self.assertEqual(len(r), 0)
+        self.assertEqual(list(r), [])
+
+    def test_strict_size(self):
+        data = (
+            b'header 1   header 2   header 3  \n'
+            b'data 1     data 2     data 3    \n'
+            b'data 4     data 5     data 6\n'
+            )
+        with self.assertRaises(ValidationError):
+            reader(BytesIO(data), [10, 10, 10])
+
+    def test_strict_top(self):
+        class dialect(Dialect):
+            top_border = '#'
+            corner_border = ' '
+
+        data = (
+            b'header 1   header 2   header 3  \n'
+            b'data 1     data 2     data 3    \n'
+            )
+        with self.assertRaises(ValidationError):
+            reader(BytesIO(data), [10, 10, 10], dialect=dialect)
+
+    def test_strict_bottom(self):
+        class dialect(Dialect):
+            bottom_border = '_'
+            corner_border = ' '
+
+        data = (
+            b'header 1   header 2   header 3  \n'
+            b'data 1     data 2     data 3    \n'
+            b'data 4     data 5     data 6    \n'
+            b'data 7     data 8     data 9    \n'
+            )
+        with self.assertRaises(ValidationError):
+            reader(BytesIO(data), [10, 10, 10], dialect=dialect)
+
+if __name__ == '__main__':
+    unittest.main()
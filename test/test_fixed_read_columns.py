@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+import unittest
+from io import BytesIO
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from texttables.fixed import read_columns
+from texttables.fixed import _columns
+from texttables import Dialect
+from texttables import ValidationError
+
+class dialect(Dialect):
+    header_delimiter = '='
+    row_delimiter = '-'
+    top_border = '#'
+    bottom_border = '_'
+    left_border = '|'
+    cell_delimiter = '|'
+    right_border = '|'
+    corner_border = '+'
+
+data = (
+    b'+######+######+######+\n'
+    b'|name  | count| ratio|\n'
+    b'+======+======+======+\n'
+    b'|one   |     1|   0.5|\n'
+    b'+------+------+------+\n'
+    b'|two   |     2|  0.25|\n'
+    b'+------+------+------+\n'
+    b'|three |    30|     2|\n'
+    b'+______+______+______+\n'
+    )
+
+class FixedReadColumnsTest(unittest.TestCase):
+    @unittest.skipIf(numpy is None, 'NumPy is not available')
+    def test_dtypes(self):
+        columns = read_columns(BytesIO(data), [6, 6, 6], dialect, dtypes={'count': 'i8', 2: float})
+        self.assertEqual(list(columns), ['name', 'count', 'ratio'])
+        self.assertEqual(columns['name'].tolist(), [b'one', b'two', b'three'])
+        self.assertEqual(columns['count'].dtype, numpy.dtype('i8'))
+        self.assertEqual(columns['count'].tolist(), [1, 2, 30])
+        self.assertEqual(columns['ratio'].tolist(), [0.5, 0.25, 2.0])
+
+    @unittest.skipIf(numpy is None, 'NumPy is not available')
+    def test_columns_chunks(self):
+        chunks = read_columns(BytesIO(data), [6, 6, 6], dialect,
+            columns=[1, 0], dtypes=[None, int], chunksize=2, strip=False)
+        chunks = list(chunks)
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(list(chunks[0]), [' count', 'name  '])
+        self.assertEqual(chunks[0]['name  '].tolist(), [b'one   ', b'two   '])
+        self.assertEqual(chunks[1][' count'].tolist(), [30])
+
+    @unittest.skipIf(numpy is None, 'NumPy is not available')
+    def test_validation(self):
+        with self.assertRaises(ValidationError):
+            read_columns(BytesIO(data.replace(b'|    30', b'!    30')), [6, 6, 6], dialect)
+        with self.assertRaises(ValidationError):
+            read_columns(BytesIO(data.replace(b'+------+------+------+\n|three', b'+------+---x--+------+\n|three')), [6, 6, 6], dialect)
+        columns = read_columns(BytesIO(data.replace(b'|    30', b'!    30')), [6, 6, 6], dialect, strict=False)
+        self.assertEqual(columns['count'].tolist(), [b'1', b'2', b'30'])
+
+    @unittest.skipIf(numpy is None, 'NumPy is not available')
+    def test_empty(self):
+        columns = read_columns(BytesIO(data[:69] + data[-23:]), [6, 6, 6], dialect, dtypes={'count': int})
+        self.assertEqual(columns['name'].shape, (0,))
+        self.assertEqual(columns['count'].shape, (0,))
+
+    def test_fallback(self):
+        module = _columns.numpy
+        _columns.numpy = None
+        try:
+            columns = read_columns(BytesIO(data), [6, 6, 6], dialect, dtypes={'count': int})
+        finally:
+            _columns.numpy = module
+        self.assertEqual(columns['name'], ['one', 'two', 'three'])
+        self.assertEqual(columns['count'], [1, 2, 30])
+        self.assertEqual(columns['ratio'], ['0.5', '0.25', '2'])
+
+if __name__ == '__main__':
+    unittest.main()
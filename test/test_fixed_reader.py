@@ -4,7 +4,8 @@
 # This code is released under the license described in the LICENSE file
 
 import unittest
-from six import StringIO
+from datetime import date
+from six import StringIO, assertRaisesRegex
 
 from texttables.fixed import reader
 from texttables import Dialect
@@ -285,6 +286,34 @@ class FixedReaderTest(unittest.TestCase):
             )
         rows = [row for row in reader(data.splitlines(), [10, 10, 10], dialect=dialect)]
 
+    def test_garbage(self):
+        class dialect(Dialect):
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+            strict = False
+
+        data = (
+            '|header 1  |  header 2| header 3 |\n'
+            '|data 1    |    data 2|  data 3  |garbage|\n'
+            )
+        with self.assertRaises(ValidationError):
+            rows = [row for row in reader(data.splitlines(), [10, 10, 10], dialect=dialect)]
+
+    def test_short_row(self):
+        class dialect(Dialect):
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+            strict = False
+
+        data = (
+            '|header 1  |  header 2| header 3 |\n'
+            '|data 1    |    data 2|\n'
+            )
+        r = reader(data.splitlines(), [10, 10, 10], dialect=dialect)
+        self.assertEqual([row for row in r], [('data 1', 'data 2', '')])
+
     def test_strict_header(self):
         class dialect(Dialect):
             header_delimiter = '='
@@ -354,6 +383,171 @@ class FixedReaderTest(unittest.TestCase):
             )
         self.run_asserts(reader(data.splitlines(), [10, 10, 10], dialect=dialect))
 
+    def test_columns(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+            corner_border = '+'
+
+        data = (
+            '|header 1  |  header 2| header 3 |\n'
+            '+==========+==========+==========+\n'
+            '|data 1    |    data 2|  data 3  |\n'
+            '|data 4    |    data 5|  data 6  |\n'
+            )
+        r = reader(data.splitlines(), [10, 10, 10], dialect=dialect, columns=['header 3', 0])
+        self.assertEqual(r.fieldnames, ('header 3', 'header 1'))
+        self.assertEqual([row for row in r], [('data 3', 'data 1'), ('data 6', 'data 4')])
+
+        r = reader(data.splitlines()[2:], [10, 10, 10], dialect=dialect,
+            fieldnames=('header 1', 'header 2', 'header 3'), columns=[1])
+        self.assertEqual(r.fieldnames, ('header 2',))
+        self.assertEqual([row for row in r], [('data 2',), ('data 5',)])
+
+        with self.assertRaises(ValueError):
+            reader(data.splitlines(), [10, 10, 10], dialect=dialect, columns=['header 4']).fieldnames
+
+    def test_columns_validateall(self):
+        class dialect(Dialect):
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+
+        data = (
+            '|header 1  |  header 2| header 3 |\n'
+            '|data 1    |    data 2   data 3  |\n'
+            )
+        r = reader(data.splitlines(), [10, 10, 10], dialect=dialect, columns=[1], validateall=False)
+        self.assertEqual([row for row in r], [('data 2',)])
+
+        r = reader(data.splitlines(), [10, 10, 10], dialect=dialect, columns=[1])
+        with self.assertRaises(ValidationError):
+            rows = [row for row in r]
+
+    def test_where(self):
+        class dialect(Dialect):
+            row_delimiter = '-'
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+            corner_border = '+'
+
+        data = (
+            '|status    |  header 2| header 3 |\n'
+            '|FAIL      |    data 2|  data 3  |\n'
+            '+----------+----------+----------+\n'
+            '|PASS      |    data 5|  data 6  |\n'
+            '+----------+----------+----------+\n'
+            '|FAIL      |    data 8|  data 9  |\n'
+            )
+        r = reader(data.splitlines(), [10, 10, 10], dialect=dialect, where={'status': 'FAIL'})
+        self.assertEqual([row for row in r], [
+            ('FAIL', 'data 2', 'data 3'),
+            ('FAIL', 'data 8', 'data 9')])
+
+        r = reader(data.splitlines(), [10, 10, 10], dialect=dialect,
+            columns=['header 3'], where={0: 'FAIL', 1: lambda cell: cell.endswith('8')})
+        self.assertEqual([row for row in r], [('data 9',)])
+
+    def test_trusted(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            row_delimiter = '-'
+            top_border = '#'
+            bottom_border = '_'
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+            corner_border = '+'
+
+        data = (
+            '+##########+##########+##########+\n'
+            '|header 1  |  header 2| header 3 |\n'
+            '+==========+==========+==========+\n'
+            '|data 1    |    data 2|  data 3  |\n'
+            '+----------+----------+----------+\n'
+            '|data 4    |    data 5|  data 6  |\n'
+            '+__________+__________+__________+\n'
+            )
+        rows = [('data 1', 'data 2', 'data 3'), ('data 4', 'data 5', 'data 6')]
+        r = reader(StringIO(data), [10, 10, 10], dialect=dialect, trusted=True)
+        self.assertEqual(r.fieldnames, ('header 1', 'header 2', 'header 3'))
+        self.assertEqual(next(r), rows[0])
+        self.assertEqual([row for row in r], rows[1:])
+
+        r = reader(StringIO(data), [10, 10, 10], dialect=dialect, trusted=True,
+            columns=[1], where={0: 'data 4    '}, strip=False)
+        self.assertEqual(list(r), [('    data 5',)])
+
+        # The bottom is dropped by position without row delimiters
+        lines = [line for line in data.splitlines() if not line.startswith('+-')]
+        r = reader(lines, [10, 10, 10], dialect=dialect, row_delimiter=None, trusted=True)
+        self.assertEqual(list(r), rows)
+
+        # Nothing is validated
+        lines = [line.replace('|', '!') for line in lines]
+        r = reader(lines, [10, 10, 10], dialect=dialect, row_delimiter=None, trusted=True)
+        self.assertEqual(list(r), rows)
+
+        # Trusted rows are the same as validated ones, even from short lines
+        data = (
+            'a b cc\n'
+            '1 2 33\n'
+            '4 5 6\n'
+            )
+        for strip in (True, False):
+            trusted = list(reader(StringIO(data), [1, 1, 2], trusted=True, strip=strip))
+            validated = list(reader(StringIO(data), [1, 1, 2], strip=strip))
+            self.assertEqual(trusted, validated)
+            self.assertEqual(trusted[-1], ('4', '5', '6'))
+
+    def test_converters(self):
+        data = (
+            'name  count ratio flag  day       \n'
+            'one       1  0.5  yes   2017-03-12\n'
+            'two      -2  x    False 2017-03-13\n'
+            )
+        converters = {'count': int, 'ratio': float, 3: bool, 'day': date}
+        r = reader(data.splitlines(), [5, 5, 5, 5, 10], converters=converters, onerror='none')
+        self.assertEqual(list(r), [
+            ('one', 1, 0.5, True, date(2017, 3, 12)),
+            ('two', -2, None, False, date(2017, 3, 13))])
+
+        r = reader(data.splitlines(), [5, 5, 5, 5, 10], converters=[None, int, float], onerror='keep')
+        self.assertEqual(list(r), [
+            ('one', 1, 0.5, 'yes', '2017-03-12'),
+            ('two', -2, 'x', 'False', '2017-03-13')])
+
+        r = reader(data.splitlines(), [5, 5, 5, 5, 10], converters={'ratio': float}, trusted=True)
+        self.assertEqual(next(r), ('one', '1', 0.5, 'yes', '2017-03-12'))
+        with self.assertRaises(ValueError):
+            next(r)
+
+        r = reader(data.splitlines(), [5, 5, 5, 5, 10], columns=['day', 'count'],
+            converters={'count': lambda cell: int(cell) * 10, 'ratio': float})
+        self.assertEqual(list(r), [('2017-03-12', 10), ('2017-03-13', -20)])
+
+        with self.assertRaises(ValueError):
+            reader(data.splitlines(), [5, 5, 5, 5, 10], onerror='ignore')
+
+        # Each converter runs once for each cell, even in a row where another
+        # cell fails to convert
+        for onerror, expected in (('none', None), ('keep', 'x')):
+            calls = []
+            def count(cell):
+                calls.append(cell)
+                return int(cell)
+            r = reader(data.splitlines(), [5, 5, 5, 5, 10], converters={'count': count, 'ratio': float}, onerror=onerror)
+            self.assertEqual([row[1:3] for row in r], [(1, 0.5), (-2, expected)])
+            self.assertEqual(calls, ['1', '-2'])
+
+        r = reader(data.splitlines(), [5, 5, 5, 5, 10], converters={'ratio': float})
+        next(r)
+        with assertRaisesRegex(self, ValueError, "'x' in field u?'ratio'"):
+            next(r)
+
     def test_nofieldnames(self):
         class dialect(Dialect):
             header_delimiter = '='
@@ -7,6 +7,7 @@ import unittest
 from six import StringIO
 
 from texttables.fixed import writer
+from texttables.fixed import _columns
 from texttables import Dialect
 
 class FixedWriterTest(unittest.TestCase):
@@ -148,5 +149,138 @@ class FixedWriterTest(unittest.TestCase):
             )
         self.assertEqual(data, output.getvalue())
 
+    def test_writerows_chunks(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            row_delimiter = '-'
+            corner_border = ' '
+
+        class output(StringIO):
+            writes = 0
+            def write(self, data):
+                self.writes += 1
+                return StringIO.write(self, data)
+        output = output()
+
+        with writer(output, [10, 10, 10], dialect=dialect) as w:
+            w.writeheader(('header 1', 'header 2', 'header 3'))
+            w.writerows([
+                ('data 1', 'data 2', 'data 3'),
+                ('data 4', 'data 5', 'data 6'),
+                ('data 7', 'data 8', 'data 9')], chunksize=2)
+            w.writerows([('data 10', 'data 11', 'data 12')])
+
+        data = (
+            'header 1   header 2   header 3  \n'
+            '========== ========== ==========\n'
+            'data 1     data 2     data 3    \n'
+            '---------- ---------- ----------\n'
+            'data 4     data 5     data 6    \n'
+            '---------- ---------- ----------\n'
+            'data 7     data 8     data 9    \n'
+            '---------- ---------- ----------\n'
+            'data 10    data 11    data 12   \n'
+            )
+        self.assertEqual(data, output.getvalue())
+        # One write for the header, two for the first call, one for the second
+        self.assertEqual(output.writes, 4)
+
+    def test_dialect_assignment(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            row_delimiter = '-'
+            top_border = '#'
+            bottom_border = '_'
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+            corner_border = '+'
+        output = StringIO()
+
+        data = (
+            '+##########+##########+##########+\n'
+            '|header 1  |  header 2| header 3 |\n'
+            '+==========+==========+==========+\n'
+            '|data 1    |    data 2|  data 3  |\n'
+            '+----------+----------+----------+\n'
+            '|data 4    |    data 5|  data 6  |\n'
+            '+__________+__________+__________+\n'
+            )
+        w = writer(output, [10, '>10', '^10'])
+        w.dialect = dialect
+        self.run_asserts(w, data, output)
+
+    def test_writecolumns(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            row_delimiter = '-'
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+
+        data = (
+            '|header 1  |  header 2| header 3 |\n'
+            '+==========+==========+==========+\n'
+            '|data 1    |         1|   2.5    |\n'
+            '+----------+----------+----------+\n'
+            '|data 4 is |        -5|   True   |\n'
+            '+----------+----------+----------+\n'
+            '|data 7    |         8|  data 9  |\n'
+            )
+        module = _columns.numpy
+        for numpy in (module, None):
+            _columns.numpy = numpy
+            try:
+                output = StringIO()
+                with writer(output, [10, '>10', '^10'], dialect=dialect) as w:
+                    w.writeheader(('header 1', 'header 2', 'header 3'))
+                    w.writecolumns([['data 1', 'data 4 is too long'], [1, -5], [2.5, True]], chunksize=1)
+                    w.writecolumns([['data 7'], [8], ['data 9']])
+                    with self.assertRaises(ValueError):
+                        w.writecolumns([['data 10'], []])
+            finally:
+                _columns.numpy = module
+            self.assertEqual(data, output.getvalue())
+
+    def test_workers(self):
+        class dialect(Dialect):
+            top_border = '-'
+            bottom_border = '-'
+            header_delimiter = '='
+            row_delimiter = '-'
+            corner_border = '+'
+            cell_delimiter = '|'
+
+        rows = [('row {}'.format(i), i, i / 4) for i in range(100)]
+        outputs = list()
+        for workers in (None, 2):
+            output = StringIO()
+            with writer(output, [10, '>10', '^10'], dialect=dialect) as w:
+                w.writerows(rows[:3], chunksize=7, workers=workers)
+                w.writeheader(('header 1', 'header 2', 'header 3'))
+                w.writerows(rows[3:50], chunksize=7, workers=workers)
+                w.writerows(iter(rows[50:]), chunksize=7, workers=workers)
+                w.writerows([], workers=workers)
+            outputs.append(output.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_format_characters(self):
+        class dialect(Dialect):
+            left_border = '{'
+            cell_delimiter = '}{'
+            right_border = '}'
+        output = StringIO()
+
+        data = (
+            '{header 1  }{  header 2}{ header 3 }\n'
+            '{{data}    }{         1}{   2.5    }\n'
+            '{data 4    }{    data 5}{  data 6  }\n'
+            )
+        with writer(output, [10, '>10', '^10'], dialect=dialect) as w:
+            w.writeheader(('header 1', 'header 2', 'header 3'))
+            w.writerow(('{data}', 1, 2.5))
+            w.writerow(('data 4', 'data 5', 'data 6'))
+        self.assertEqual(data, output.getvalue())
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+import unittest
+from itertools import chain, islice
+from six import StringIO
+
+from texttables import Dialect, Sniffer, ValidationError
+from texttables.fixed import reader, writer
+
+class SnifferTest(unittest.TestCase):
+    def setUp(self):
+        Sniffer.clear()
+
+    def roundtrip(self, dialect, widths, rows=5, lines=20):
+        output = StringIO()
+        with writer(output, widths, dialect=dialect) as w:
+            w.writeheader(('header 1', 'header 2', 'header 3'))
+            for i in range(rows):
+                w.writerow(('data {}'.format(i), 'data', 'more data'))
+        sniffed, sniffedwidths = Sniffer(lines).sniff(output.getvalue())
+        self.assertEqual(sniffedwidths, tuple(widths))
+        for attribute in ('header_delimiter', 'row_delimiter', 'cell_delimiter',
+                'left_border', 'right_border', 'top_border', 'bottom_border',
+                'corner_border'):
+            self.assertEqual(getattr(sniffed, attribute), getattr(dialect, attribute), attribute)
+        r = reader(output.getvalue().splitlines(), sniffedwidths, dialect=sniffed)
+        self.assertEqual(r.fieldnames, ('header 1', 'header 2', 'header 3'))
+        self.assertEqual(len(list(r)), rows)
+
+    def test_full_borders(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            row_delimiter = '-'
+            top_border = '#'
+            bottom_border = '_'
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+            corner_border = '+'
+
+        self.roundtrip(dialect, [10, 12, 10])
+
+    def test_rst(self):
+        class dialect(Dialect):
+            header_delimiter = '='
+            top_border = '='
+            bottom_border = '='
+            corner_border = ' '
+
+        self.roundtrip(dialect, [10, 8, 11])
+
+    def test_header_only(self):
+        class dialect(Dialect):
+            header_delimiter = '-'
+            cell_delimiter = '|'
+
+        self.roundtrip(dialect, [9, 9, 9])
+
+    def test_prefix(self):
+        class dialect(Dialect):
+            top_border = '-'
+            bottom_border = '-'
+            left_border = '|'
+            cell_delimiter = '|'
+            right_border = '|'
+
+        # The bottom isn't read, so it's taken to be the top
+        self.roundtrip(dialect, [10, 10, 10], rows=50, lines=10)
+
+    def test_stream(self):
+        data = (
+            '+--------+--------+\n'
+            '|a       |b       |\n'
+            '+--------+--------+\n'
+            )
+        stream = iter(StringIO(data))
+        sample = list(islice(stream, 2))
+        dialect, widths = Sniffer(2).sniff(sample)
+        self.assertEqual(widths, (8, 8))
+        self.assertEqual(dialect.lineterminator, '\n')
+        r = reader(chain(sample, stream), widths, dialect=dialect, fieldnames=('x', 'y'))
+        self.assertEqual(list(r), [('a', 'b')])
+
+    def test_cache_collision(self):
+        class line(str):
+            # Every line hashes the same, so both prefixes do too
+            def __hash__(self):
+                return 0
+
+        first = [line('========== ==========\n'), line('header 1   header 2  \n'), line('========== ==========\n')]
+        second = [line('===== =====\n'), line('head1 head2\n'), line('===== =====\n')]
+        self.assertEqual(hash((True, tuple(first))), hash((True, tuple(second))))
+        self.assertEqual(Sniffer().sniff(first)[1], (10, 10))
+        self.assertEqual(Sniffer().sniff(second)[1], (5, 5))
+
+    def test_cache(self):
+        data = (
+            '========== ==========\n'
+            'header 1   header 2  \n'
+            '========== ==========\n'
+            )
+        first, widths = Sniffer().sniff(data)
+        self.assertEqual(len(Sniffer._cache), 1)
+        second, cachedwidths = Sniffer().sniff(data)
+        self.assertEqual(len(Sniffer._cache), 1)
+        self.assertEqual(widths, cachedwidths)
+        # Each sniff gets its own dialect
+        self.assertIsNot(first, second)
+        first.top_border = '#'
+        self.assertEqual(Sniffer().sniff(data)[0].top_border, '=')
+
+    def test_no_delimiters(self):
+        data = (
+            'header 1   header 2  \n'
+            'data 1     data 2    \n'
+            )
+        with self.assertRaises(ValidationError):
+            Sniffer().sniff(data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,9 +15,10 @@ __modulename__ = 'texttables'
 __version__ = '1.0.1'
 __website__ = 'https://github.com/Taywee/texttables'
 
-__all__ = ['fixed', 'dynamic', 'ValidationError', 'Dialect']
+__all__ = ['fixed', 'dynamic', 'ValidationError', 'Dialect', 'CompiledDialect', 'Sniffer']
 
 from .errors import ValidationError
 from . import fixed
 from . import dynamic
-from .dialect import Dialect
+from .dialect import Dialect, CompiledDialect
+from .sniffer import Sniffer
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+import sys
+
+if sys.version_info < (3, 5):
+    raise ImportError('texttables.aio requires Python 3.5 or later')
+
+__all__ = [
+    'fixed',
+    'dynamic',
+    ]
+
+from . import fixed, dynamic
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+from collections import deque
+from inspect import isawaitable
+import asyncio
+import codecs
+
+class Lines(object):
+    '''The lines of a stream, such as an :class:`asyncio.StreamReader`, or of
+    an async iterable of lines, each decoded if it is bytes and stripped of its
+    line terminator.  A stream with a ``read`` coroutine is read a chunk at a
+    time, and split into lines in memory, rather than awaited once per line.'''
+
+    def __init__(self, stream, encoding, chunksize=65536):
+        self._encoding = encoding
+        self._chunksize = chunksize
+        self._read = getattr(stream, 'read', None)
+        self._iter = None
+        if self._read is None:
+            self._iter = stream.__aiter__()
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._lines = deque()
+        self._tail = ''
+        self._eof = False
+
+    async def _fill(self):
+        if self._iter is not None:
+            try:
+                line = await self._iter.__anext__()
+            except StopAsyncIteration:
+                self._eof = True
+                return
+            if isinstance(line, bytes):
+                line = line.decode(self._encoding)
+            self._lines.append(line.strip('\r\n'))
+            return
+
+        data = await self._read(self._chunksize)
+        if isinstance(data, bytes):
+            text = self._decoder.decode(data, final=not data)
+        else:
+            text = data
+        if not data:
+            self._eof = True
+        lines = (self._tail + text).split('\n')
+        self._tail = lines.pop()
+        if self._eof and self._tail:
+            lines.append(self._tail)
+        self._lines.extend(line.strip('\r\n') for line in lines)
+
+    def pushback(self, lines):
+        '''Put lines that were read back, to be read again in order'''
+        self._lines.extendleft(reversed(lines))
+
+    async def readline(self):
+        '''Get the next line, or None at the end of the stream'''
+        lines = self._lines
+        while not lines:
+            if self._eof:
+                return None
+            await self._fill()
+        return lines.popleft()
+
+class Sink(object):
+    '''A file object that only collects what is written to it, so that a
+    synchronous writer can format into it without blocking'''
+
+    def __init__(self):
+        self._parts = list()
+        self.size = 0
+
+    def write(self, text):
+        self._parts.append(text)
+        self.size += len(text)
+
+    def take(self):
+        '''Get everything written so far, and empty the sink'''
+        text = ''.join(self._parts)
+        self._parts = list()
+        self.size = 0
+        return text
+
+async def send(stream, text, encoding, batchsize):
+    '''Write text out to a stream, such as an :class:`asyncio.StreamWriter`, a
+    batch at a time, encoding it unless the encoding is None, and awaiting the
+    stream's ``drain`` coroutine after each batch, if it has one.  A ``write``
+    that is itself a coroutine is awaited.  The event loop gets a turn after
+    every batch, even if the stream never applies backpressure.'''
+    drain = getattr(stream, 'drain', None)
+    for start in range(0, len(text), batchsize):
+        data = text[start:start + batchsize]
+        if encoding is not None:
+            data = data.encode(encoding)
+        result = stream.write(data)
+        if isawaitable(result):
+            await result
+        if drain is not None:
+            await drain()
+        await asyncio.sleep(0)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+
+from texttables.dialect import CompiledDialect
+from texttables.errors import ValidationError
+from texttables.fixed import reader as fixedreader
+from texttables.dynamic import writer as dynamicwriter
+from texttables.dynamic._reader import _delimiterwidths
+from . import fixed
+
+class reader(fixed.reader):
+
+    """Asynchronous dynamic-table table reader, reading tables with
+    column-sizes inferred from the table itself, as
+    :class:`texttables.dynamic.reader` does, from a stream or an async iterable
+    of lines, as :class:`texttables.aio.fixed.reader` does.  The widths are
+    inferred when the table is first read, by :meth:`readfieldnames` or
+    iteration, so they and the dialect are only available from then on.
+
+    Reading the field names can raise a :class:`texttables.ValidationError`
+    if the widths can't be inferred, and iteration can raise one if an invalid
+    table is read."""
+
+    def __init__(self, stream, dialect=None, fieldnames=None, sample=10, encoding='utf-8', chunksize=65536, **fmtparams):
+        """
+        :param stream: A stream or an async iterable of lines, as with
+            :class:`texttables.aio.fixed.reader`.
+        :param encoding: The encoding of the stream.
+        :param chunksize: The number of bytes to read from a stream at a time.
+
+        All the other parameters are as with :class:`texttables.dynamic.reader`.
+        """
+        super(reader, self).__init__(stream, None, encoding=encoding, chunksize=chunksize)
+        self._dialectarg = dialect
+        self._fieldnamesarg = fieldnames
+        self._sample = sample
+        self._fmtparams = fmtparams
+
+    async def _prepare(self):
+        if self._parser is not None:
+            return
+        merged = CompiledDialect.compile(self._dialectarg, **self._fmtparams)
+
+        peeked = list()
+        widths = None
+        while len(peeked) < self._sample:
+            line = await self._lines.readline()
+            if line is None:
+                break
+            peeked.append(line)
+            widths = _delimiterwidths(line, merged)
+            if widths is not None:
+                break
+
+        if widths is None:
+            raise ValidationError('The column widths of the table could not be inferred from its first lines')
+
+        self._lines.pushback(peeked)
+        self._parser = fixedreader((), widths, merged, self._fieldnamesarg, **self._fmtparams)
+        self._start()
+
+class writer(object):
+
+    """Asynchronous dynamic-table document writer, writing tables with computed
+    column-sizes to a stream, such as an :class:`asyncio.StreamWriter`.  Rows
+    are held by a :class:`texttables.dynamic.writer`, spilling them to a
+    temporary file with a buffer size, until :meth:`finish`, which writes them
+    out through a :class:`texttables.aio.fixed.writer`.  Rows are formatted a
+    chunk at a time and written out a batch at a time, awaiting the stream's
+    ``drain`` after each batch, so neither the event loop nor the memory of the
+    whole formatted table is held at once.
+
+    Every method is a coroutine, so that this may be used in place of
+    :class:`texttables.aio.fixed.writer`.  This works as an async context
+    manager, in which case :meth:`finish` will be called automatically."""
+
+    def __init__(self, stream, alignments=None, dialect=None, buffersize=None, encoding='utf-8', batchsize=65536, **fmtparams):
+        """
+        :param stream: A stream, as with :class:`texttables.aio.fixed.writer`.
+        :param encoding: The encoding to write, or None to write text.
+        :param batchsize: The number of characters to write at a time.
+
+        All the other parameters are as with :class:`texttables.dynamic.writer`.
+        """
+        self._stream = stream
+        self._encoding = encoding
+        self._batchsize = batchsize
+        # Only the rows and widths of the writer are used, and it never
+        # writes to its file
+        self._writer = dynamicwriter(None, alignments, dialect, buffersize, **fmtparams)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self.finish()
+
+    @property
+    def stream(self):
+        '''The stream that was passed in to the constructor.'''
+        return self._stream
+
+    @property
+    def dialect(self):
+        return self._writer.dialect
+
+    @dialect.setter
+    def dialect(self, value):
+        self._writer.dialect = value
+
+    @property
+    def widths(self):
+        return self._writer.widths
+
+    async def writeheader(self, header):
+        '''Set the header to be written out'''
+        self._writer.writeheader(header)
+
+    async def writerow(self, row):
+        '''Add a row to be written out, as with
+        :meth:`texttables.dynamic.writer.writerow`.
+
+        :param row: an iterable representing a row to write
+        '''
+        self._writer.writerow(row)
+
+    async def writerows(self, rows):
+        '''Add rows to be written out, as with
+        :meth:`texttables.dynamic.writer.writerows`.
+
+        :param rows: An iterable or async iterable of rows to write
+        '''
+        if hasattr(rows, '__aiter__'):
+            async for row in rows:
+                self._writer.writerow(row)
+        else:
+            self._writer.writerows(rows)
+
+    async def finish(self):
+        '''Write the whole table out to :attr:`stream`, as with
+        :meth:`texttables.dynamic.writer.finish`.'''
+        held = self._writer
+        w = fixed.writer(self._stream, held._fixedwidths(), held._dialect, self._encoding, self._batchsize, **held._fmtparams)
+        async with w:
+            if held._header is not None:
+                await w.writeheader(held._header)
+            for rows in held._spilled():
+                await w.writerows(rows)
+            await w.writerows(held._rows)
+        held._discard()
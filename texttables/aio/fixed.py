@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+from itertools import islice
+
+from texttables.errors import ValidationError
+from texttables.fixed import reader as fixedreader
+from texttables.fixed import writer as fixedwriter
+from texttables.fixed import DictWriter as fixedDictWriter
+from texttables.fixed._reader import ROWTYPES, rowmaker
+from ._io import Lines, Sink, send
+
+class reader(object):
+
+    """Asynchronous fixed-table table reader, reading tables with predefined
+    column-sizes from a stream, such as an :class:`asyncio.StreamReader`, or an
+    async iterable of lines.  Each line is parsed and validated by a
+    :class:`texttables.fixed.reader`, exactly as a synchronous table is.  This
+    is an async iterable, returning rows from the table as tuples.
+
+    Iteration can raise a :class:`texttables.ValidationError` if an invalid
+    table is read."""
+
+    def __init__(self, stream, widths, dialect=None, fieldnames=None, columns=None, validateall=True, where=None, converters=None, onerror='raise', encoding='utf-8', chunksize=65536, **fmtparams):
+        """
+        :param stream: Either an object with a ``read`` coroutine taking a
+            number of bytes, such as an :class:`asyncio.StreamReader`, or an
+            async iterable of lines.  Bytes are decoded.
+        :param encoding: The encoding of the stream.
+        :param chunksize: The number of bytes to read from a stream at a time.
+
+        All the other parameters are as with :class:`texttables.fixed.reader`.
+        """
+        self._stream = stream
+        self._lines = Lines(stream, encoding, chunksize)
+        self._parser = None
+        self._ready = False
+        if widths is not None:
+            self._parser = fixedreader((), widths, dialect, fieldnames, columns, validateall, where, False, converters, onerror, **fmtparams)
+            self._start()
+
+    def _start(self):
+        '''Set up the state of the table once the parser is built'''
+        compiled = self._parser.compiled
+        self._foundtop = not compiled.top_border
+        if self._parser._fieldnames:
+            self._foundheader = True
+        else:
+            self._foundheader = not compiled.header_delimiter
+        self._foundbottom = not compiled.bottom_border
+        self._finished = False
+        self._firstline = True
+        self._ready = False
+
+    async def _prepare(self):
+        '''Build the parser, if it must first read from the stream'''
+
+    @property
+    def stream(self):
+        '''The stream that was passed in to the constructor.'''
+        return self._stream
+
+    @property
+    def widths(self):
+        '''The widths of the table, as a tuple, with any alignments
+        stripped.'''
+        if self._parser is None:
+            return None
+        return self._parser.widths
+
+    @property
+    def dialect(self):
+        '''The :class:`texttables.Dialect` constructed from the passed-in
+        dialect, as with :attr:`texttables.fixed.reader.dialect`.'''
+        return self._parser.dialect
+
+    @property
+    def compiled(self):
+        '''The :class:`texttables.CompiledDialect` that the table is actually
+        read with.'''
+        return self._parser.compiled
+
+    @property
+    def fieldnames(self):
+        '''The table's fieldnames as a tuple, or None if they haven't been read
+        yet.  Use :meth:`readfieldnames` to read them.'''
+        if self._parser is None:
+            return None
+        return self._parser._fieldnames or None
+
+    async def readfieldnames(self):
+        '''Read the table's fieldnames as a tuple, if they haven't been read
+        yet, as with :attr:`texttables.fixed.reader.fieldnames`.  Returns None
+        if the stream ends first.
+
+        :raises texttables.ValidationError: if the table does not properly match the dialect
+        '''
+        await self._prepare()
+        parser = self._parser
+        layout = parser._layout
+
+        if not self._foundtop:
+            line = await self._lines.readline()
+            if line is None:
+                return None
+            if parser._strict and line != layout.top:
+                raise ValidationError('The first line of the table did not match what the top of the table should be')
+            self._foundtop = True
+
+        if not parser._fieldnames:
+            line = await self._lines.readline()
+            if line is None:
+                return None
+            parser._fieldnames = parser._getline(line)
+            parser._project(parser._fieldnames)
+            layout = parser._layout
+
+        if not self._foundheader:
+            line = await self._lines.readline()
+            if line is None:
+                return None
+            if parser._strict and line != layout.header:
+                raise ValidationError("The header of the table wasn't properly delimited")
+            self._foundheader = True
+
+        self._ready = True
+        return parser._fieldnames
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._ready:
+            if await self.readfieldnames() is None:
+                raise StopAsyncIteration
+
+        parser = self._parser
+        layout = parser._layout
+        readline = self._lines.readline
+
+        # Rows filtered out by where are parsed as None, and skipped
+        row = None
+        while row is None:
+            if self._finished:
+                raise StopAsyncIteration
+
+            line = await readline()
+            if line is not None:
+                if layout.rowdelimiter:
+                    # Deal with alternating delimiters
+                    if not self._firstline:
+                        if line != layout.rowdelimiter:
+                            if line == layout.bottom:
+                                self._foundbottom = True
+                                line = None
+                            elif parser._strict:
+                                raise ValidationError("This row wasn't properly delimited")
+                        if line is not None:
+                            line = await readline()
+                elif line == layout.bottom:
+                    self._foundbottom = True
+                    line = None
+
+            if line is None:
+                self._finished = True
+                # As with the synchronous reader, a missing bottom can't be
+                # detected if it matches the row delimiter
+                if parser._strict and not (self._foundbottom or layout.rowdelimiter == layout.bottom):
+                    raise ValidationError("This table wasn't properly terminated")
+                raise StopAsyncIteration
+
+            self._firstline = False
+            row = parser._getline(line)
+        return row
+
+class DictReader(object):
+
+    """Asynchronous fixed-table table dictionary reader, as
+    :class:`texttables.fixed.DictReader` is to :class:`texttables.fixed.reader`.
+    This is an async iterable, returning rows from the table as dictionaries,
+    or as the lighter :class:`texttables.fixed.Row` or
+    :class:`texttables.fixed.LazyRow`."""
+
+    def __init__(self, stream, widths, dialect=None, fieldnames=None, columns=None, validateall=True, where=None, converters=None, onerror='raise', encoding='utf-8', chunksize=65536, rowtype='dict', **fmtparams):
+        """
+        All the passed in construction parameters but :obj:`rowtype` are
+        passed to the :class:`texttables.aio.fixed.reader` constructor
+        literally.  :obj:`rowtype` is as with
+        :class:`texttables.fixed.DictReader`.
+        """
+        if rowtype not in ROWTYPES:
+            raise ValueError('rowtype must be one of dict, row, or lazy')
+        self._reader = reader(stream, widths, dialect, fieldnames, columns, validateall, where, converters, onerror, encoding, chunksize, **fmtparams)
+        self._rowtype = rowtype
+        self._prepared = False
+        self._make = None
+
+    @property
+    def stream(self):
+        return self._reader.stream
+
+    @property
+    def widths(self):
+        return self._reader.widths
+
+    @property
+    def dialect(self):
+        return self._reader.dialect
+
+    @property
+    def compiled(self):
+        return self._reader.compiled
+
+    @property
+    def fieldnames(self):
+        return self._reader.fieldnames
+
+    async def readfieldnames(self):
+        return await self._reader.readfieldnames()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._prepared:
+            if await self._reader.readfieldnames() is None:
+                raise StopAsyncIteration
+            self._make = rowmaker(self._reader._parser, self._rowtype)
+            self._prepared = True
+        row = await self._reader.__anext__()
+        if self._make is None:
+            return row
+        return self._make(row)
+
+class writer(object):
+
+    """Asynchronous fixed-table document writer, writing tables with predefined
+    column-sizes to a stream, such as an :class:`asyncio.StreamWriter`.  Rows
+    are formatted by a :class:`texttables.fixed.writer` into memory, and the
+    formatted lines are written out a batch at a time, awaiting the stream's
+    ``drain`` after each batch, so that a slow reader applies backpressure and
+    a large table never blocks the event loop.  Call :meth:`flush` to write out
+    what is batched.
+
+    Every method that writes is a coroutine.  This works as an async context
+    manager, in which case :meth:`writetop` and :meth:`writebottom` will be
+    called automatically, and everything is flushed on exit."""
+
+    def __init__(self, stream, widths, dialect=None, encoding='utf-8', batchsize=65536, **fmtparams):
+        """
+        :param stream: An object with a ``write`` method, such as an
+            :class:`asyncio.StreamWriter`, which may be a coroutine, and
+            optionally a ``drain`` coroutine.
+        :param encoding: The encoding to write, or None to write text.
+        :param batchsize: The number of characters to batch before each
+            write.
+
+        All the other parameters are as with :class:`texttables.fixed.writer`.
+        """
+        self._stream = stream
+        self._encoding = encoding
+        self._batchsize = batchsize
+        self._sink = Sink()
+        self._writer = self._build(widths, dialect, fmtparams)
+
+    def _build(self, widths, dialect, fmtparams):
+        return fixedwriter(self._sink, widths, dialect, **fmtparams)
+
+    async def __aenter__(self):
+        if self.compiled.top_border:
+            await self.writetop()
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        if self.compiled.bottom_border:
+            await self.writebottom()
+        await self.flush()
+
+    @property
+    def stream(self):
+        '''The stream that was passed in to the constructor.'''
+        return self._stream
+
+    @property
+    def widths(self):
+        return self._writer.widths
+
+    @property
+    def dialect(self):
+        return self._writer.dialect
+
+    @dialect.setter
+    def dialect(self, value):
+        self._writer.dialect = value
+
+    @property
+    def compiled(self):
+        return self._writer.compiled
+
+    async def flush(self):
+        '''Write out everything batched.'''
+        text = self._sink.take()
+        if text:
+            await send(self._stream, text, self._encoding, self._batchsize)
+
+    async def _wrote(self):
+        if self._sink.size >= self._batchsize:
+            await self.flush()
+
+    async def writerow(self, row):
+        '''Write a single row, as with
+        :meth:`texttables.fixed.writer.writerow`.
+
+        :param row: An iterable representing the row to write
+        '''
+        self._writer.writerow(row)
+        await self._wrote()
+
+    async def writerows(self, rows, chunksize=1024):
+        '''Write multiple rows, as with
+        :meth:`texttables.fixed.writer.writerows`, formatting them in
+        chunks.
+
+        :param rows: An iterable or async iterable of rows to write
+        :param chunksize: The number of rows to format at a time
+        '''
+        writerows = self._writer.writerows
+        if hasattr(rows, '__aiter__'):
+            chunk = list()
+            async for row in rows:
+                chunk.append(row)
+                if len(chunk) == chunksize:
+                    writerows(chunk, chunksize)
+                    chunk = list()
+                    await self._wrote()
+            writerows(chunk, chunksize)
+        else:
+            rows = iter(rows)
+            while True:
+                chunk = list(islice(rows, chunksize))
+                if not chunk:
+                    break
+                writerows(chunk, chunksize)
+                await self._wrote()
+        await self._wrote()
+
+    async def writeheader(self, row):
+        '''Write the header.
+
+        :param row: An iterable representing the row to write as a header
+        '''
+        self._writer.writeheader(row)
+        await self._wrote()
+
+    async def writetop(self):
+        '''Write the top of the table.'''
+        self._writer.writetop()
+        await self._wrote()
+
+    async def writebottom(self):
+        '''Write the bottom of the table.'''
+        self._writer.writebottom()
+        await self._wrote()
+
+class DictWriter(writer):
+
+    """Asynchronous fixed-table document writer, writing tables with predefined
+    column-sizes and names through dictionary rows passed in, as
+    :class:`texttables.fixed.DictWriter` is to
+    :class:`texttables.fixed.writer`.  Otherwise, this works as
+    :class:`texttables.aio.fixed.writer` does."""
+
+    def __init__(self, stream, fieldnames, widths, dialect=None, encoding='utf-8', batchsize=65536, **fmtparams):
+        """
+        All the passed in construction parameters are as with
+        :class:`texttables.fixed.DictWriter` and
+        :class:`texttables.aio.fixed.writer`.
+        """
+        self._fieldnames = fieldnames
+        super(DictWriter, self).__init__(stream, widths, dialect, encoding, batchsize, **fmtparams)
+
+    def _build(self, widths, dialect, fmtparams):
+        return fixedDictWriter(self._sink, self._fieldnames, widths, dialect, **fmtparams)
+
+    @property
+    def fieldnames(self):
+        return self._writer.fieldnames
+
+    @fieldnames.setter
+    def fieldnames(self, value):
+        self._writer.fieldnames = value
+
+    async def writeheader(self):
+        '''Write the header based on :attr:`fieldnames`.'''
+        self._writer.writeheader()
+        await self._wrote()
@@ -4,6 +4,8 @@
 # This code is released under the license described in the LICENSE file
 
 from __future__ import division, absolute_import, print_function, unicode_literals
+from operator import attrgetter
+from six.moves import zip
 import six
 
 class Dialect(object):
@@ -52,3 +54,131 @@ class Dialect(object):
     #: Whether to strip fields on reads.  This is usually desired, especially
     #: for DictReader types.
     strip = True
+
+class _FrozenDialect(Dialect):
+    """The :class:`Dialect` got from the ``dialect`` of a reader or writer.
+    They are compiled from their dialect when it is assigned, so they would
+    silently ignore any change to it in place, which this refuses instead."""
+
+    def __init__(self, compiled):
+        setattribute = object.__setattr__
+        for attribute, value in zip(ATTRIBUTES, compiled._values):
+            setattribute(self, attribute, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(_FROZEN)
+
+    def __delattr__(self, name):
+        raise AttributeError(_FROZEN)
+
+_FROZEN = ("The dialect of a reader or writer can't be changed in place.  "
+    "Assign a new dialect to it instead, such as one built with compiled.todialect()")
+
+#: The names of every attribute of a :class:`Dialect`
+ATTRIBUTES = (
+    'header_delimiter',
+    'row_delimiter',
+    'cell_delimiter',
+    'left_border',
+    'right_border',
+    'top_border',
+    'bottom_border',
+    'corner_border',
+    'lineterminator',
+    'strict',
+    'strip',
+    )
+
+_getvalues = attrgetter(*ATTRIBUTES)
+
+class CompiledDialect(object):
+    """An immutable snapshot of the attributes of a :class:`Dialect`, which is
+    what readers and writers actually work from.  It has the same attributes as
+    a dialect, but they can't be changed, and it is hashable and compares equal
+    to any other compiled dialect with the same attributes.
+
+    These are built with :meth:`compile`, which returns the same object for
+    the same attributes, so building one for a dialect that has been seen
+    before is a single lookup."""
+
+    __slots__ = ATTRIBUTES + ('_values', '_hash')
+
+    #: The most compiled dialects kept for reuse
+    cachesize = 1024
+
+    _cache = dict()
+
+    def __init__(self, values):
+        """
+        :param values: A tuple of the values of every attribute, in the order
+            of :data:`ATTRIBUTES`.  Use :meth:`compile` instead.
+        """
+        setattribute = object.__setattr__
+        for attribute, value in zip(ATTRIBUTES, values):
+            setattribute(self, attribute, value)
+        setattribute(self, '_values', values)
+        setattribute(self, '_hash', hash(values))
+
+    @classmethod
+    def compile(cls, dialect=None, **fmtparams):
+        '''Get the compiled dialect of a dialect class or object, with any of
+        its attributes overridden.
+
+        :param dialect: A dialect class or object.  All the attributes of
+            Dialect are grabbed from this object using getattr.  None for the
+            attributes of :class:`Dialect`.
+        :param fmtparams: parameters to override the parameters in
+            :obj:`dialect`.  Anything that isn't an attribute of a dialect is
+            ignored.
+        '''
+        if dialect is None:
+            dialect = Dialect
+        elif isinstance(dialect, CompiledDialect) and not fmtparams:
+            return dialect
+
+        values = _getvalues(dialect)
+        if fmtparams:
+            values = tuple(fmtparams[attribute] if attribute in fmtparams else value
+                for attribute, value in zip(ATTRIBUTES, values))
+
+        compiled = cls._cache.get(values)
+        if compiled is None:
+            compiled = cls(values)
+            if len(cls._cache) >= cls.cachesize:
+                cls._cache.clear()
+            cls._cache[values] = compiled
+        return compiled
+
+    def todialect(self):
+        '''Build a new, mutable :class:`Dialect` with these attributes.'''
+        dialect = Dialect()
+        for attribute, value in zip(ATTRIBUTES, self._values):
+            setattr(dialect, attribute, value)
+        return dialect
+
+    def __setattr__(self, name, value):
+        raise AttributeError('CompiledDialect objects are immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('CompiledDialect objects are immutable')
+
+    def __reduce__(self):
+        return (CompiledDialect, (self._values,))
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, CompiledDialect):
+            return NotImplemented
+        return self._values == other._values
+
+    def __ne__(self, other):
+        if not isinstance(other, CompiledDialect):
+            return NotImplemented
+        return self._values != other._values
+
+    def __repr__(self):
+        return 'CompiledDialect({})'.format(', '.join(
+            '{}={!r}'.format(attribute, value)
+            for attribute, value in zip(ATTRIBUTES, self._values)))
@@ -7,7 +7,11 @@ from __future__ import division, absolute_import, print_function, unicode_litera
 import six
 
 __all__ = [
+    'reader',
     'writer',
+    'StreamWriter',
     ]
 
 from ._writer import writer, DictWriter
+from ._reader import reader, DictReader
+from ._stream import StreamWriter
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+from itertools import chain
+from six.moves import zip
+from six import Iterator
+
+from texttables.dialect import CompiledDialect
+from texttables.errors import ValidationError
+from texttables.fixed import reader as fixedreader
+
+def _delimiterwidths(line, dialect):
+    '''Get the widths of the columns of a delimiter line, or None if the line
+    is not a delimiter line of the dialect'''
+    corner = dialect.corner_border
+    if not corner:
+        return None
+    if dialect.left_border:
+        if not line.startswith(corner):
+            return None
+        line = line[len(corner):]
+    if dialect.right_border:
+        if not line.endswith(corner):
+            return None
+        line = line[:-len(corner)]
+
+    delimiters = [delimiter for delimiter in (
+        dialect.top_border,
+        dialect.header_delimiter,
+        dialect.row_delimiter,
+        dialect.bottom_border,
+        ) if delimiter]
+    runs = line.split(corner)
+    fill = runs[0][:1]
+    if fill not in delimiters:
+        return None
+    for run in runs:
+        if not run or run != fill * len(run):
+            return None
+    return [len(run) for run in runs]
+
+class reader(Iterator):
+
+    """Dynamic-table table reader, reading tables with column-sizes inferred
+    from the table itself, such as those written by
+    :class:`texttables.dynamic.writer`.  The first few lines of the table are
+    read on construction, until one is found that is a delimiter line of the
+    dialect (the top border, the header delimiter, a row delimiter, or the
+    bottom border), and the column widths are taken from the positions of its
+    corners.  Those lines and the rest of the table are then read by
+    :class:`texttables.fixed.reader` with those widths, so the table is only
+    read once.
+
+    The :class:`texttables.Dialect` class is used to configure how this reads
+    tables, and the dialect must have a corner and at least one of those
+    delimiters.  This is an iterable, returning rows from the table as tuples.
+
+    Construction raises a :class:`texttables.ValidationError` if the widths
+    can't be inferred, and iteration can raise one if an invalid table is
+    read."""
+
+    def __init__(self, file, dialect=None, fieldnames=None, sample=10, **fmtparams):
+        """
+        :param file: An iterable object, returning a line with each iteration.
+        :param dialect: A dialect class or object used to define aspects of the
+            table, as with :class:`texttables.fixed.reader`.
+        :param fieldnames: An iterable specifying the field names, as with
+            :class:`texttables.fixed.reader`.
+        :param sample: The most lines to read looking for a delimiter line.
+        :param fmtparams: parameters to override the parameters in
+            :obj:`dialect`, or any other parameters of
+            :class:`texttables.fixed.reader`.
+        """
+        self._file = file
+
+        merged = CompiledDialect.compile(dialect, **fmtparams)
+
+        iterator = iter(file)
+        peeked = list()
+        widths = None
+        for line in iterator:
+            peeked.append(line)
+            widths = _delimiterwidths(line.strip('\r\n'), merged)
+            if widths is not None or len(peeked) >= sample:
+                break
+
+        if widths is None:
+            raise ValidationError('The column widths of the table could not be inferred from its first lines')
+
+        self._reader = fixedreader(chain(peeked, iterator), widths, merged, fieldnames, **fmtparams)
+
+    @property
+    def file(self):
+        '''The file object that was passed in to the constructor.  It is not
+        safe to change this object until you are finished using the class'''
+        return self._file
+
+    @property
+    def widths(self):
+        '''The inferred widths, as a tuple.'''
+        return self._reader.widths
+
+    @property
+    def dialect(self):
+        '''The :class:`texttables.Dialect` constructed from the passed-in
+        dialect, as with :attr:`texttables.fixed.reader.dialect`.'''
+        return self._reader.dialect
+
+    @property
+    def fieldnames(self):
+        '''The table's fieldnames as a tuple, as with
+        :attr:`texttables.fixed.reader.fieldnames`.'''
+        return self._reader.fieldnames
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._reader)
+
+class DictReader(Iterator):
+
+    """Dynamic-table table dictionary reader, reading tables with
+    column-sizes inferred from the table itself.  This is a simple convenience
+    frontend to :class:`texttables.dynamic.reader`.  This is an iterable,
+    returning rows from the table as dictionaries."""
+
+    def __init__(self, file, dialect=None, fieldnames=None, sample=10, **fmtparams):
+        """
+        All the passed in construction parameters are passed to the
+        :class:`texttables.dynamic.reader` constructor literally.  All
+        properties also align directly as well.
+        """
+        self._reader = reader(file, dialect, fieldnames, sample, **fmtparams)
+
+    @property
+    def file(self):
+        return self._reader.file
+
+    @property
+    def widths(self):
+        return self._reader.widths
+
+    @property
+    def dialect(self):
+        return self._reader.dialect
+
+    @property
+    def fieldnames(self):
+        return self._reader.fieldnames
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = next(self._reader)
+        return {key: value for key, value in zip(self.fieldnames, row)}
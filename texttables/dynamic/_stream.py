@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+from numbers import Integral
+from six.moves import range, zip
+import time
+
+from texttables.errors import ValidationError
+from texttables.fixed import writer as fixedwriter
+from ._writer import _measure
+
+class StreamWriter(object):
+    """Dynamic-table document writer that writes as it goes.  The first rows
+    are held as a sample, and column widths are fixed from the sample (and the
+    header), limited by any maximum widths.  From then on, rows are written out
+    through :class:`texttables.fixed.writer` as they arrive, so the time to the
+    first row written and the memory used are both bounded.
+
+    A cell written after the widths are fixed may not fit its column.  What is
+    done with it depends on the overflow policy:
+
+    ``'truncate'``
+        The cell is cut off at the width of its column.
+
+    ``'wrap'``
+        The row is continued on following lines, each holding the next part of
+        every overflowing cell.  A row with more cells than there are columns
+        can't be wrapped, and raises a :class:`texttables.ValidationError`.
+
+    ``'widen'``
+        The current table is ended, and a new one is started with columns wide
+        enough for the row, beginning with the header again.  Columns are
+        never widened past their maximum widths, and are truncated there.
+
+    The :class:`texttables.Dialect` class is used to configure how this writes
+    tables.  This works as a context manager, in which case :meth:`finish` will
+    be called automatically."""
+
+    def __init__(self, file, alignments=None, dialect=None, sample=100, window=None, maxwidths=None, overflow='truncate', **fmtparams):
+        """
+        :param file: A writable file object with a ``write`` method
+        :param alignments: An iterable of alignments, as with
+            :class:`texttables.dynamic.writer`.
+        :param dialect: A dialect class or object used to define aspects of the
+            table, as with :class:`texttables.dynamic.writer`.
+        :param sample: The number of rows to hold before fixing the widths.
+        :param window: A number of seconds after the first row is written to
+            fix the widths, even if the sample is not full.  This is only
+            checked as rows are written.  None to only use the sample size.
+        :param maxwidths: Either a single maximum width for every column, or
+            an iterable of maximum widths for each column, any of which may be
+            None.  None for no maximum widths.
+        :param overflow: The overflow policy, one of ``'truncate'``,
+            ``'wrap'``, or ``'widen'``.
+        :param fmtparams: parameters to override the parameters in
+            :obj:`dialect`.
+        """
+        if overflow not in ('truncate', 'wrap', 'widen'):
+            raise ValueError('overflow must be one of truncate, wrap, or widen')
+
+        self._file = file
+        self._alignments = alignments
+        self._dialect = dialect
+        self._sample = sample
+        self._window = window
+        self._maxwidths = maxwidths
+        self._overflow = overflow
+        self._fmtparams = fmtparams
+        self._header = None
+        self._rows = list()
+        self._widths = list()
+        self._started = None
+        self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.finish()
+
+    @property
+    def file(self):
+        '''The file object that was passed in to the constructor.  It is not
+        safe to change this object until you are finished using the class'''
+        return self._file
+
+    @property
+    def dialect(self):
+        '''The passed-in dialect, as with
+        :attr:`texttables.dynamic.writer.dialect`.'''
+        return self._dialect
+
+    @property
+    def widths(self):
+        '''The widths of the columns, as a tuple.  Until the widths are fixed,
+        these are the widths of the sample so far.'''
+        return tuple(self._widths)
+
+    def _cap(self, widths):
+        maxwidths = self._maxwidths
+        if maxwidths is None:
+            return widths
+        if isinstance(maxwidths, Integral):
+            return [min(width, maxwidths) for width in widths]
+        maxwidths = list(maxwidths)
+        capped = list()
+        for i, width in enumerate(widths):
+            if i < len(maxwidths) and maxwidths[i] is not None:
+                width = min(width, maxwidths[i])
+            capped.append(width)
+        return capped
+
+    def _begin(self):
+        '''Start a new table with the current widths, and write its top and
+        header'''
+        alignments = list(self._alignments or ())
+        widths = ['{}{}'.format(alignments[i] if i < len(alignments) else '', width)
+            for i, width in enumerate(self._widths)]
+        self._writer = fixedwriter(self._file, widths, self._dialect, **self._fmtparams)
+        self._writer.__enter__()
+        if self._header is not None:
+            self._writer.writeheader(self._header)
+
+    def _end(self):
+        self._writer.__exit__(None, None, None)
+        self._writer = None
+
+    def _fix(self):
+        '''Fix the widths from the sample, and write out the sample'''
+        if self._header is not None:
+            _measure(self._widths, self._header)
+        self._widths = self._cap(self._widths)
+        self._begin()
+        rows = self._rows
+        self._rows = None
+        for row in rows:
+            self._write(row)
+
+    def _write(self, row):
+        widths = self._widths
+        overflowing = len(row) > len(widths) or any(
+            len(cell) > width for cell, width in zip(row, widths))
+
+        if not overflowing or self._overflow == 'truncate':
+            self._writer.writerow(row)
+        elif self._overflow == 'widen':
+            grown = list(widths)
+            _measure(grown, row)
+            grown = self._cap(grown)
+            if grown != widths:
+                self._end()
+                self._widths = grown
+                self._begin()
+            self._writer.writerow(row)
+        else:
+            if len(row) > len(widths):
+                raise ValidationError('This row has {} cells, but the table only has {} columns'.format(len(row), len(widths)))
+            cells = list(row)
+            lines = max(-(-len(cell) // width) if width else 1 for cell, width in zip(cells, widths))
+            self._writer.writerow([cell[:width] for cell, width in zip(cells, widths)])
+            terminator = self._writer._terminator
+            for line in range(1, lines):
+                part = [cell[line * width:(line + 1) * width] for cell, width in zip(cells, widths)]
+                self._file.write(self._writer._row(part) + terminator)
+
+    def writeheader(self, header):
+        '''Set the header to be written out.  This must be called before the
+        widths are fixed.'''
+        if self._writer is not None:
+            raise ValueError('The header must be written before the widths are fixed')
+        self._header = header
+
+    def writerow(self, row):
+        '''Write a row.  Until the widths are fixed, this only adds the row to
+        the sample.
+
+        :param row: a sequence representing a row to write
+        '''
+        if self._writer is not None:
+            self._write(row)
+            return
+
+        if self._started is None:
+            self._started = time.time()
+        self._rows.append(row)
+        _measure(self._widths, row)
+        if len(self._rows) >= self._sample or (
+                self._window is not None and time.time() - self._started >= self._window):
+            self._fix()
+
+    def writerows(self, rows):
+        '''Write rows, as with :meth:`writerow`.
+
+        :param rows: An iterable of sequences representing the rows to write
+        '''
+        for row in rows:
+            self.writerow(row)
+
+    def finish(self):
+        '''Fix the widths if the sample isn't full yet, write out anything
+        held, and write the bottom of the table.'''
+        if self._writer is None and self._rows is not None:
+            self._fix()
+        if self._writer is not None:
+            self._end()
@@ -4,9 +4,21 @@
 # This code is released under the license described in the LICENSE file
 
 from __future__ import division, absolute_import, print_function, unicode_literals
-from six.moves import zip
+from six.moves import zip, cPickle as pickle
+from itertools import chain
+import tempfile
 
 from texttables.fixed import writer as fixedwriter
+from texttables.fixed import _columns
+
+def _measure(widths, row):
+    '''Grow a list of column widths to fit a row'''
+    for i, cell in enumerate(row):
+        size = len(cell)
+        if i == len(widths):
+            widths.append(size)
+        elif size > widths[i]:
+            widths[i] = size
 
 class writer(object):
     """Dynamic-table document writer, writing tables with computed column-sizes.
@@ -15,9 +27,15 @@ class writer(object):
     be called automatically.
     This class does not actually write anything out until :meth:`finish` is
     called (or the context manager is exited) because it needs the information
-    from all rows before it knows how wide to make all the columns."""
+    from all rows before it knows how wide to make all the columns.
+
+    Column widths are tracked as rows arrive, so :meth:`finish` can start
+    writing immediately.  By default, all rows are held in memory until then.
+    If a buffer size is given, rows are spilled to a temporary file whenever
+    that many are held, so that memory use is bounded by the buffer size rather
+    than the size of the table."""
 
-    def __init__(self, file, alignments=None, dialect=None, **fmtparams):
+    def __init__(self, file, alignments=None, dialect=None, buffersize=None, **fmtparams):
         """
         :param file: A writable file object with a ``write`` method
         :param alignments: An iterable of alignments.  Each alignment may be <,
@@ -27,15 +45,24 @@ class writer(object):
             :class:`texttables.Dialect`, not necessarily the passed-in object.
             All the attributes of Dialect are grabbed from this object using
             getattr.
+        :param buffersize: The number of rows to hold in memory before
+            spilling them to a temporary file.  None to hold every row in
+            memory.
         :param fmtparams: parameters to override the parameters in
             :obj:`dialect`.
         """
         self._file = file
         self._alignments = alignments
         self._dialect = dialect
+        self._buffersize = buffersize
         self._fmtparams = fmtparams
         self._header = None
         self._rows = list()
+        self._measured = 0
+        self._spill = None
+        self._spilledrows = 0
+        self._blocks = list()
+        self._widths = list()
 
     def __enter__(self):
         return self
@@ -63,12 +90,66 @@ class writer(object):
     @property
     def rows(self):
         '''Get or set the total rows.  This will override all rows passed in
-        with :meth:`writerow` and :meth:`writerows`'''
+        with :meth:`writerow` and :meth:`writerows`.  With a buffer size, this
+        only gets the rows that have not yet been spilled.  Rows appended to
+        the list that this gets are measured when they are next needed, but
+        rows already in it should not be replaced.'''
         return self._rows
 
     @rows.setter
     def rows(self, value):
+        self._discard()
         self._rows = value
+        self._measured = 0
+        self._blocks = list()
+        self._widths = list()
+        self._measurerows()
+
+    @property
+    def widths(self):
+        '''The widths of the columns so far, as a tuple, fitting the header
+        and every row written.'''
+        self._measurerows()
+        widths = list(self._widths)
+        if self._header is not None:
+            _measure(widths, self._header)
+        return tuple(widths)
+
+    def _measurerows(self):
+        '''Measure the held rows that have not yet been measured, including
+        any appended straight to :attr:`rows`'''
+        rows = self._rows
+        if self._measured < len(rows):
+            widths = self._widths
+            for row in rows[self._measured:]:
+                _measure(widths, row)
+            self._measured = len(rows)
+
+    def _spillrows(self):
+        self._measurerows()
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile()
+        pickle.dump(self._rows, self._spill, pickle.HIGHEST_PROTOCOL)
+        self._spilledrows += len(self._rows)
+        self._rows = list()
+        self._measured = 0
+
+    def _spilled(self):
+        '''Generate each chunk of spilled rows, in order'''
+        if self._spill is None:
+            return
+        self._spill.seek(0)
+        while True:
+            try:
+                yield pickle.load(self._spill)
+            except EOFError:
+                return
+
+    def _discard(self):
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+        self._spilledrows = 0
 
     def writeheader(self, header):
         '''Set the header to be written out'''
@@ -81,6 +162,9 @@ class writer(object):
         :param row: an iterable representing a row to write
         '''
         self._rows.append(row)
+        self._measurerows()
+        if self._buffersize is not None and len(self._rows) >= self._buffersize:
+            self._spillrows()
 
     def writerows(self, rows):
         '''Add rows to the row set to be written out.  This does not write
@@ -88,36 +172,110 @@ class writer(object):
 
         :param rows: An iterable of iterables representing the rows to write
         '''
-        self._rows.extend(rows)
-
-    def finish(self):
-        '''Write the top, the bottom, the header (if present), and all rows out
-        with proper delimitation to :meth:`file`, respecting the dialect'''
-        # Initiate all widths to 0
-        widths = [0 for i in self._rows[0]]
-
-        def checkwidths(row):
-            for i in range(len(row)):
-                size = len(row[i])
-                if size > widths[i]:
+        if self._buffersize is None:
+            self._rows.extend(rows)
+            self._measurerows()
+        else:
+            for row in rows:
+                self.writerow(row)
+
+    def writecolumns(self, columns):
+        '''Add the rows held by whole columns, such as NumPy arrays, to be
+        written out.  Every cell is converted to a string and measured a whole
+        column at a time, and the columns are held, not the rows, until they
+        are written out in the same way by
+        :meth:`texttables.fixed.writer.writecolumns`.  This does not write
+        anything, and is only named as such for uniformity.
+
+        With a buffer size, the converted cells are held as rows instead, so
+        that they are spilled like any others.  Without NumPy, this simply
+        adds the rows with :meth:`writerows`.
+
+        :param columns: A sequence of columns, each a sequence of cells, all
+            the same length
+        '''
+        columns = list(columns)
+        if not columns:
+            return
+        length = len(columns[0])
+        if any(len(column) != length for column in columns):
+            raise ValueError('Every column must have the same length')
+        if _columns.numpy is None:
+            self.writerows(zip(*columns))
+            return
+
+        columns = [_columns.strings(column) for column in columns]
+        if length:
+            str_len = getattr(_columns.numpy, 'strings', _columns.numpy.char).str_len
+            widths = self._widths
+            for i, column in enumerate(columns):
+                size = int(str_len(column).max())
+                if i == len(widths):
+                    widths.append(size)
+                elif size > widths[i]:
                     widths[i] = size
 
-        # Iterate all rows to find which is the largest cell for each column
-        checkwidths(self._header)
-        for row in self._rows:
-            checkwidths(row)
-
-
+        if self._buffersize is not None:
+            # Held columns are never spilled, so they are held as rows
+            # instead, a buffer's worth at a time, and spilled as any others
+            self._measurerows()
+            buffersize = self._buffersize
+            for start in range(0, length, buffersize):
+                rows = zip(*[column[start:start + buffersize].tolist() for column in columns])
+                for row in rows:
+                    self._rows.append(row)
+                    self._measured += 1
+                    if len(self._rows) >= buffersize:
+                        self._spillrows()
+            return
+
+        # Blocks are kept with the number of rows written before them, so
+        # that they are written in order
+        self._blocks.append((self._spilledrows + len(self._rows), columns))
+
+    def _chunks(self, w):
+        '''Write out every chunk of rows, spilled or held, and every block of
+        columns in between them, in the order they were written'''
+        blocks = iter(self._blocks)
+        block = next(blocks, None)
+        position = 0
+        for rows in chain(self._spilled(), (self._rows,)):
+            start = 0
+            while block is not None and block[0] <= position + len(rows):
+                w.writerows(rows[start:block[0] - position])
+                start = block[0] - position
+                w.writecolumns(block[1])
+                block = next(blocks, None)
+            w.writerows(rows[start:])
+            position += len(rows)
+        while block is not None:
+            w.writecolumns(block[1])
+            block = next(blocks, None)
+
+    def _fixedwidths(self):
+        '''The widths to write the table with, with any alignments'''
+        widths = self.widths
         if self._alignments is not None:
             widths = ['{}{}'.format(alignment, width) for alignment, width in zip(self._alignments, widths)]
+        return widths
 
-        with fixedwriter(self._file, widths, self._dialect, **self._fmtparams) as w:
+    def finish(self):
+        '''Write the top, the bottom, the header (if present), and all rows out
+        with proper delimitation to :meth:`file`, respecting the dialect'''
+        with fixedwriter(self._file, self._fixedwidths(), self._dialect, **self._fmtparams) as w:
             header = self._header
             if header is not None:
                 w.writeheader(header)
 
-            for row in self._rows:
-                w.writerow(row) 
+            if self._blocks:
+                self._chunks(w)
+            else:
+                for rows in self._spilled():
+                    w.writerows(rows)
+                w.writerows(self._rows)
+
+        self._discard()
+        self._blocks = list()
 
 class DictWriter(object):
     """Dynamic-table document writer, writing tables with predefined column-sizes
@@ -130,14 +288,14 @@ class DictWriter(object):
     automatically.
     """
 
-    def __init__(self, file, fieldnames, alignments=None, dialect=None, **fmtparams):
+    def __init__(self, file, fieldnames, alignments=None, dialect=None, buffersize=None, **fmtparams):
         """
         All the passed in construction parameters are passed to the
         :class:`texttables.dynamic.writer` constructor literally.  All
         properties and most methods also align directly as well.
         """
 
-        self._writer = writer(file, alignments, dialect, **fmtparams)
+        self._writer = writer(file, alignments, dialect, buffersize, **fmtparams)
         self._fieldnames = fieldnames
 
     def __enter__(self):
@@ -179,3 +337,10 @@ class DictWriter(object):
         :param row: An iterable of dictionaries representing rows.'''
         for row in rows:
             self.writerow(row)
+
+    def writecolumns(self, columns):
+        '''Write whole columns based on :meth:`fieldnames`, as with
+        :meth:`texttables.dynamic.writer.writecolumns`.
+
+        :param columns: A mapping of each field name to its column'''
+        self._writer.writecolumns([columns[field] for field in self._fieldnames])
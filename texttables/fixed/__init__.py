@@ -9,7 +9,21 @@ import six
 __all__ = [
     'reader',
     'writer',
+    'bytesreader',
+    'byteswriter',
+    'ConcurrentWriter',
+    'RandomAccessReader',
+    'MappedReader',
+    'parallel_read',
+    'read_columns',
     ]
 
 from ._writer import writer, DictWriter
+from ._concurrent import ConcurrentWriter
 from ._reader import reader, DictReader
+from ._row import Row, LazyRow
+from ._bytes import bytesreader, byteswriter
+from ._randomaccess import RandomAccessReader
+from ._mapped import MappedReader
+from ._parallel import parallel_read
+from ._columns import read_columns
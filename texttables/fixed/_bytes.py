@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+from six import text_type
+from six.moves import zip
+from six.moves.collections_abc import Mapping
+
+from texttables.dialect import ATTRIBUTES, CompiledDialect
+from ._converters import parser
+from ._reader import reader
+from ._writer import writer
+
+def _textdialect(dialect, fmtparams, encoding):
+    '''Compile a dialect, decoding any of its attributes that are bytes, so
+    that the compiled dialect is the same as that of a text table'''
+    compiled = CompiledDialect.compile(dialect or None, **fmtparams)
+    decoded = dict()
+    for attribute in ATTRIBUTES:
+        value = getattr(compiled, attribute)
+        if isinstance(value, bytes):
+            decoded[attribute] = value.decode(encoding)
+    if decoded:
+        compiled = CompiledDialect.compile(compiled, **decoded)
+    return compiled
+
+def _encoded(value, encoding):
+    if isinstance(value, text_type):
+        return value.encode(encoding)
+    return value
+
+class bytesreader(reader):
+
+    """Fixed-table table reader, reading tables of bytes rather than text, such
+    as from a file opened in binary mode.  Lines are never decoded: every
+    border and delimiter line is encoded once and validated exactly as
+    :class:`texttables.fixed.reader` validates text, and each cell is sliced out
+    of its line at its byte offset, so rows are tuples of byte strings.
+
+    The borders and delimiters may be of any encoding, but every cell is as
+    many bytes wide as its width, so this suits ASCII and other single-byte
+    encodings, such as latin-1.
+
+    Field names are byte strings too, as are the cells that ``where`` checks.
+    Any field names given as text, in ``fieldnames``, ``columns``, or the keys
+    of ``where`` or ``converters``, are encoded first, as are text values for
+    ``where`` to check cells against.  Converted cells are only decoded for
+    converters that need text, and :class:`int` and :class:`float` take the
+    bytes directly."""
+
+    _newlines = b'\r\n'
+
+    def __init__(self, file, widths, dialect=None, fieldnames=None, columns=None, validateall=True, where=None, trusted=False, converters=None, onerror='raise', encoding='latin-1', **fmtparams):
+        """
+        :param file: An iterable object, returning a line of bytes with each
+            iteration.
+        :param encoding: The encoding of the table.  The attributes of the
+            dialect may be either text, which is encoded with this, or bytes.
+
+        All the other parameters are as with :class:`texttables.fixed.reader`.
+        """
+        self._encoding = encoding
+        if fieldnames is not None:
+            fieldnames = [_encoded(name, encoding) for name in fieldnames]
+        if columns is not None:
+            columns = [_encoded(column, encoding) for column in columns]
+        if where is not None:
+            where = {_encoded(column, encoding): _encoded(test, encoding) for column, test in where.items()}
+        if isinstance(converters, Mapping):
+            converters = {_encoded(column, encoding): converter for column, converter in converters.items()}
+        super(bytesreader, self).__init__(file, widths, _textdialect(dialect, fmtparams, encoding),
+            fieldnames, columns, validateall, where, trusted, converters, onerror)
+
+    @reader.dialect.setter
+    def dialect(self, value):
+        reader.dialect.fset(self, _textdialect(value, {}, self._encoding))
+
+    @property
+    def encoding(self):
+        '''The encoding of the table.'''
+        return self._encoding
+
+    def _parser(self, converter):
+        parse = parser(converter)
+        if parse is int or parse is float:
+            return parse
+        encoding = self._encoding
+        return lambda cell: parse(cell.decode(encoding))
+
+class byteswriter(writer):
+
+    """Fixed-table document writer, writing tables of bytes rather than text,
+    such as to a file opened in binary mode.  Every border and delimiter line
+    and all the padding is encoded once, and cells that are byte strings are
+    laid out without ever being decoded or encoded.  On Python 3, a whole row
+    of byte strings aligned left or right is formatted with a single ``%``
+    operation.  Any other cell is converted to a string and encoded first.
+
+    Each cell is truncated and padded to as many bytes as its width, so this
+    suits ASCII and other single-byte encodings, such as latin-1.  This works
+    as a context manager, as :class:`texttables.fixed.writer` does."""
+
+    def __init__(self, file, widths, dialect=None, encoding='latin-1', **fmtparams):
+        """
+        :param file: A writable file object with a ``write`` method taking
+            bytes
+        :param encoding: The encoding of the table.  The attributes of the
+            dialect may be either text, which is encoded with this, or bytes.
+
+        All the other parameters are as with :class:`texttables.fixed.writer`.
+        """
+        self._encoding = encoding
+        super(byteswriter, self).__init__(file, widths, _textdialect(dialect, fmtparams, encoding))
+
+    @writer.dialect.setter
+    def dialect(self, value):
+        writer.dialect.fset(self, _textdialect(value, {}, self._encoding))
+
+    @property
+    def encoding(self):
+        '''The encoding of the table.'''
+        return self._encoding
+
+    def writecolumns(self, columns, chunksize=65536):
+        '''Write rows out to :meth:`file` from whole columns, respecting any
+        delimiters and header separators necessary.  The output is the same as
+        writing the rows with :meth:`writerows`, which this does.
+
+        :param columns: A sequence of columns, each a sequence of cells, all
+            the same length
+        :param chunksize: The number of rows to format before each write
+        '''
+        columns = list(columns)
+        if any(len(column) != len(columns[0]) for column in columns):
+            raise ValueError('Every column must have the same length')
+        self.writerows(zip(*columns), chunksize)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+from collections import OrderedDict
+from numbers import Integral
+from six.moves import range, zip
+from six.moves.collections_abc import Mapping
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from texttables.errors import ValidationError
+from ._randomaccess import RandomAccessReader
+
+def _resolve(fieldnames, columns, dtypes):
+    '''Resolve the columns to read and their dtypes against the field names,
+    returning a list of ``(index, dtype)`` pairs'''
+    def index(column):
+        if isinstance(column, Integral):
+            return column
+        try:
+            return fieldnames.index(column)
+        except ValueError:
+            raise ValueError('{!r} is not a field of the table'.format(column))
+
+    if columns is None:
+        indices = list(range(len(fieldnames)))
+    else:
+        indices = [index(column) for column in columns]
+
+    types = dict()
+    if isinstance(dtypes, Mapping):
+        for column, dtype in dtypes.items():
+            types[index(column)] = dtype
+    elif dtypes is not None:
+        for column, dtype in enumerate(dtypes):
+            types[column] = dtype
+
+    return [(column, types.get(column)) for column in indices]
+
+def _fields(table, encoding):
+    '''Build the structured dtype of a row and the delimiter line after it,
+    with a field for every cell, border, and delimiter, and the values every
+    field but the cells should hold.'''
+    dialect = table.compiled
+    layout = table._reader._layout
+
+    names = list()
+    formats = list()
+    offsets = list()
+    expected = dict()
+    position = [0]
+
+    def field(name, length, value=None):
+        if length:
+            names.append(name)
+            formats.append('S{}'.format(length))
+            offsets.append(position[0])
+            if value is not None:
+                expected[name] = value
+        position[0] += length
+
+    left = (dialect.left_border or '').encode(encoding)
+    right = (dialect.right_border or '').encode(encoding)
+    delimiter = dialect.cell_delimiter.encode(encoding)
+
+    field('left', len(left), left)
+    for column, width in enumerate(layout.widths):
+        if column:
+            field('delimiter{}'.format(column), len(delimiter), delimiter)
+        field('cell{}'.format(column), width)
+    field('right', len(right), right)
+
+    if table._rowlength < position[0]:
+        raise ValidationError('The rows of the table are shorter than its widths')
+    field('terminator', table._rowlength - position[0])
+    rowdelimiter = b''
+    if layout.rowdelimiter is not None:
+        rowdelimiter = layout.rowdelimiter.encode(encoding)
+    field('rowdelimiter', table._stride - table._rowlength, rowdelimiter)
+
+    dtype = numpy.dtype({
+        'names': names,
+        'formats': formats,
+        'offsets': offsets,
+        'itemsize': table._stride,
+        })
+    return dtype, expected
+
+def _validate(rows, first, last, expected):
+    '''Check every border and delimiter of a block of rows at once'''
+    for name, value in expected.items():
+        values = rows[name]
+        if name == 'rowdelimiter':
+            # The row delimiter also holds the terminator of its line, and
+            # there is none after the last row of the table
+            if last:
+                values = values[:-1]
+            bad = numpy.flatnonzero(~numpy.char.startswith(values, value))
+        else:
+            bad = numpy.flatnonzero(values != value)
+        if bad.size:
+            raise ValidationError('Row {} was not delimited properly'.format(first + int(bad[0])))
+
+def _starts(length, chunksize):
+    '''The first row of each chunk.  A whole table is one chunk, even if it
+    is empty.'''
+    if chunksize:
+        return range(0, length, chunksize)
+    return (0,)
+
+def _chunks(table, columns, fieldnames, chunksize, encoding):
+    length = len(table)
+    if not length:
+        if not chunksize:
+            widths = table.widths
+            yield OrderedDict((fieldnames[column], numpy.empty(0, dtype=columntype or 'S{}'.format(widths[column])))
+                for column, columntype in columns)
+        return
+
+    dialect = table.compiled
+    dtype, expected = _fields(table, encoding)
+    if not dialect.strict:
+        expected = dict()
+
+    strip = getattr(numpy, 'strings', numpy.char).strip
+    stride = table._stride
+    file = table.file
+    file.seek(table._start)
+
+    for first in _starts(length, chunksize):
+        count = min(chunksize or length, length - first)
+        # Reading into a buffer of whole strides pads out the missing
+        # delimiter after the last row
+        buffer = bytearray(count * stride)
+        file.readinto(memoryview(buffer))
+        rows = numpy.frombuffer(buffer, dtype=dtype)
+        _validate(rows, first, first + count == length, expected)
+
+        result = OrderedDict()
+        for column, columntype in columns:
+            cells = rows['cell{}'.format(column)]
+            if columntype is None or numpy.dtype(columntype).kind in 'SUO':
+                if dialect.strip:
+                    cells = strip(cells)
+                else:
+                    # A field view of a row is not contiguous
+                    cells = cells.copy()
+            if columntype is not None:
+                cells = cells.astype(columntype)
+            result[fieldnames[column]] = cells
+        yield result
+
+def _fallback(table, columns, fieldnames, chunksize):
+    '''Read the table row by row into lists, for when NumPy is unavailable'''
+    converters = [columntype if callable(columntype) else None for column, columntype in columns]
+    length = len(table)
+
+    for first in _starts(length, chunksize):
+        rows = table[first:first + (chunksize or length)]
+        result = OrderedDict()
+        for (column, columntype), converter in zip(columns, converters):
+            cells = [row[column] for row in rows]
+            if converter is not None:
+                cells = [converter(cell) for cell in cells]
+            result[fieldnames[column]] = cells
+        yield result
+
+def read_columns(file, widths, dialect=None, fieldnames=None, columns=None, dtypes=None, encoding='utf-8', chunksize=None, **fmtparams):
+    """Read a fixed table column by column into NumPy arrays.  The rows are
+    read straight into one contiguous buffer, which is viewed as an array of
+    records with a fixed-length byte string field at the offset of every
+    cell, border, and delimiter.  The borders and delimiters of every row are
+    validated at once, and each column is stripped and converted to its dtype
+    as a whole, so no Python object is ever built for a row or a cell.
+
+    The table is located as with :class:`texttables.fixed.RandomAccessReader`,
+    and has the same constraints.  The cells must also hold one byte per
+    character in the encoding, such as ASCII, though the borders and
+    delimiters need not.
+
+    If NumPy is not available, the table is read row by row instead, each
+    column is a list of strings, and only dtypes that are callables, such as
+    :class:`int` or :class:`float`, are applied to each cell.
+
+    :param file: A seekable file object opened in binary mode.
+    :param widths: An iterable of widths, as with
+        :class:`texttables.fixed.reader`.
+    :param dialect: A dialect class or object used to define aspects of the
+        table, as with :class:`texttables.fixed.reader`.
+    :param fieldnames: An iterable specifying the field names, as with
+        :class:`texttables.fixed.reader`.
+    :param columns: An iterable of the columns to read, as indices or field
+        names.  None to read them all.
+    :param dtypes: Either a mapping of columns, as indices or field names, to
+        NumPy dtypes, or a sequence of a dtype for each column, any of which
+        may be None.  Columns without a dtype are arrays of stripped byte
+        strings.
+    :param encoding: The encoding of the file.
+    :param chunksize: The number of rows to read at a time.  If this is given,
+        an iterator of the columns of each chunk is returned instead.
+    :param fmtparams: parameters to override the parameters in
+        :obj:`dialect`.
+    :returns: An :class:`collections.OrderedDict` of each field name read to
+        its column.
+    :raises texttables.ValidationError: if an invalid table is read
+    """
+    table = RandomAccessReader(file, widths, dialect, fieldnames, encoding, **fmtparams)
+    fieldnames = tuple(table.fieldnames)
+    columns = _resolve(fieldnames, columns, dtypes)
+
+    if numpy is None:
+        chunks = _fallback(table, columns, fieldnames, chunksize)
+    else:
+        chunks = _chunks(table, columns, fieldnames, chunksize, encoding)
+
+    if chunksize:
+        return chunks
+    return next(chunks)
+
+def strings(column):
+    '''Get a column as a one-dimensional NumPy array of strings, converting
+    each value with :func:`str`, as formatting a row does.  Anything but an
+    array is taken as an array of objects, so that its values are not first
+    converted to a common type.'''
+    if isinstance(column, numpy.ndarray):
+        array = column
+    else:
+        array = numpy.empty(len(column), dtype=object)
+        array[:] = column
+    if array.ndim != 1:
+        raise ValueError('Columns must be one-dimensional')
+    if array.dtype.kind in 'fc':
+        # Python formats floats faster than NumPy does, and this way exactly
+        # as it would in a row
+        array = numpy.array([str(value) for value in array.tolist()])
+    elif array.dtype.kind != 'U':
+        array = array.astype(str)
+    return array
+
+def _codes(text):
+    '''Get the code points of a string as a NumPy array'''
+    return numpy.frombuffer(text.encode('utf-32-le'), dtype='<u4')
+
+def _place(region, alignment, width, column):
+    '''Write a column of strings into a region of code points, truncated and
+    padded to the width exactly as :meth:`str.format` does'''
+    functions = getattr(numpy, 'strings', numpy.char)
+    column = column.astype('U{}'.format(width))
+    if alignment == '<':
+        column = functions.ljust(column, width)
+    elif alignment == '>':
+        column = functions.rjust(column, width)
+    elif alignment != '^':
+        raise ValueError("'{}' alignment not allowed in string format specifier".format(alignment))
+
+    if alignment != '^':
+        region[...] = column.view('=u4').reshape(len(column), width)
+        return
+
+    # str.center puts the odd space on the other side from str.format, so
+    # centered cells are shifted into place by hand
+    chars = column.view('=u4').reshape(len(column), width)
+    lengths = functions.str_len(column)
+    padding = (width - lengths) // 2
+    region[...] = 32
+    rows, cells = numpy.nonzero(numpy.arange(width) < lengths[:, None])
+    region[rows, cells + padding[rows]] = chars[rows, cells]
+
+def formatblock(layout, columns, separator):
+    '''Format whole columns of strings into the lines of a table at once,
+    returning them as a single string.  Each line is built in one row of an
+    array of code points, so the cells of every line are laid out together.
+
+    :param layout: The :class:`Layout` of the table
+    :param columns: A sequence of arrays of strings from :func:`strings`, all
+        the same length.  Extra columns past the number of widths are ignored.
+    :param separator: What comes between lines, including the terminator of
+        the last one, such as the row delimiter line.  Nothing follows the last
+        line.
+    '''
+    count = len(columns[0])
+    columns = columns[:len(layout.widths)]
+
+    pieces = [layout._left]
+    for index, column in enumerate(columns):
+        if index:
+            pieces.append(layout._delimiter)
+        pieces.append(index)
+    pieces.append(layout._right)
+    pieces.append(layout.lineterminator + separator)
+
+    length = sum(layout.widths[piece] if isinstance(piece, Integral) else len(piece) for piece in pieces)
+    lines = numpy.empty((count, length), dtype='<u4')
+
+    position = 0
+    for piece in pieces:
+        if isinstance(piece, Integral):
+            width = layout.widths[piece]
+            if width:
+                _place(lines[:, position:position + width], layout.alignments[piece], width, columns[piece])
+        elif piece:
+            width = len(piece)
+            lines[:, position:position + width] = _codes(piece)
+        else:
+            width = 0
+        position += width
+
+    text = lines.tobytes().decode('utf-32-le')
+    if separator:
+        text = text[:-len(separator)]
+    return text
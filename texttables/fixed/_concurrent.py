@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+from collections import deque
+import threading
+
+from ._writer import writer
+
+# The kinds of what is queued
+_RAW = 0
+_ROWS = 1
+_HEADER = 2
+_FLUSH = 3
+_STOP = 4
+
+class ConcurrentWriter(object):
+
+    """Fixed-table document writer that may be shared by any number of
+    threads.  Each thread formats its own rows into complete lines, without
+    holding any lock, and queues them, which is only an append to a
+    :class:`collections.deque`.  A single flusher thread takes everything
+    queued at once, puts the row and header delimiters between the
+    lines in the order they were queued, and writes them out to :meth:`file`
+    with a single ``write`` call, so lines from different threads never tear or
+    interleave, and nothing else may write to the file.
+
+    The lines of a single :meth:`writerows` call are always written together.
+    Errors from formatting a row are raised in the thread writing it, and
+    errors from writing to the file are raised by the next call in any thread.
+
+    The :class:`texttables.Dialect` class is used to configure how this writes
+    tables.  This works as a context manager, in which case :meth:`writetop`
+    and :meth:`writebottom` will be called automatically, and the writer is
+    closed on exit."""
+
+    def __init__(self, file, widths, dialect=None, batchsize=4096, queuesize=0, **fmtparams):
+        """
+        :param file: A writable file object with a ``write`` method
+        :param widths: An iterable of widths, as with
+            :class:`texttables.fixed.writer`.
+        :param dialect: A dialect class or object used to define aspects of the
+            table, as with :class:`texttables.fixed.writer`.
+        :param batchsize: The most queued calls to write out at once.
+        :param queuesize: The most calls to queue before a thread writing
+            waits for the flusher to write out everything queued.  0 for no
+            limit.
+        :param fmtparams: parameters to override the parameters in
+            :obj:`dialect`.
+        """
+        # Only the compiled lines and layout of the writer are used
+        self._writer = writer(file, widths, dialect, **fmtparams)
+        self._format = self._writer._layout.row
+        self._terminator = self._writer._terminator
+        self._batchsize = batchsize
+        self._queuesize = queuesize
+        self._pending = deque()
+        self._wake = threading.Event()
+        self._error = None
+        self._closed = False
+        # Held to queue anything, and to close
+        self._closing = threading.Lock()
+
+        self._wroterow = False
+        self._wroteheader = False
+
+        self._flusher = threading.Thread(target=self._flush, name='texttables flusher')
+        self._flusher.daemon = True
+        self._flusher.start()
+
+    def __enter__(self):
+        if self._writer._compiled.top_border:
+            self.writetop()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        try:
+            if self._writer._compiled.bottom_border and not self._closed:
+                self.writebottom()
+        finally:
+            self.close()
+
+    @property
+    def file(self):
+        '''The file object that was passed in to the constructor.  It is not
+        safe to use this object until the writer is closed'''
+        return self._writer.file
+
+    @property
+    def widths(self):
+        '''The widths that were passed into the constructor, as a tuple.'''
+        return self._writer.widths
+
+    @property
+    def dialect(self):
+        '''The :class:`texttables.Dialect` that the table is written with.
+        The dialect of a shared writer can't be changed, neither by assigning
+        to this nor in place.'''
+        return self._writer.dialect
+
+    @property
+    def compiled(self):
+        '''The :class:`texttables.CompiledDialect` that the table is actually
+        written with.'''
+        return self._writer.compiled
+
+    def _flush(self):
+        '''Write out everything queued until closed, in the flusher thread'''
+        pending = self._pending
+        popleft = pending.popleft
+        wake = self._wake
+        headerdelim = self._writer._headerdelim
+        rowdelim = self._writer._rowdelim
+
+        while True:
+            wake.wait()
+            # Anything queued after this wakes the flusher again
+            wake.clear()
+            while pending:
+                parts = list()
+                append = parts.append
+                flushed = list()
+                stop = False
+                for _ in range(self._batchsize):
+                    if not pending:
+                        break
+                    kind, lines = popleft()
+                    if kind == _RAW:
+                        parts.extend(lines)
+                    elif kind == _FLUSH:
+                        flushed.append(lines)
+                    elif kind == _STOP:
+                        stop = True
+                    else:
+                        for line in lines:
+                            if self._wroteheader:
+                                if headerdelim:
+                                    append(headerdelim)
+                            elif self._wroterow:
+                                if rowdelim:
+                                    append(rowdelim)
+                            append(line)
+                            self._wroteheader = False
+                            self._wroterow = True
+                        if kind == _HEADER:
+                            self._wroteheader = True
+
+                if parts and self._error is None:
+                    try:
+                        self._writer.file.write(''.join(parts))
+                    except Exception as error:
+                        self._error = error
+                for event in flushed:
+                    event.set()
+                if stop:
+                    return
+
+    def _queue(self, kind, lines):
+        self._pending.append((kind, lines))
+        if not self._wake.is_set():
+            self._wake.set()
+
+    def _put(self, kind, lines):
+        if self._error is not None:
+            raise self._error
+        # Checking and queueing under the lock close takes means nothing can
+        # be queued after the flusher is told to stop
+        with self._closing:
+            if self._closed:
+                raise ValueError('The writer is closed')
+            self._queue(kind, lines)
+        if self._queuesize and len(self._pending) >= self._queuesize:
+            self.flush()
+
+    def writerow(self, row):
+        '''Format a single row, and queue it to be written out to
+        :meth:`file`, respecting any delimiters and header separators
+        necessary.
+
+        :param row: An iterable representing the row to write
+        '''
+        self._put(_ROWS, (self._format(row) + self._terminator,))
+
+    def writerows(self, rows):
+        '''Format multiple rows, and queue them to be written out to
+        :meth:`file` together, respecting any delimiters and header separators
+        necessary.
+
+        :param rows: An iterable of iterables representing the rows to write
+        '''
+        format = self._format
+        terminator = self._terminator
+        lines = [format(row) + terminator for row in rows]
+        if lines:
+            self._put(_ROWS, lines)
+
+    def writeheader(self, row):
+        '''Format the header, and queue it to be written out to :meth:`file`.
+
+        :param row: An iterable representing the row to write as a header
+        '''
+        self._put(_HEADER, (self._format(row) + self._terminator,))
+
+    def writetop(self):
+        '''Queue the top of the table to be written out to :meth:`file`.'''
+        self._put(_RAW, (self._writer._top,))
+
+    def writebottom(self):
+        '''Queue the bottom of the table to be written out to :meth:`file`.'''
+        self._put(_RAW, (self._writer._bottom,))
+
+    def flush(self):
+        '''Wait until everything queued so far, by any thread, is written out
+        to :meth:`file`.
+
+        :raises ValueError: if the writer is closed
+        '''
+        flushed = threading.Event()
+        with self._closing:
+            if self._closed:
+                raise ValueError('The writer is closed')
+            self._queue(_FLUSH, flushed)
+        flushed.wait()
+        if self._error is not None:
+            raise self._error
+
+    def close(self):
+        '''Write out everything queued, and stop the flusher.  Nothing may be
+        written after this.  The file is not closed.'''
+        with self._closing:
+            if not self._closed:
+                self._closed = True
+                self._queue(_STOP, None)
+                self._flusher.join()
+        if self._error is not None:
+            raise self._error
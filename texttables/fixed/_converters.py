@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+from datetime import date, datetime
+from six import raise_from
+from six.moves import zip
+
+_BOOLEANS = {
+    'true': True,
+    'yes': True,
+    'on': True,
+    '1': True,
+    'false': False,
+    'no': False,
+    'off': False,
+    '0': False,
+    '': False,
+    }
+
+def _parsebool(text):
+    try:
+        return _BOOLEANS[text.strip().lower()]
+    except KeyError:
+        raise ValueError('{!r} is not a boolean'.format(text))
+
+if hasattr(date, 'fromisoformat'):
+    def _parsedate(text):
+        return date.fromisoformat(text.strip())
+
+    def _parsedatetime(text):
+        return datetime.fromisoformat(text.strip())
+else:
+    def _parsedate(text):
+        return datetime.strptime(text.strip(), '%Y-%m-%d').date()
+
+    def _parsedatetime(text):
+        text = text.strip()
+        for format in ('%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d'):
+            try:
+                return datetime.strptime(text, format)
+            except ValueError:
+                pass
+        raise ValueError('{!r} is not an ISO 8601 date and time'.format(text))
+
+# The parsers used for types, rather than calling the type itself.  Each of
+# these ignores surrounding whitespace, so cells don't need to be stripped
+# for them first.
+_PARSERS = {
+    int: int,
+    float: float,
+    bool: _parsebool,
+    date: _parsedate,
+    datetime: _parsedatetime,
+    }
+
+_STRIPPING = tuple(_PARSERS.values())
+
+#: The failure policies of a conversion
+POLICIES = ('raise', 'none', 'keep')
+
+def parser(converter):
+    '''Get the callable that converts a cell for a converter, which is either
+    a type with a built-in parser, such as :class:`int`, :class:`float`,
+    :class:`bool`, :class:`datetime.date`, or :class:`datetime.datetime`, or
+    any other callable taking the text of a cell'''
+    if not callable(converter):
+        raise TypeError('{!r} is not callable'.format(converter))
+    try:
+        return _PARSERS.get(converter, converter)
+    except TypeError:
+        # Unhashable callables
+        return converter
+
+def cellconverter(parse, strip, onerror, name):
+    '''Build the function getting a single cell from its text, stripped and
+    converted.  A cell that fails to convert has the failure policy applied
+    to it right away, so the converter only ever runs once for each cell.
+
+    :param parse: The callable to convert the cell with
+    :param strip: Whether to strip the cell
+    :param onerror: The failure policy of the conversion
+    :param name: The field name of the cell, for the error message
+    '''
+    # The built-in parsers ignore surrounding whitespace themselves
+    prestrip = strip and not any(parse is stripping for stripping in _STRIPPING)
+    def convert(contents):
+        if prestrip:
+            contents = contents.strip()
+        try:
+            return parse(contents)
+        except (ValueError, ArithmeticError) as error:
+            if onerror == 'none':
+                return None
+            if strip:
+                contents = contents.strip()
+            if onerror == 'keep':
+                return contents
+            raise_from(ValueError('Could not convert {!r} in field {!r}: {}'.format(contents, name, error)), error)
+    return convert
+
+def rowbuilder(slicecells, strip, conversions, onerror):
+    '''Build the function making a whole row from a line, with each cell
+    sliced out, stripped, and converted in a single pass.  A cell that fails
+    to convert has the failure policy applied to it right away, so each
+    converter only ever runs once for each cell.
+
+    :param slicecells: The callable slicing every cell of the row out of a
+        line at once
+    :param strip: Whether to strip each cell
+    :param conversions: The ``(position, parse, name)`` of each converted
+        cell in the row
+    :param onerror: The failure policy of a conversion
+    '''
+    # The last conversion of a position wins, as each cell is converted once
+    conversions = tuple(dict((position, (position, parse, name)) for position, parse, name in conversions).values())
+    def build(line):
+        if strip:
+            row = [contents.strip() for contents in slicecells(line)]
+        else:
+            row = list(slicecells(line))
+        for position, parse, name in conversions:
+            try:
+                row[position] = parse(row[position])
+            except (ValueError, ArithmeticError) as error:
+                if onerror == 'none':
+                    row[position] = None
+                elif onerror == 'raise':
+                    raise_from(ValueError('Could not convert {!r} in field {!r}: {}'.format(row[position], name, error)), error)
+        return tuple(row)
+    return build
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+import six
+from six.moves import zip
+from numbers import Integral
+from operator import itemgetter
+
+def parsewidth(width):
+    '''Split a single width specification into an ``(alignment, width)`` pair.
+
+    :param width: An integer, or a string of an integer optionally prefixed
+        with <, >, =, or ^.
+    '''
+    if isinstance(width, Integral):
+        return '<', width
+    swidth = str(width)
+    try:
+        return '<', int(swidth)
+    except ValueError:
+        return swidth[0], int(swidth[1:])
+
+def _slicer(slices):
+    '''Build a callable that takes all the given slices of a line at once,
+    always returning a tuple'''
+    if not slices:
+        return lambda line: ()
+    if len(slices) == 1:
+        only = slices[0]
+        return lambda line: (line[only],)
+    return itemgetter(*slices)
+
+def _escape(text):
+    '''Escape text so that it is reproduced literally by :meth:`str.format`'''
+    if not text:
+        return ''
+    return text.replace('{', '{{').replace('}', '}}')
+
+class Layout(object):
+    """The compiled geometry of a fixed table, built once from the widths and
+    a :class:`texttables.Dialect`.  This holds the parsed alignments and widths,
+    a single format template for an entire row, so that formatting a row is
+    one :meth:`str.format` call rather than one per cell, every delimiter
+    line of the table, and the offsets of every cell and cell delimiter within
+    a row, so that reading a row takes each of them with a single slice of the
+    line.
+
+    The layout does not track the dialect it was built from.  If the dialect
+    changes, a new layout must be built."""
+
+    def __init__(self, widths, dialect):
+        """
+        :param widths: An iterable of widths, as accepted by
+            :class:`texttables.fixed.writer`.
+        :param dialect: The :class:`texttables.Dialect` instance to compile.
+        """
+        specs = tuple(parsewidth(width) for width in widths)
+        self.alignments = tuple(alignment for alignment, width in specs)
+        self.widths = tuple(width for alignment, width in specs)
+
+        self._cellformats = tuple(
+            '{{0!s:{alignment}{width}.{width}s}}'.format(
+                alignment=alignment,
+                width=width)
+            for alignment, width in specs)
+
+        self._left = dialect.left_border or ''
+        self._right = dialect.right_border or ''
+        self._delimiter = dialect.cell_delimiter
+
+        self.template = ''.join((
+            _escape(self._left),
+            _escape(self._delimiter).join(
+                '{{{index}!s:{alignment}{width}.{width}s}}'.format(
+                    index=index,
+                    alignment=alignment,
+                    width=width)
+                for index, (alignment, width) in enumerate(specs)),
+            _escape(self._right),
+            ))
+        self._format = self.template.format
+
+        self._corner = dialect.corner_border
+        self._leftcorner = bool(dialect.left_border)
+        self._rightcorner = bool(dialect.right_border)
+
+        #: The line terminator of the dialect
+        self.lineterminator = dialect.lineterminator
+
+        #: The top border line, or None if there is no top border
+        self.top = self.delimiter(dialect.top_border)
+
+        #: The line separating the header from the rows, or None
+        self.header = self.delimiter(dialect.header_delimiter)
+
+        #: The line separating rows from one another, or None
+        self.rowdelimiter = self.delimiter(dialect.row_delimiter)
+
+        #: The bottom border line, or None if there is no bottom border
+        self.bottom = self.delimiter(dialect.bottom_border)
+
+        self._measure()
+
+    def _measure(self):
+        '''Find the offsets of every cell and cell delimiter of a row from the
+        widths, borders, and cell delimiter'''
+        # Offsets of each cell and of each delimiter preceding all but the
+        # first cell, relative to the start of a whole line
+        cells = list()
+        delimiters = list()
+        delimiterlength = len(self._delimiter)
+        position = len(self._left)
+
+        #: Where the content of a row begins, after its left border
+        self.contentstart = position
+
+        for index, width in enumerate(self.widths):
+            if index:
+                delimiters.append(slice(position, position + delimiterlength))
+                position += delimiterlength
+            cells.append(slice(position, position + width))
+            position += width
+
+        #: Where the content of a row ends, and its right border begins
+        self.contentend = position
+
+        #: The length of a row, including borders
+        self.length = position + len(self._right)
+
+        #: The slice of a line holding each cell
+        self.cells = tuple(cells)
+
+        #: The slice of a line holding the delimiter before each cell but the
+        #: first
+        self.delimiters = tuple(delimiters)
+
+        #: Take all the cells of a line, returning them as a tuple
+        self.slicecells = _slicer(cells)
+
+        #: Take all the cell delimiters of a line, returning them as a tuple
+        self.slicedelimiters = _slicer(delimiters)
+
+        #: What :attr:`slicedelimiters` returns for a valid row
+        self.celldelimiters = (self._delimiter,) * len(delimiters)
+
+    def project(self, columns, alldelimiters=True):
+        '''Build slicers for only some of the cells of a line.  Returns a
+        ``(slicecells, slicedelimiters, celldelimiters)`` tuple, like the
+        attributes of the same names.
+
+        :param columns: The indices of the columns to take, in order
+        :param alldelimiters: Whether to take every cell delimiter, or only
+            those preceding the taken columns
+        '''
+        if alldelimiters:
+            delimiters = self.delimiters
+        else:
+            delimiters = [self.delimiters[column - 1] for column in sorted(set(columns)) if column]
+        return (
+            _slicer([self.cells[column] for column in columns]),
+            _slicer(delimiters),
+            (self._delimiter,) * len(delimiters),
+            )
+
+    def delimiter(self, delimiter):
+        '''Build a full delimiter line from a single delimiter character, with
+        corners at the borders and between cells.  Returns None if the delimiter
+        is empty or the dialect has no corner.
+
+        :param delimiter: The character to fill each cell with
+        '''
+        if not delimiter or self._corner is None:
+            return None
+        delim = self._corner.join(delimiter * width for width in self.widths)
+        if self._leftcorner:
+            delim = self._corner + delim
+        if self._rightcorner:
+            delim += self._corner
+        return delim
+
+    def row(self, row):
+        '''Format a row of cells into a single line, without a line terminator.
+        Extra cells past the number of widths are ignored.
+
+        :param row: An iterable representing the row to format
+        '''
+        if not isinstance(row, tuple):
+            row = tuple(row)
+        if len(row) >= len(self.widths):
+            return self._format(*row)
+
+        # Short rows only get as many cells as they have, like zip would
+        contents = [cell.format(content) for cell, content in zip(self._cellformats, row)]
+        return self._left + self._delimiter.join(contents) + self._right
+
+def _pad(cell, alignment, width):
+    '''Truncate and pad a byte string to a width, as :meth:`str.format` does
+    a string'''
+    cell = cell[:width]
+    if alignment == '<':
+        return cell.ljust(width)
+    if alignment == '>':
+        return cell.rjust(width)
+    if alignment == '^':
+        space = width - len(cell)
+        return b' ' * (space // 2) + cell + b' ' * (space - space // 2)
+    raise ValueError("'{}' alignment not allowed in string format specifier".format(alignment))
+
+class BytesLayout(Layout):
+    """The layout of a fixed table read or written as bytes rather than text.
+    Every border and delimiter line is encoded once, and the offsets of the
+    cells and cell delimiters are measured in bytes, so borders and delimiters
+    may be of any encoding, but each cell is as many bytes wide as its width.
+
+    Rows are formatted from byte strings, and any other cell is converted to
+    a string and encoded first."""
+
+    def __init__(self, widths, dialect, encoding):
+        """
+        :param widths: An iterable of widths, as accepted by
+            :class:`texttables.fixed.writer`.
+        :param dialect: The :class:`texttables.Dialect` instance to compile.
+        :param encoding: The encoding of the table.
+        """
+        def encode(text):
+            if text is None:
+                return None
+            return text.encode(encoding)
+
+        specs = tuple(parsewidth(width) for width in widths)
+        self.alignments = tuple(alignment for alignment, width in specs)
+        self.widths = tuple(width for alignment, width in specs)
+        self.encoding = encoding
+
+        self._left = encode(dialect.left_border or '')
+        self._right = encode(dialect.right_border or '')
+        self._delimiter = encode(dialect.cell_delimiter)
+
+        self._corner = encode(dialect.corner_border)
+        self._leftcorner = bool(dialect.left_border)
+        self._rightcorner = bool(dialect.right_border)
+
+        self.lineterminator = encode(dialect.lineterminator)
+        self.top = self.delimiter(encode(dialect.top_border))
+        self.header = self.delimiter(encode(dialect.header_delimiter))
+        self.rowdelimiter = self.delimiter(encode(dialect.row_delimiter))
+        self.bottom = self.delimiter(encode(dialect.bottom_border))
+
+        self._measure()
+
+        # A whole row of byte strings is formatted with a single % operation,
+        # which can only align left or right
+        self._template = None
+        if six.PY3 and all(alignment in '<>' for alignment in self.alignments):
+            cells = [b'%' + (b'-' if alignment == '<' else b'') + '{0}.{0}s'.format(width).encode('ascii')
+                for alignment, width in specs]
+            self._template = b''.join((
+                self._left.replace(b'%', b'%%'),
+                self._delimiter.replace(b'%', b'%%').join(cells),
+                self._right.replace(b'%', b'%%'),
+                ))
+
+    def _encode(self, cell):
+        if isinstance(cell, bytes):
+            return cell
+        return six.text_type(cell).encode(self.encoding)
+
+    def row(self, row):
+        '''Format a row of cells into a single line of bytes, without a line
+        terminator.  Extra cells past the number of widths are ignored.
+
+        :param row: An iterable representing the row to format
+        '''
+        if not isinstance(row, tuple):
+            row = tuple(row)
+        if self._template is not None and len(row) == len(self.widths):
+            try:
+                return self._template % row
+            except TypeError:
+                # Not every cell was a byte string
+                pass
+
+        contents = [_pad(self._encode(content), alignment, width)
+            for alignment, width, content in zip(self.alignments, self.widths, row)]
+        return self._left + self._delimiter.join(contents) + self._right
+
+_layouts = dict()
+
+#: The most layouts kept for reuse by :func:`getlayout`
+LAYOUTCACHESIZE = 1024
+
+def getlayout(widths, dialect, encoding=None):
+    '''Get the layout of a table, reusing one already built for the same
+    widths and dialect.  A layout is never changed once it is built, so it can
+    be shared by any number of readers and writers.
+
+    :param widths: A tuple of widths, as accepted by :class:`Layout`
+    :param dialect: The :class:`texttables.CompiledDialect` to compile
+    :param encoding: The encoding of a table read or written as bytes, for a
+        :class:`BytesLayout`.  None for a :class:`Layout`.
+    '''
+    key = (widths, dialect, encoding)
+    layout = _layouts.get(key)
+    if layout is None:
+        if encoding is None:
+            layout = Layout(widths, dialect)
+        else:
+            layout = BytesLayout(widths, dialect, encoding)
+        if len(_layouts) >= LAYOUTCACHESIZE:
+            _layouts.clear()
+        _layouts[key] = layout
+    return layout
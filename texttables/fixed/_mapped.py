@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+import mmap
+import os
+from numbers import Integral
+
+from ._reader import reader
+
+#: How many bytes of a mapping are read between releasing the pages behind
+#: the read position
+RELEASESIZE = 16 * 1024 * 1024
+
+def _lines(mapping, encoding):
+    '''Generate the decoded lines of a mapping, releasing the pages that have
+    been read every :data:`RELEASESIZE` bytes, where the platform allows it.
+    The mapping is read-only and backed by the file, so released pages are
+    simply read from the file again if they are ever touched.'''
+    readline = mapping.readline
+    if not (hasattr(mapping, 'madvise') and hasattr(mmap, 'MADV_DONTNEED')):
+        for line in iter(readline, b''):
+            yield line.decode(encoding)
+        return
+
+    madvise = mapping.madvise
+    released = 0
+    position = 0
+    due = RELEASESIZE
+    for line in iter(readline, b''):
+        yield line.decode(encoding)
+        position += len(line)
+        if position >= due:
+            # Only whole pages can be released
+            end = position - position % mmap.PAGESIZE
+            madvise(mmap.MADV_DONTNEED, released, end - released)
+            released = end
+            due = position + RELEASESIZE
+
+class MappedReader(reader):
+
+    """Fixed-table table reader, reading a table straight out of a
+    memory-mapped file.  Lines are split in the mapping itself and each is
+    decoded exactly once, with no file buffer or incremental decoder in
+    between.  The kernel is advised that the mapping is read sequentially, and
+    the pages behind the read position are released as the table is read,
+    where the platform allows it, so that the resident memory of the mapping
+    stays bounded rather than growing with the table.
+
+    Everything else is :class:`texttables.fixed.reader`, including the
+    validation of the table.  This is an iterable, returning rows from the
+    table as tuples.  This works as a context manager, in which case
+    :meth:`close` will be called automatically.
+
+    Iteration can raise a :class:`texttables.ValidationError` if an invalid
+    table is read."""
+
+    def __init__(self, file, widths, dialect=None, fieldnames=None, columns=None, validateall=True, where=None, encoding='utf-8', trusted=False, converters=None, onerror='raise', **fmtparams):
+        """
+        :param file: A path to the file to map, or an open file descriptor.  A
+            file descriptor is not closed by this class.
+        :param widths: An iterable of widths, as with
+            :class:`texttables.fixed.reader`.
+        :param dialect: A dialect class or object used to define aspects of the
+            table, as with :class:`texttables.fixed.reader`.
+        :param fieldnames: An iterable specifying the field names, as with
+            :class:`texttables.fixed.reader`.
+        :param columns: The columns to read, as with
+            :class:`texttables.fixed.reader`.
+        :param validateall: Whether to validate the delimiters of columns that
+            are not read, as with :class:`texttables.fixed.reader`.
+        :param where: A mapping of columns to values or callables to filter
+            rows by, as with :class:`texttables.fixed.reader`.
+        :param encoding: The encoding of the file.  This must be
+            ASCII-compatible, such as UTF-8 or latin-1, as lines are split on
+            the newline byte.
+        :param trusted: Whether to skip all validation, as with
+            :class:`texttables.fixed.reader`.
+        :param converters: Converters for columns, as with
+            :class:`texttables.fixed.reader`.
+        :param onerror: What to do with a cell that fails to convert, as with
+            :class:`texttables.fixed.reader`.
+        :param fmtparams: parameters to override the parameters in
+            :obj:`dialect`.
+        """
+        if '\n'.encode(encoding) != b'\n':
+            raise ValueError('MappedReader requires an ASCII-compatible encoding')
+
+        if isinstance(file, Integral):
+            fd = file
+        else:
+            fd = os.open(file, os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size:
+                self._map = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            else:
+                # Empty files can't be mapped
+                self._map = None
+        finally:
+            if not isinstance(file, Integral):
+                os.close(fd)
+
+        if self._map is not None:
+            if hasattr(self._map, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self._map.madvise(mmap.MADV_SEQUENTIAL)
+            lines = _lines(self._map, encoding)
+        else:
+            lines = iter(())
+
+        super(MappedReader, self).__init__(lines, widths, dialect, fieldnames, columns, validateall, where, trusted, converters, onerror, **fmtparams)
+        self._file = file
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self):
+        '''Release the mapping.  Rows can not be read after this.'''
+        self._iter = iter(())
+        self._rows = iter(())
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    @property
+    def file(self):
+        '''The path or file descriptor that was passed in to the
+        constructor.'''
+        return self._file
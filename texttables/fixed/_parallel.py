@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+import multiprocessing
+from collections import deque
+from itertools import islice
+from six.moves import range
+
+from texttables.errors import ValidationError
+from ._randomaccess import RandomAccessReader
+from ._reader import reader
+
+def _readrange(task):
+    '''Parse a row-aligned byte range of a table in a worker process.'''
+    path, offset, size, count, widths, dialect, encoding = task
+    parser = reader((), widths, dialect)
+    rowdelimiter = parser._layout.rowdelimiter
+
+    with open(path, 'rb') as file:
+        file.seek(offset)
+        lines = file.read(size).decode(encoding).split('\n')
+    if not lines[-1]:
+        lines.pop()
+    lines = [line.strip('\r\n') for line in lines]
+
+    if rowdelimiter is not None:
+        if dialect.strict:
+            for line in lines[1::2]:
+                if line != rowdelimiter:
+                    raise ValidationError("This row wasn't properly delimited")
+        lines = lines[::2]
+
+    if dialect.strict and len(lines) != count:
+        raise ValidationError('Rows were not where they were expected to be')
+
+    getline = parser._getline
+    return [getline(line) for line in lines]
+
+def _firstready(pending):
+    '''Remove and return whichever of the pending results is ready first'''
+    while True:
+        for result in pending:
+            if result.ready():
+                pending.remove(result)
+                return result
+        pending[0].wait(0.01)
+
+def parallel_read(path, widths, dialect=None, fieldnames=None, encoding='utf-8', workers=None, chunksize=65536, ordered=True, **fmtparams):
+    """Read the rows of a fixed table in a file with a pool of worker
+    processes.  Every row of a fixed table has the same length, so the file is
+    split into byte ranges of whole rows, as with
+    :class:`texttables.fixed.RandomAccessReader`, and each range is parsed in a
+    worker exactly as :class:`texttables.fixed.reader` would parse it.  The
+    top, the header, and the bottom are validated once, before any rows are
+    read.
+
+    This is a generator, yielding rows from the table as tuples.  It can raise
+    a :class:`texttables.ValidationError` if an invalid table is read.
+
+    :param path: The path to the file.
+    :param widths: An iterable of widths, as with
+        :class:`texttables.fixed.reader`.
+    :param dialect: A dialect class or object used to define aspects of the
+        table, as with :class:`texttables.fixed.reader`.
+    :param fieldnames: An iterable specifying the field names, as with
+        :class:`texttables.fixed.reader`.
+    :param encoding: The encoding of the file, which should encode every
+        character with the same number of bytes.
+    :param workers: The number of worker processes.  Defaults to the number of
+        CPUs.
+    :param chunksize: The number of rows each worker parses at a time.  Only
+        a few chunks per worker are parsed ahead of the rows yielded, so a slow
+        consumer never has to hold more than that in memory.
+    :param ordered: Whether to yield rows in the order of the table.  If this
+        is False, chunks of rows are yielded as soon as they are parsed.
+    :param fmtparams: parameters to override the parameters in
+        :obj:`dialect`.
+    """
+    with open(path, 'rb') as file:
+        table = RandomAccessReader(file, widths, dialect, fieldnames, encoding, **fmtparams)
+
+    # Dialects are often local classes, which can't be pickled, so workers
+    # get the compiled dialect instead
+    dialect = table.compiled
+
+    start = table._start
+    stride = table._stride
+    # The last row of the table is not followed by a row delimiter
+    trailing = stride - table._rowlength
+    length = len(table)
+
+    def tasks():
+        for first in range(0, length, chunksize):
+            count = min(chunksize, length - first)
+            size = count * stride
+            if first + count == length:
+                size -= trailing
+            yield (path, start + first * stride, size, count, table.widths, dialect, encoding)
+
+    if not length:
+        return
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        # Chunks are submitted as they are consumed, rather than all at once,
+        # so that parsed rows don't pile up ahead of a slow consumer
+        window = 2 * (workers or multiprocessing.cpu_count())
+        remaining = tasks()
+        pending = deque()
+        while True:
+            for task in islice(remaining, window - len(pending)):
+                pending.append(pool.apply_async(_readrange, (task,)))
+            if not pending:
+                break
+            if ordered:
+                result = pending.popleft()
+            else:
+                result = _firstready(pending)
+            for row in result.get():
+                yield row
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
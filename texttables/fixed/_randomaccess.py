@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+from numbers import Integral
+from six.moves import range
+
+from texttables.errors import ValidationError
+from ._reader import reader
+
+class RandomAccessReader(object):
+
+    """Fixed-table table reader providing random access to the rows of a table
+    stored in a seekable binary file.  Every row of a fixed table has the same
+    length, so the offset of any row can be computed from the length of the
+    lines before the first row and the stride from one row to the next,
+    without scanning the file.  The :class:`texttables.Dialect` class is used
+    to configure how this reads tables.
+
+    Rows are retrieved by indexing, as tuples, and slicing returns a list of
+    rows.  Every row must have the same length once encoded, so the encoding
+    should be one that encodes every character with the same number of bytes,
+    such as ASCII or latin-1, unless the table is known to be otherwise
+    uniform.
+
+    The top, the header, the header delimiter, and the bottom are read and
+    validated on construction.  Rows are validated as they are retrieved, and
+    retrieving a row can raise a :class:`texttables.ValidationError`."""
+
+    def __init__(self, file, widths, dialect=None, fieldnames=None, encoding='utf-8', **fmtparams):
+        """
+        :param file: A seekable file object opened in binary mode.
+        :param widths: An iterable of widths, as with
+            :class:`texttables.fixed.reader`.
+        :param dialect: A dialect class or object used to define aspects of the
+            table, as with :class:`texttables.fixed.reader`.
+        :param fieldnames: An iterable specifying the field names, as with
+            :class:`texttables.fixed.reader`.
+        :param encoding: The encoding of the file.
+        :param fmtparams: parameters to override the parameters in
+            :obj:`dialect`.
+        """
+        self._file = file
+        self._encoding = encoding
+        file.seek(0)
+        self._reader = reader(self._lines(), widths, dialect, fieldnames, **fmtparams)
+
+        # Reads the top, the header, and the header delimiter, if present
+        self._fieldnames = self._reader.fieldnames
+        self._start = file.tell()
+
+        dialect = self._reader.compiled
+        layout = self._reader._layout
+
+        first = file.readline()
+        terminator = first[len(first.rstrip(b'\r\n')):]
+        bottom = b''
+        if layout.bottom is not None:
+            bottom = layout.bottom.encode(encoding) + terminator
+
+        if not first or first == bottom:
+            self._rowlength = 0
+            self._stride = 0
+            self._length = 0
+            return
+
+        self._rowlength = len(first)
+        self._stride = self._rowlength
+        if layout.rowdelimiter is not None:
+            self._stride += len(layout.rowdelimiter.encode(encoding) + terminator)
+
+        file.seek(0, 2)
+        size = file.tell()
+
+        if dialect.strict and bottom and layout.bottom != layout.rowdelimiter:
+            file.seek(max(size - len(bottom), 0))
+            if not file.read().rstrip(b'\r\n').endswith(bottom.rstrip(b'\r\n')):
+                raise ValidationError("This table wasn't properly terminated")
+
+        # Pretend the final row is delimited too, so the body is an exact
+        # multiple of the stride
+        body = size - self._start - len(bottom) + self._stride - self._rowlength
+        if body % self._stride:
+            # The file may not end with a line terminator
+            body += len(terminator)
+        if dialect.strict and body % self._stride:
+            raise ValidationError('The size of the table is not a whole number of rows')
+        self._length = body // self._stride
+
+    def _lines(self):
+        while True:
+            line = self._file.readline()
+            if not line:
+                return
+            yield line.decode(self._encoding)
+
+    @property
+    def file(self):
+        '''The file object that was passed in to the constructor.  It is not
+        safe to change this object until you are finished using the class'''
+        return self._file
+
+    @property
+    def widths(self):
+        '''The widths that were passed into the constructor, as a tuple, with
+        any alignments stripped.'''
+        return self._reader.widths
+
+    @property
+    def dialect(self):
+        '''The :class:`texttables.Dialect` constructed from the passed-in
+        dialect.'''
+        return self._reader.dialect
+
+    @property
+    def compiled(self):
+        '''The :class:`texttables.CompiledDialect` that the table is actually
+        read with.'''
+        return self._reader.compiled
+
+    @property
+    def fieldnames(self):
+        '''The table's fieldnames as a tuple.'''
+        return self._fieldnames
+
+    def _getrow(self, index):
+        self._file.seek(self._start + index * self._stride)
+        line = self._file.read(self._rowlength).decode(self._encoding).strip('\r\n')
+        reader = self._reader
+        if reader._strict and len(line) != reader._layout.length:
+            raise ValidationError('Row {} was not where it was expected to be'.format(index))
+        return reader._getline(line)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._getrow(i) for i in range(*index.indices(self._length))]
+        if not isinstance(index, Integral):
+            raise TypeError('indices must be integers or slices')
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('row index out of range')
+        return self._getrow(index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self._getrow(index)
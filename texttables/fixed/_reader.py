@@ -4,12 +4,51 @@
 # This code is released under the license described in the LICENSE file
 
 from __future__ import division, absolute_import, print_function, unicode_literals
-from six.moves import zip
+from six.moves import filter, map, zip
 from six import Iterator
+from six.moves.collections_abc import Mapping
 from numbers import Integral
+from functools import partial
+from itertools import islice
+from operator import eq, methodcaller
 
-from texttables.dialect import Dialect
+from texttables.dialect import CompiledDialect, _FrozenDialect
 from texttables.errors import ValidationError
+from ._layout import getlayout, parsewidth
+from ._converters import POLICIES, parser, rowbuilder
+from ._row import rowclass, lazyrowclass
+
+def _droplast(iterable):
+    '''Iterate over all but the last item of an iterable'''
+    iterator = iter(iterable)
+    try:
+        previous = next(iterator)
+    except StopIteration:
+        return
+    for item in iterator:
+        yield previous
+        previous = item
+
+#: What DictReader may return each row as
+ROWTYPES = ('dict', 'row', 'lazy')
+
+def lazyrows(reader):
+    '''Build the :class:`texttables.fixed.LazyRow` class of a reader whose field
+    names have been read'''
+    return lazyrowclass(reader._fieldnames, reader._cells(), reader._strip, reader._parsers(), reader._onerror)
+
+def rowmaker(reader, rowtype):
+    '''Set up how the rows of a reader whose field names have been read are
+    made into a row type of :class:`DictReader`.  Returns the callable making
+    each from a tuple, or None if the reader makes them itself.'''
+    fieldnames = tuple(reader._fieldnames)
+    if rowtype == 'dict':
+        return lambda row: dict(zip(fieldnames, row))
+    if rowtype == 'row':
+        return rowclass(fieldnames)
+    # Lazy rows are made by the reader straight from each line
+    reader._make = lazyrows(reader)
+    return None
 
 class reader(Iterator):
 
@@ -20,7 +59,13 @@ class reader(Iterator):
     Iteration can raise a :class:`texttables.ValidationError` if an invalid
     table is read."""
 
-    def __init__(self, file, widths, dialect=None, fieldnames=None, **fmtparams):
+    # The encoding of a table read as bytes
+    _encoding = None
+
+    # What is stripped from the end of each line
+    _newlines = '\r\n'
+
+    def __init__(self, file, widths, dialect=None, fieldnames=None, columns=None, validateall=True, where=None, trusted=False, converters=None, onerror='raise', **fmtparams):
         """
         :param file: An iterable object, returning a line with each iteration.
         :param widths: An iterable of widths, containing the field sizes of the table.
@@ -38,56 +83,86 @@ class reader(Iterator):
             have a header.  If this parameter is absent, the table must have a
             header.  Either way, the field names of the table must be delivered
             to this class in one way, and exactly only one way.
+        :param columns: An iterable of the columns to read, as indices or field
+            names.  If this is present, rows and :attr:`fieldnames` hold only
+            these columns, in this order, and no other cell is sliced or
+            stripped.
+        :param validateall: Whether to validate the delimiters of columns that
+            are not read, if the dialect is strict.  If this is False, only the
+            delimiters preceding the read columns are validated.
+        :param where: A mapping of columns, as indices or field names of the
+            whole table, to either a value or a callable.  Only rows where
+            every such cell is equal to its value, or makes its callable return
+            True, are returned.  The cells are checked straight from the line,
+            after validation but before the row is built.
+        :param trusted: Whether the table is already known to be valid for
+            this dialect and these widths, such as one this module wrote.  If
+            this is True, nothing is validated at all, whether the dialect is
+            strict or not.  Each row is only sliced out of its line, and row
+            delimiters and the bottom are skipped by their position without
+            being looked at, so a table that doesn't match gives wrong rows
+            instead of an error.
+        :param converters: Either a mapping of columns, as indices or field
+            names of the whole table, to converters, or a sequence of a
+            converter for each column, any of which may be None.  Each cell of
+            a converted column is passed through its converter after it is
+            stripped, while its row is built.  A converter may be any callable
+            taking a string, and :class:`int`, :class:`float`, :class:`bool`,
+            :class:`datetime.date`, and :class:`datetime.datetime` are parsed
+            directly, the latter two from ISO 8601.  Booleans may be spelled
+            true, yes, on, 1, false, no, off, 0, or be empty, in any case.
+        :param onerror: What to do with a cell that fails to convert.
+            ``'raise'`` to raise a :class:`ValueError`, ``'none'`` to use
+            None, or ``'keep'`` to keep the cell's text.
         :param fmtparams: parameters to override the parameters in
             :obj:`dialect`.
         """
         self._file = file
         self._iter = iter(file)
-        self._widths = list()
-        for width in widths:
-            if isinstance(width, Integral):
-                self._widths.append(width)
-            else:
-                swidth = str(width)
-                try:
-                    width = int(swidth)
-                except ValueError:
-                    width = int(swidth[1:])
-                self._widths.append(width)
-
-        self._widths = tuple(self._widths)
-
-        self.dialect = dialect
-
-        for attribute in dir(self.dialect):
-            if '__' not in attribute:
-                if attribute in fmtparams:
-                    setattr(self._dialect, attribute, fmtparams[attribute])
+        self._widths = tuple(parsewidth(width)[1] for width in widths)
+
+        self._columns = None
+        if columns is not None:
+            self._columns = tuple(columns)
+        self._validateall = validateall
+        self._indices = None
+
+        self._where = None
+        if where is not None:
+            self._where = tuple(where.items())
+        self._tests = None
+        self._filter = None
+
+        self._trusted = trusted
+        self._rows = None
+        # Makes a row straight from each validated line instead, for the lazy
+        # rows of DictReader
+        self._make = None
+
+        if onerror not in POLICIES:
+            raise ValueError('onerror must be one of raise, none, or keep')
+        self._converters = converters
+        self._onerror = onerror
+        self._conversions = None
+
+        self._dialect = None
+        self._compiled = CompiledDialect.compile(dialect, **fmtparams)
+        self._compile()
 
         self._fieldnames = fieldnames
+        if self._fieldnames:
+            self._project(self._fieldnames)
 
-        self.__foundtop = not self.dialect.top_border
-        self.__top = None
-        if self.dialect.top_border:
-            self.__top = self._rowdelim(self.dialect.top_border)
+        compiled = self._compiled
+        self.__foundtop = not compiled.top_border
 
-        self.__header = None
         if self._fieldnames:
             self.__foundheader = True
         else:
-            self.__foundheader = not self.dialect.header_delimiter
-            if self.dialect.header_delimiter:
-                self.__header = self._rowdelim(self.dialect.header_delimiter)
+            self.__foundheader = not compiled.header_delimiter
 
-        self.__foundbottom = not self.dialect.bottom_border
+        self.__foundbottom = not compiled.bottom_border
         self.__finished = False
-        self.__bottom = None
-        if self.dialect.bottom_border:
-            self.__bottom = self._rowdelim(self.dialect.bottom_border)
-
-        self.__row_delimiter = None
-        if self.dialect.row_delimiter:
-            self.__row_delimiter = self._rowdelim(self.dialect.row_delimiter)
 
         self.__first_line = True
         self.__foundrow = False
@@ -109,132 +184,280 @@ class reader(Iterator):
         '''The :class:`texttables.Dialect` constructed from the passed-in
         dialect.  This is always unique, and is not the same object that is
         passed in.  Assigning to this will also likewise construct a new
-        :class:`texttables.Dialect`, not simply assign the attribute.'''
+        :class:`texttables.Dialect`, not simply assign the attribute.
+
+        The border and delimiter lines that rows are checked against are
+        compiled from the dialect when it is assigned, so its attributes can't
+        be changed in place, and changing one raises an
+        :class:`AttributeError`.  Assign a new dialect instead, such as one
+        built with ``compiled.todialect()``.'''
+        if self._dialect is None:
+            self._dialect = _FrozenDialect(self._compiled)
         return self._dialect
 
     @dialect.setter
     def dialect(self, value):
-        self._dialect = Dialect()
-        if value is not None:
-            for attribute in dir(self._dialect):
-                if '__' not in attribute:
-                    setattr(self._dialect, attribute, getattr(value, attribute))
+        self._dialect = None
+        self._compiled = CompiledDialect.compile(value)
+        self._compile()
+
+    @property
+    def compiled(self):
+        '''The :class:`texttables.CompiledDialect` that the table is actually
+        read with.'''
+        return self._compiled
+
+    def _compile(self):
+        compiled = self._compiled
+        layout = getlayout(self._widths, compiled, self._encoding)
+        self._layout = layout
+        self._strict = compiled.strict and not self._trusted
+        self._strip = compiled.strip
+        self._left = layout._left
+        self._right = layout._right
+        if self._indices is None:
+            self._slicecells = layout.slicecells
+            self._slicedelimiters = layout.slicedelimiters
+            self._celldelimiters = layout.celldelimiters
+        else:
+            self._slicecells, self._slicedelimiters, self._celldelimiters = (
+                layout.project(self._indices, self._validateall))
+        if self._tests is not None:
+            self._filter = tuple((layout.cells[index], test) for index, test in self._tests)
+        self._build = None
+        if self._conversions is not None:
+            self._build = rowbuilder(self._slicecells, self._strip, self._conversions, self._onerror)
+        self.__top = layout.top
+        self.__header = layout.header
+        self.__bottom = layout.bottom
+        self.__row_delimiter = layout.rowdelimiter
 
     @property
     def fieldnames(self):
         '''The table's fieldnames as a tuple.  This will invoke a read on
         the file if this method has not been called and this object hasn't yet
-        been iterated upon.
+        been iterated upon.  If only some columns are read, this holds only
+        their field names.
         
         :raises texttables.ValidationError: if the table does not properly match the dialect
         '''
 
         if not self.__foundtop:
-            line = next(self._iter).strip('\r\n')
-            if self.dialect.strict and line != self.__top:
+            line = next(self._iter).strip(self._newlines)
+            if self._strict and line != self.__top:
                 raise ValidationError('The first line of the table did not match what the top of the table should be')
             self.__foundtop = True
 
         if not self._fieldnames:
-            line = next(self._iter).strip('\r\n')
+            line = next(self._iter).strip(self._newlines)
             self._fieldnames = self._getline(line)
+            self._project(self._fieldnames)
 
         if not self.__foundheader:
-            line = next(self._iter).strip('\r\n')
-            if self.dialect.strict and line != self.__header:
+            line = next(self._iter).strip(self._newlines)
+            if self._strict and line != self.__header:
                 raise ValidationError("The header of the table wasn't properly delimited")
             self.__foundheader = True
 
         return self._fieldnames
 
+    def _project(self, fieldnames):
+        '''Resolve the columns to read and the columns to filter on against the
+        full field names, narrow the field names down to the columns read, and
+        recompile the parsing of each row.'''
+        if self._columns is None and self._where is None and self._converters is None:
+            return
+        fieldnames = tuple(fieldnames)
+
+        def index(column):
+            if isinstance(column, Integral):
+                return column
+            try:
+                return fieldnames.index(column)
+            except ValueError:
+                raise ValueError('{!r} is not a field of the table'.format(column))
+
+        if self._columns is not None:
+            self._indices = tuple(index(column) for column in self._columns)
+            self._fieldnames = tuple(fieldnames[column] for column in self._indices)
+
+        if self._where is not None:
+            tests = list()
+            for column, test in self._where:
+                if not callable(test):
+                    test = partial(eq, test)
+                tests.append((index(column), test))
+            self._tests = tuple(tests)
+
+        if self._converters is not None:
+            if isinstance(self._converters, Mapping):
+                converters = self._converters.items()
+            else:
+                converters = enumerate(self._converters)
+            conversions = list()
+            for column, converter in converters:
+                if converter is None:
+                    continue
+                column = index(column)
+                if self._indices is None:
+                    positions = [column]
+                else:
+                    # Converters of columns that aren't read are unused
+                    positions = [position for position, read in enumerate(self._indices) if read == column]
+                for position in positions:
+                    conversions.append((position, self._parser(converter), fieldnames[column]))
+            self._conversions = tuple(conversions)
+
+        self._compile()
+
+    def _parser(self, converter):
+        return parser(converter)
+
+    def _cells(self):
+        '''The slice of a line holding each cell of a row'''
+        cells = self._layout.cells
+        if self._indices is not None:
+            cells = [cells[index] for index in self._indices]
+        return cells
+
+    def _parsers(self):
+        '''A mapping of the positions of converted cells in a row to the
+        callables to convert them with'''
+        if self._conversions is None:
+            return dict()
+        return {position: parse for position, parse, name in self._conversions}
+
     def _getline(self, line):
-        dialect = self.dialect
-        if dialect.left_border:
-            if dialect.strict and not line.startswith(dialect.left_border):
+        layout = self._layout
+        strict = self._strict
+        strip = self._strip
+        left = self._left
+        right = self._right
+
+        if left:
+            if strict and not line.startswith(left):
                 raise ValidationError('row did not have the correct left border')
-            line = line[len(dialect.left_border):]
-        if dialect.right_border:
-            if dialect.strict and not line.endswith(dialect.right_border):
-                raise ValidationError('row did not have the correct right border')
-            line = line[:-len(dialect.right_border)]
-
-        row = list()
 
-        # Adding delimiter at beginning so that validation doesn't need to be
-        # special-cased for the first cell.
-        line = dialect.cell_delimiter + line
-
-        for width in self.widths:
-            delimiter = line[0:len(dialect.cell_delimiter)]
-            if dialect.strict and delimiter != dialect.cell_delimiter:
-                raise ValidationError('Cell was not delimited properly')
-            line = line[len(dialect.cell_delimiter):]
-            contents = line[:width]
-            if dialect.strip:
+        end = len(line)
+        if right:
+            # The right border may not overlap the left one
+            if strict and not line.endswith(right, layout.contentstart):
+                raise ValidationError('row did not have the correct right border')
+            end = max(end - len(right), layout.contentstart)
+
+        if end != layout.contentend:
+            if end > layout.contentend:
+                raise ValidationError('There was garbage at the end of the input')
+            # A short line is cut at its right border, so the offsets of the
+            # missing cells simply slice nothing
+            line = line[:end]
+
+        if strict and self._slicedelimiters(line) != self._celldelimiters:
+            raise ValidationError('Cell was not delimited properly')
+
+        if self._filter is not None and not self._test(line):
+            return None
+
+        if self._make is not None:
+            return self._make(line)
+
+        if self._build is not None:
+            return self._build(line)
+
+        row = self._slicecells(line)
+        if strip:
+            row = tuple([contents.strip() for contents in row])
+        return row
+
+    def _test(self, line):
+        '''Check the cells of a line against the where conditions'''
+        strip = self._strip
+        for cell, test in self._filter:
+            contents = line[cell]
+            if strip:
                 contents = contents.strip()
-            row.append(contents)
-            line = line[width:]
-
-        if line:
-            raise ValidationError('There was garbage at the end of the input')
-
-        return tuple(row)
-
-    def _rowdelim(self, delimiter):
-        dialect = self.dialect
-        delimcontents = list()
-        for rawwidth in self._widths:
-            swidth = str(rawwidth)
-            try:
-                width = int(swidth)
-            except ValueError:
-                width = int(swidth[1:])
-            delimcontents.append(delimiter * width)
-        delim = ''
-        if dialect.left_border:
-            delim = dialect.corner_border
-        delim += dialect.corner_border.join(delimcontents)
-        if dialect.right_border:
-            delim += dialect.corner_border
-        return delim
+            if not test(contents):
+                return False
+        return True
+
+    def _trustedrows(self):
+        '''Build the iterator of rows of a trusted table, which only slices
+        the cells out of each line'''
+        self.fieldnames
+
+        lines = self._iter
+        layout = self._layout
+        if layout.rowdelimiter is not None:
+            # Rows and delimiters alternate, and the bottom falls on a
+            # delimiter
+            lines = islice(lines, 0, None, 2)
+        elif layout.bottom is not None:
+            lines = _droplast(lines)
+        # Line terminators would otherwise end up in the last cell of a short
+        # line, unlike with a validated table
+        lines = map(methodcaller('strip', self._newlines), lines)
+        if self._filter is not None:
+            lines = filter(self._test, lines)
+
+        if self._make is not None:
+            return map(self._make, lines)
+
+        if self._build is not None:
+            return map(self._build, lines)
+
+        rows = map(self._slicecells, lines)
+        if self._strip:
+            rows = (tuple([contents.strip() for contents in row]) for row in rows)
+        return rows
 
     def __iter__(self):
+        if self._trusted:
+            if self._rows is None:
+                self._rows = self._trustedrows()
+            return self._rows
         return self
 
     def __next__(self):
+        if self._trusted:
+            return next(iter(self))
+
         fieldnames = self.fieldnames
 
-        if self.__finished:
-            raise StopIteration
-
-        try:
-            line = next(self._iter).strip('\r\n')
-            if self.__row_delimiter:
-                # Deal with alternating delimiters
-                if not self.__first_line:
-                    if line != self.__row_delimiter:
-                        if line == self.__bottom:
-                            self.__foundbottom = True
-                            self.__finished = True
-                            raise StopIteration
-                        if self.dialect.strict:
-                            raise ValidationError("This row wasn't properly delimited")
-                    line = next(self._iter).strip('\r\n')
-            else:
-                if line == self.__bottom:
-                    self.__foundbottom = True
-                    self.__finished = True
-                    raise StopIteration
-        except StopIteration:
-            # Try to detect if the bottom was found.  If the bottom wasn't
-            # found, make sure the bottom doesn't match the row delimiter, which
-            # would prevent the bottom from being detected at all
-            if self.dialect.strict and not (self.__foundbottom or
-                    self.__row_delimiter == self.__bottom):
-                raise ValidationError("This table wasn't properly terminated")
-            raise StopIteration
-        self.__first_line = False
-        return self._getline(line)
+        # Rows filtered out by where are parsed as None, and skipped
+        row = None
+        while row is None:
+            if self.__finished:
+                raise StopIteration
+
+            try:
+                line = next(self._iter).strip(self._newlines)
+                if self.__row_delimiter:
+                    # Deal with alternating delimiters
+                    if not self.__first_line:
+                        if line != self.__row_delimiter:
+                            if line == self.__bottom:
+                                self.__foundbottom = True
+                                self.__finished = True
+                                raise StopIteration
+                            if self._strict:
+                                raise ValidationError("This row wasn't properly delimited")
+                        line = next(self._iter).strip(self._newlines)
+                else:
+                    if line == self.__bottom:
+                        self.__foundbottom = True
+                        self.__finished = True
+                        raise StopIteration
+            except StopIteration:
+                # Try to detect if the bottom was found.  If the bottom wasn't
+                # found, make sure the bottom doesn't match the row delimiter, which
+                # would prevent the bottom from being detected at all
+                if self._strict and not (self.__foundbottom or
+                        self.__row_delimiter == self.__bottom):
+                    raise ValidationError("This table wasn't properly terminated")
+                raise StopIteration
+            self.__first_line = False
+            row = self._getline(line)
+        return row
 
 class DictReader(Iterator):
 
@@ -242,16 +465,26 @@ class DictReader(Iterator):
     column-sizes. The :class:`texttables.Dialect` class is used to configure how this reads
     tables.  Tables are read one row at a time.  This is a simple convenience
     frontend to :class:`texttables.fixed.reader`.  This is an iterable,
-    returning rows from the table as dictionaries."""
+    returning rows from the table as dictionaries, or as the lighter
+    :class:`texttables.fixed.Row` or :class:`texttables.fixed.LazyRow`."""
 
-    def __init__(self, file, widths, dialect=None, fieldnames=None, **fmtparams):
+    def __init__(self, file, widths, dialect=None, fieldnames=None, columns=None, validateall=True, where=None, trusted=False, converters=None, onerror='raise', rowtype='dict', **fmtparams):
         """
-        All the passed in construction parameters are passed to the
-        :class:`texttables.fixed.reader` constructor literally.  All properties
-        also align directly as well.
+        All the passed in construction parameters but :obj:`rowtype` are
+        passed to the :class:`texttables.fixed.reader` constructor literally.
+        All properties also align directly as well.
+
+        :param rowtype: What each row is returned as.  ``'dict'`` for a
+            dictionary, ``'row'`` for a :class:`texttables.fixed.Row`, or
+            ``'lazy'`` for a :class:`texttables.fixed.LazyRow`.
         """
-        self._reader = reader(file, widths, dialect, fieldnames, **fmtparams)
-        self._iter = iter(self._reader)
+        if rowtype not in ROWTYPES:
+            raise ValueError('rowtype must be one of dict, row, or lazy')
+        self._reader = reader(file, widths, dialect, fieldnames, columns, validateall, where, trusted, converters, onerror, **fmtparams)
+        self._rowtype = rowtype
+        # The rows are only set up once the field names are read
+        self._iter = None
+        self._make = None
 
     @property
     def file(self):
@@ -268,14 +501,31 @@ class DictReader(Iterator):
     @dialect.setter
     def dialect(self, value):
         self._reader.dialect = value
+        if self._iter is not None and self._rowtype == 'lazy':
+            self._reader._make = lazyrows(self._reader)
+
+    @property
+    def compiled(self):
+        return self._reader.compiled
 
     @property
     def fieldnames(self):
         return self._reader.fieldnames
 
+    def _prepare(self):
+        '''Read the field names, and set up how each row is made from them
+        once, rather than for every row'''
+        self._reader.fieldnames
+        self._make = rowmaker(self._reader, self._rowtype)
+        self._iter = iter(self._reader)
+
     def __iter__(self):
         return self
 
     def __next__(self):
+        if self._iter is None:
+            self._prepare()
         row = next(self._iter)
-        return {key: value for key, value in zip(self.fieldnames, row)}
+        if self._make is None:
+            return row
+        return self._make(row)
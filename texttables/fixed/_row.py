@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+from numbers import Integral
+from six.moves import zip
+from six.moves.collections_abc import Mapping
+
+from ._converters import cellconverter
+
+class _Fields(object):
+    '''The dictionary methods shared by both kinds of rows, which only need
+    ``__getitem__`` and the field names'''
+
+    __slots__ = ()
+
+    #: The field names of rows of this class
+    fieldnames = ()
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def keys(self):
+        '''The field names, as a tuple.'''
+        return self.fieldnames
+
+    def values(self):
+        '''The cells, as a tuple.'''
+        return tuple(self[field] for field in self.fieldnames)
+
+    def items(self):
+        '''The ``(field name, cell)`` pairs, as a list.'''
+        return list(zip(self.fieldnames, self.values()))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self):
+        return iter(self.fieldnames)
+
+    def __contains__(self, key):
+        return key in self.fieldnames
+
+    def __eq__(self, other):
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, Mapping):
+            return dict(self.items()) != dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, dict(self.items()))
+
+class Row(_Fields):
+    """A row read by :class:`texttables.fixed.DictReader`, taking far less
+    memory than a dictionary and far less time to build.  It holds only the
+    tuple of the cells, and each reader makes its own subclass holding the
+    field names and the position of each, shared by all of its rows.
+
+    It acts like a read-only dictionary: a cell is got by its field name as
+    ``row['name']``, or by its position as ``row[0]``, iterating gives the
+    field names, and it compares equal to a dictionary with the same items.
+    :meth:`values` gives the cells as a tuple.  A cell may also be got as an
+    attribute, as ``row.name``, as long as its field name is a valid
+    identifier that isn't the name of a method."""
+
+    __slots__ = ('_cells',)
+
+    _index = dict()
+
+    def __init__(self, cells):
+        self._cells = tuple(cells)
+
+    def __getitem__(self, key):
+        try:
+            return self._cells[self._index[key]]
+        except (KeyError, TypeError):
+            if isinstance(key, (Integral, slice)):
+                return self._cells[key]
+            raise KeyError(key)
+
+    def __len__(self):
+        return len(self._cells)
+
+    def values(self):
+        '''The cells, as a tuple.'''
+        return self._cells
+
+    def __reduce__(self):
+        return (_rebuild, (Row, self.fieldnames, self._cells))
+
+class LazyRow(_Fields):
+    """A row read by :class:`texttables.fixed.DictReader` that holds only the
+    line it was read from, which is validated when it is read.  Each cell is
+    sliced out of the line, stripped, and converted only when it is got, and
+    again every time it is.  Otherwise, this acts just like
+    :class:`texttables.fixed.Row`.
+
+    This is the cheapest way to read rows where only a few cells of each are
+    ever looked at.  Conversion errors are only raised when the cell is
+    got."""
+
+    __slots__ = ('_line',)
+
+    _getters = dict()
+
+    def __init__(self, line):
+        self._line = line
+
+    def __getitem__(self, key):
+        try:
+            getter = self._getters[key]
+        except (KeyError, TypeError):
+            raise KeyError(key)
+        return getter(self._line)
+
+    def __len__(self):
+        return len(self.fieldnames)
+
+    def __reduce__(self):
+        return (_rebuild, (Row, self.fieldnames, self.values()))
+
+def _rebuild(base, fieldnames, values):
+    '''Unpickle a row as a :class:`Row`, as row classes are built at runtime'''
+    return rowclass(fieldnames)(values)
+
+_rowclasses = dict()
+
+def rowclass(fieldnames):
+    '''Get the :class:`Row` subclass for the field names, reusing one that
+    already exists.'''
+    fieldnames = tuple(fieldnames)
+    cls = _rowclasses.get(fieldnames)
+    if cls is None:
+        cls = type(str('Row'), (Row,), {
+            '__slots__': (),
+            'fieldnames': fieldnames,
+            '_index': {field: position for position, field in enumerate(fieldnames)},
+            })
+        _rowclasses[fieldnames] = cls
+    return cls
+
+def _getter(cell, strip, parse, onerror, name):
+    '''Build the function getting a single cell from a line'''
+    if parse is None:
+        if strip:
+            return lambda line: line[cell].strip()
+        return lambda line: line[cell]
+    convert = cellconverter(parse, strip, onerror, name)
+    return lambda line: convert(line[cell])
+
+def lazyrowclass(fieldnames, cells, strip, parsers, onerror):
+    '''Build a :class:`LazyRow` subclass for a reader.
+
+    :param fieldnames: The field names of the row
+    :param cells: The slice of a line holding each cell of the row
+    :param strip: Whether to strip each cell
+    :param parsers: A mapping of the positions of cells in the row to the
+        callables to convert them with
+    :param onerror: The failure policy of a conversion
+    '''
+    fieldnames = tuple(fieldnames)
+    getters = dict()
+    for position, (field, cell) in enumerate(zip(fieldnames, cells)):
+        getter = _getter(cell, strip, parsers.get(position), onerror, field)
+        getters[position] = getter
+        getters[field] = getter
+    return type(str('LazyRow'), (LazyRow,), {
+        '__slots__': (),
+        'fieldnames': fieldnames,
+        '_getters': getters,
+        })
+
+Mapping.register(Row)
+Mapping.register(LazyRow)
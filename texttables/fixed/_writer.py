@@ -4,8 +4,25 @@
 # This code is released under the license described in the LICENSE file
 
 from __future__ import division, absolute_import, print_function, unicode_literals
-from six.moves import zip
-from texttables.dialect import Dialect
+from six.moves import map, range, zip
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+import marshal
+import multiprocessing
+
+from texttables.dialect import CompiledDialect, _FrozenDialect
+from ._layout import getlayout
+from . import _columns
+
+def _formatrows(task):
+    '''Format a chunk of rows in a worker process into a single block of
+    lines, with the row delimiter between them but not before the first'''
+    widths, dialect, encoding, rowdelim, terminator, marshalled, rows = task
+    if marshalled:
+        rows = marshal.loads(rows)
+    row = getlayout(widths, dialect, encoding).row
+    return (rowdelim or terminator[:0]).join([row(cells) + terminator for cells in rows])
 
 class writer(object):
 
@@ -14,6 +31,8 @@ class writer(object):
     tables.  This works as a context manager, in which case :meth:`writetop` and
     :meth:`writebottom` will be called automatically."""
 
+    # The encoding of a table written as bytes
+    _encoding = None
 
     def __init__(self, file, widths, dialect=None, **fmtparams):
         """
@@ -32,23 +51,20 @@ class writer(object):
         self._file = file
         self._widths = tuple(widths)
 
-        self.dialect = dialect
-
-        for attribute in dir(self.dialect):
-            if '__' not in attribute:
-                if attribute in fmtparams:
-                    setattr(self._dialect, attribute, fmtparams[attribute])
+        self._dialect = None
+        self._compiled = CompiledDialect.compile(dialect or None, **fmtparams)
+        self._compile()
 
         self.__wroterow = False
         self.__wroteheader = False
 
     def __enter__(self):
-        if self.dialect.top_border:
+        if self._compiled.top_border:
             self.writetop()
         return self
 
     def __exit__(self, type, value, traceback):
-        if self.dialect.bottom_border:
+        if self._compiled.bottom_border:
             self.writebottom()
 
     @property
@@ -67,57 +83,51 @@ class writer(object):
         '''The :class:`texttables.Dialect` constructed from the passed-in
         dialect.  This is always unique, and is not the same object that is
         passed in.  Assigning to this will also likewise construct a new
-        :class:`texttables.Dialect`, not simply assign the attribute.'''
+        :class:`texttables.Dialect`, not simply assign the attribute.
+
+        The row layout and every delimiter line are compiled from the dialect
+        when it is assigned, so its attributes can't be changed in place, and
+        changing one raises an :class:`AttributeError`.  Assign a new dialect
+        instead, such as one built with ``compiled.todialect()``.'''
+        if self._dialect is None:
+            self._dialect = _FrozenDialect(self._compiled)
         return self._dialect
 
     @dialect.setter
     def dialect(self, value):
-        self._dialect = Dialect()
-        if value:
-            for attribute in dir(self._dialect):
-                if '__' not in attribute:
-                    setattr(self._dialect, attribute, getattr(value, attribute))
+        self._dialect = None
+        self._compiled = CompiledDialect.compile(value or None)
+        self._compile()
+
+    @property
+    def compiled(self):
+        '''The :class:`texttables.CompiledDialect` that the table is actually
+        written with.'''
+        return self._compiled
+
+    def _compile(self):
+        layout = getlayout(self._widths, self._compiled, self._encoding)
+        terminator = layout.lineterminator
+        self._layout = layout
+        self._terminator = terminator
+
+        # Every line that isn't a row is built once here, terminator included
+        self._top = None
+        if layout.top is not None:
+            self._top = layout.top + terminator
+        self._bottom = None
+        if layout.bottom is not None:
+            self._bottom = layout.bottom + terminator
+        self._headerdelim = None
+        self._rowdelim = None
+        if self._compiled.corner_border:
+            if layout.header is not None:
+                self._headerdelim = layout.header + terminator
+            if layout.rowdelimiter is not None:
+                self._rowdelim = layout.rowdelimiter + terminator
 
     def _row(self, row):
-        dialect = self.dialect
-        contents = list()
-        for cell, rawwidth in zip(row, self._widths):
-            swidth = str(rawwidth)
-            alignment = '<'
-            try:
-                width = int(swidth)
-            except ValueError:
-                alignment = swidth[0]
-                width = int(swidth[1:])
-            contents.append('{content!s:{alignment}{width}.{width}s}'.format(
-                content=cell,
-                alignment=alignment,
-                width=width))
-        row = ''
-        if dialect.left_border:
-            row = dialect.left_border
-        row += dialect.cell_delimiter.join(contents)
-        if dialect.right_border:
-            row += dialect.right_border
-        return row
-
-    def _rowdelim(self, delimiter):
-        dialect = self.dialect
-        delimcontents = list()
-        for rawwidth in self._widths:
-            swidth = str(rawwidth)
-            try:
-                width = int(swidth)
-            except ValueError:
-                width = int(swidth[1:])
-            delimcontents.append(delimiter * width)
-        delim = ''
-        if dialect.left_border:
-            delim = dialect.corner_border
-        delim += dialect.corner_border.join(delimcontents)
-        if dialect.right_border:
-            delim += dialect.corner_border
-        return delim
+        return self._layout.row(row)
 
     def writerow(self, row):
         '''Write a single row out to :meth:`file`, respecting any delimiters and
@@ -125,30 +135,163 @@ class writer(object):
 
         :param row: An iterable representing the row to write
         '''
-        dialect = self.dialect
         if self.__wroteheader:
-            if dialect.header_delimiter and dialect.corner_border:
-                self._file.write(self._rowdelim(dialect.header_delimiter))
-                self._file.write(dialect.lineterminator)
+            if self._headerdelim:
+                self._file.write(self._headerdelim)
         elif self.__wroterow:
-            if dialect.row_delimiter and dialect.corner_border:
-                self._file.write(self._rowdelim(dialect.row_delimiter))
-                self._file.write(dialect.lineterminator)
+            if self._rowdelim:
+                self._file.write(self._rowdelim)
 
-        self._file.write(self._row(row))
-        self._file.write(dialect.lineterminator)
+        self._file.write(self._layout.row(row) + self._terminator)
 
         self.__wroteheader = False
         self.__wroterow = True
 
-    def writerows(self, rows):
+    def writerows(self, rows, chunksize=4096, workers=None):
         '''Write a multiple rows out to :meth:`file`, respecting any delimiters
-        and header separators necessary.
+        and header separators necessary.  Rows are formatted in chunks, and
+        each chunk is written with a single ``write`` call.
+
+        With a number of workers, the chunks are formatted in a pool of that
+        many worker processes, and written out in order as they are done, so
+        the output is the same.  Only a few chunks per worker are in flight at
+        once, so the rows may be a generator of any length.  The cells must be
+        picklable, and each worker process is started for this call, so this
+        is only worth it for many rows.
 
         :param rows: An iterable of iterables representing the rows to write
+        :param chunksize: The number of rows to format before each write
+        :param workers: The number of worker processes to format rows with.
+            None to format them in this process.
         '''
-        for row in rows:
-            self.writerow(row)
+        if workers is not None:
+            self._poolwriterows(rows, chunksize, workers)
+            return
+
+        row = self._layout.row
+        terminator = self._terminator
+        join = terminator[:0].join
+        rowdelim = self._rowdelim
+        write = self._file.write
+
+        if self.__wroteheader:
+            delimiter = self._headerdelim
+        elif self.__wroterow:
+            delimiter = rowdelim
+        else:
+            delimiter = None
+
+        lines = list()
+        append = lines.append
+        count = 0
+        try:
+            for cells in rows:
+                if delimiter:
+                    append(delimiter)
+                append(row(cells) + terminator)
+                delimiter = rowdelim
+                count += 1
+                if count == chunksize:
+                    write(join(lines))
+                    del lines[:]
+                    count = 0
+                    self.__wroteheader = False
+                    self.__wroterow = True
+        finally:
+            # Whatever was formatted is still written if a row fails
+            if lines:
+                write(join(lines))
+                self.__wroteheader = False
+                self.__wroterow = True
+
+    def _poolwriterows(self, rows, chunksize, workers):
+        write = self._file.write
+        rowdelim = self._rowdelim
+        rows = iter(rows)
+
+        if self.__wroteheader:
+            delimiter = self._headerdelim
+        elif self.__wroterow:
+            delimiter = rowdelim
+        else:
+            delimiter = None
+
+        pool = multiprocessing.Pool(workers)
+        try:
+            # Dialects are often local classes, which can't be pickled, so
+            # workers get the compiled dialect instead
+            task = (self._widths, self._compiled, self._encoding, rowdelim, self._terminator)
+            window = 2 * (workers or multiprocessing.cpu_count())
+            pending = deque()
+            while True:
+                chunk = list(islice(rows, chunksize))
+                if chunk:
+                    # Marshalling rows of plain values for the worker is far
+                    # faster than pickling them
+                    try:
+                        payload = (True, marshal.dumps(chunk))
+                    except ValueError:
+                        payload = (False, chunk)
+                    pending.append(pool.apply_async(_formatrows, (task + payload,)))
+                if pending and (not chunk or len(pending) >= window):
+                    block = pending.popleft().get()
+                    if delimiter:
+                        block = delimiter + block
+                    write(block)
+                    delimiter = rowdelim
+                    self.__wroteheader = False
+                    self.__wroterow = True
+                elif not chunk:
+                    break
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def writecolumns(self, columns, chunksize=65536):
+        '''Write rows out to :meth:`file` from whole columns, such as NumPy
+        arrays, respecting any delimiters and header separators necessary.
+        Every cell is converted, truncated, and aligned a whole column at a
+        time, and each chunk of rows is laid out at once and written with a
+        single ``write`` call, without building a row object per row.  The
+        output is the same as writing the rows with :meth:`writerows`.
+
+        Without NumPy, this simply writes the rows with :meth:`writerows`.
+
+        :param columns: A sequence of columns, each a sequence of cells, all
+            the same length
+        :param chunksize: The number of rows to format before each write
+        '''
+        columns = list(columns)
+        if not columns:
+            return
+        length = len(columns[0])
+        if any(len(column) != length for column in columns):
+            raise ValueError('Every column must have the same length')
+        if _columns.numpy is None:
+            self.writerows(zip(*columns), chunksize)
+            return
+
+        columns = [_columns.strings(column) for column in columns]
+        rowdelim = self._rowdelim or ''
+        write = self._file.write
+
+        if self.__wroteheader:
+            delimiter = self._headerdelim
+        elif self.__wroterow:
+            delimiter = self._rowdelim
+        else:
+            delimiter = None
+
+        for first in range(0, length, chunksize):
+            block = [column[first:first + chunksize] for column in columns]
+            text = _columns.formatblock(self._layout, block, rowdelim)
+            if delimiter:
+                text = delimiter + text
+            write(text)
+            delimiter = self._rowdelim
+            self.__wroteheader = False
+            self.__wroterow = True
 
     def writeheader(self, row):
         '''Write the header out to :meth:`file`.
@@ -160,15 +303,11 @@ class writer(object):
 
     def writetop(self):
         '''Write the top of the table out to :meth:`file`.'''
-        dialect = self.dialect
-        self._file.write(self._rowdelim(dialect.top_border))
-        self._file.write(dialect.lineterminator)
+        self._file.write(self._top)
 
     def writebottom(self):
         '''Write the bottom of the table out to :meth:`file`.'''
-        dialect = self.dialect
-        self._file.write(self._rowdelim(dialect.bottom_border))
-        self._file.write(dialect.lineterminator)
+        self._file.write(self._bottom)
 
 class DictWriter(object):
     """Fixed-table document writer, writing tables with predefined column-sizes
@@ -189,7 +328,7 @@ class DictWriter(object):
         """
 
         self._writer = writer(file, widths, dialect, **fmtparams)
-        self._fieldnames = fieldnames
+        self.fieldnames = fieldnames
 
     def __enter__(self):
         self._writer.__enter__()
@@ -215,6 +354,10 @@ class DictWriter(object):
     def dialect(self, value):
         self._writer.dialect = value
 
+    @property
+    def compiled(self):
+        return self._writer.compiled
+
     @property
     def fieldnames(self):
         return self._fieldnames
@@ -222,6 +365,12 @@ class DictWriter(object):
     @fieldnames.setter
     def fieldnames(self, value):
         self._fieldnames = value
+        fields = tuple(value)
+        if len(fields) == 1:
+            field = fields[0]
+            self._cells = lambda row: (row[field],)
+        else:
+            self._cells = itemgetter(*fields)
 
     def writeheader(self):
         '''Write the header based on :meth:`fieldnames`.'''
@@ -233,16 +382,30 @@ class DictWriter(object):
 
         :param row: A dictionary representing the row to write
         '''
-        self._writer.writerow(row[field] for field in self._fieldnames)
+        self._writer.writerow(self._cells(row))
 
-    def writerows(self, rows):
+    def writerows(self, rows, chunksize=4096, workers=None):
         '''Write multiple rows out to :meth:`file`, respecting any delimiters and
-        header separators necessary.
+        header separators necessary.  Rows are written in chunks, as with
+        :meth:`texttables.fixed.writer.writerows`, and may be formatted by
+        worker processes in the same way.  The cells of each row are taken in
+        this process.
 
         :param row: An iterable of dictionaries representing the rows to write
+        :param chunksize: The number of rows to format before each write
+        :param workers: The number of worker processes to format rows with.
+            None to format them in this process.
+        '''
+        self._writer.writerows(map(self._cells, rows), chunksize, workers)
+
+    def writecolumns(self, columns, chunksize=65536):
+        '''Write rows out to :meth:`file` from whole columns, as with
+        :meth:`texttables.fixed.writer.writecolumns`.
+
+        :param columns: A mapping of each field name to its column
+        :param chunksize: The number of rows to format before each write
         '''
-        for row in rows:
-            self.writerow(row)
+        self._writer.writecolumns([columns[field] for field in self._fieldnames], chunksize)
 
     def writetop(self):
         self._writer.writetop()
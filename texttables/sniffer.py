@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright © 2017 Taylor C. Richberger <taywee@gmx.com>
+# This code is released under the license described in the LICENSE file
+
+from __future__ import division, absolute_import, print_function, unicode_literals
+from collections import Counter, OrderedDict
+from itertools import islice
+import threading
+import six
+
+from texttables.dialect import Dialect
+from texttables.errors import ValidationError
+
+# The attributes of a Dialect that a sniff decides, in the order they are
+# cached in
+_ATTRIBUTES = (
+    'header_delimiter',
+    'row_delimiter',
+    'cell_delimiter',
+    'left_border',
+    'right_border',
+    'top_border',
+    'bottom_border',
+    'corner_border',
+    'lineterminator',
+    )
+
+def _corner(line):
+    '''Guess which character of a two-character line is its corner.  The
+    corner never repeats, as every cell is at least one character wide, while
+    the fill usually does.  Returns None if the line can't be a delimiter
+    line.'''
+    characters = set(line)
+    if len(characters) != 2:
+        return None
+    candidates = [character for character in characters if character * 2 not in line]
+    if len(candidates) == 1:
+        return candidates[0]
+    if not candidates:
+        return None
+    # Every cell is a single character wide, so prefer the conventional
+    # corner, and then whichever sits at both ends of the line
+    if '+' in candidates:
+        return '+'
+    if line[0] == line[-1]:
+        return line[0]
+    return None
+
+class Sniffer(object):
+
+    """Dialect and width deducer, similar to :class:`csv.Sniffer`.  This reads
+    the first few lines of a table, finds its delimiter lines (the top and
+    bottom borders, the header delimiter, and the row delimiters), and takes
+    the positions of the corners in them as the column widths.  The borders
+    and cell delimiter are then read from the rows at those positions.
+
+    The table must have at least one delimiter line in the lines read, as the
+    widths of a table with none can't be told apart from spaces in its cells.
+    If the bottom of the table is not within the lines read, the bottom border
+    is assumed to be the same as the top border.
+
+    Results are cached by the lines read, shared by every sniffer,
+    so sniffing tables that begin the same way only does the deduction once.
+    """
+
+    #: The most sniff results kept in the cache
+    cachesize = 256
+
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, lines=20):
+        """
+        :param lines: The most lines of a table to read
+        """
+        self.lines = lines
+
+    def sniff(self, sample):
+        '''Deduce the dialect and widths of a table.  Returns a
+        ``(dialect, widths)`` tuple, where the dialect is a new
+        :class:`texttables.Dialect` and the widths are a tuple of integers,
+        ready to be passed to :class:`texttables.fixed.reader`.
+
+        Lines are consumed from an iterator, so to read a stream that can't be
+        rewound, take the lines with :func:`itertools.islice` first, sniff
+        them, and chain them back in front of the stream.
+
+        :param sample: Either a string holding the start of a table, or an
+            iterable of lines.  At most :attr:`lines` lines are read from it.
+        :raises texttables.ValidationError: if no delimiter line is found
+        '''
+        if isinstance(sample, six.string_types):
+            sample = sample.splitlines(True)
+        prefix = tuple(islice(sample, self.lines))
+        # A prefix shorter than the limit holds the whole table
+        exhausted = len(prefix) < self.lines
+
+        key = (exhausted, prefix)
+        with self._lock:
+            cached = self._cache.pop(key, None)
+            if cached is not None:
+                self._cache[key] = cached
+        if cached is None:
+            cached = self._deduce(prefix, exhausted)
+            with self._lock:
+                self._cache[key] = cached
+                while len(self._cache) > self.cachesize:
+                    self._cache.popitem(last=False)
+
+        values, widths = cached
+        dialect = Dialect()
+        for attribute, value in zip(_ATTRIBUTES, values):
+            setattr(dialect, attribute, value)
+        return dialect, widths
+
+    @classmethod
+    def clear(cls):
+        '''Empty the cache shared by all sniffers.'''
+        with cls._lock:
+            cls._cache.clear()
+
+    def _deduce(self, prefix, exhausted):
+        '''Deduce the dialect attributes and widths from the lines, returning
+        them as a tuple of the attributes in :data:`_ATTRIBUTES` order and a
+        tuple of widths.'''
+        lineterminator = '\n'
+        if prefix:
+            first = prefix[0]
+            lineterminator = first[len(first.rstrip('\r\n')):] or '\n'
+        lines = [line.rstrip('\r\n') for line in prefix]
+
+        corners = Counter(corner for corner in map(_corner, lines) if corner is not None)
+        if corners:
+            corner = corners.most_common(1)[0][0]
+        else:
+            # Single-column tables without side borders have no corners
+            corner = None
+
+        # Find the delimiter lines, all of which have the same length and the
+        # same corner positions as the first
+        reference = None
+        fills = dict()
+        for index, line in enumerate(lines):
+            characters = set(line)
+            if corner is None:
+                if len(characters) != 1:
+                    continue
+            elif corner not in characters or len(characters) != 2:
+                continue
+            if reference is None:
+                reference = line
+                positions = [position for position, character in enumerate(line) if character == corner]
+            elif len(line) != len(reference) or any(line[position] != corner for position in positions):
+                continue
+            fills[index] = (characters - {corner}).pop()
+
+        if reference is None:
+            raise ValidationError('No delimiter line was found to take the widths of the table from')
+
+        leftborder = bool(positions) and positions[0] == 0
+        rightborder = bool(positions) and positions[-1] == len(reference) - 1 and len(reference) > 1
+        bounds = list(positions)
+        if not leftborder:
+            bounds.insert(0, -1)
+        if not rightborder:
+            bounds.append(len(reference))
+        widths = tuple(end - start - 1 for start, end in zip(bounds, bounds[1:]))
+        interior = bounds[1:-1]
+
+        rows = [index for index, line in enumerate(lines) if index not in fills and line]
+
+        left_border = right_border = None
+        cell_delimiter = Dialect.cell_delimiter
+        if rows:
+            row = lines[rows[0]]
+            if leftborder:
+                left_border = row[:1]
+            if rightborder:
+                right_border = row[-1:]
+            if interior and len(row) > interior[0]:
+                cell_delimiter = row[interior[0]]
+        else:
+            if leftborder:
+                left_border = '|'
+            if rightborder:
+                right_border = '|'
+            if interior:
+                cell_delimiter = '|'
+
+        top_border = header_delimiter = row_delimiter = bottom_border = None
+        last = len(lines) - 1
+        if exhausted and last in fills and (not rows or last > rows[0]):
+            bottom_border = fills.pop(last)
+        if 0 in fills:
+            top_border = fills[0]
+        if rows:
+            after = rows[0] + 1
+            if after in fills:
+                header_delimiter = fills[after]
+            for index in sorted(fills):
+                if index > after and index - 1 in rows and index + 1 in rows:
+                    row_delimiter = fills[index]
+                    break
+        if not exhausted:
+            bottom_border = top_border
+
+        values = (
+            header_delimiter,
+            row_delimiter,
+            cell_delimiter,
+            left_border,
+            right_border,
+            top_border,
+            bottom_border,
+            corner if corner is not None else Dialect.corner_border,
+            lineterminator,
+            )
+        return values, widths